@@ -0,0 +1,460 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Library interface to analyse documents in-process.
+
+This is the same logic used by the command line tool, but results are returned as
+objects rather than printed or logged, so that it can be embedded in other services.
+"""
+
+import collections
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import os
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from .lib import (
+    archives,
+    block_cache,
+    buffers,
+    debug_log,
+    http_range,
+    mail,
+    memory,
+    prefetch,
+    tracing,
+    workers,
+    xattrs,
+)
+from .lib.pdf_document import Document
+from .lib.renamer import (
+    NameComponents,
+    RenamerCall,
+    RenamerFailure,
+    RenamerMatch,
+    has_text_layer,
+    match_all_renamers,
+    renamers_fingerprint,
+)
+from .lib.utils import apply_pdfminer_log_filters
+from .renamers import load_all_renamers
+
+
+@dataclasses.dataclass(frozen=True)
+class NamedSource:
+    """PDF content in memory, with the name to report it as."""
+
+    name: str
+    data: buffers.ReadableBuffer
+
+
+# Sources can be files on disk, HTTP(S) URLs as strings, or PDF content in memory.
+Source = Path | str | NamedSource | buffers.ReadableBuffer
+
+
+def archive_sources(archive: Path) -> Iterator[NamedSource]:
+    """Yield the PDF files within a zip or tar archive, without extracting them."""
+    for member_name, data in archives.iter_pdf_members(archive):
+        yield NamedSource(f"{archive}::{member_name}", data)
+
+
+def mailbox_sources(path: Path) -> Iterator[NamedSource]:
+    """Yield the PDF attachments of messages in a Maildir folder or mbox file."""
+    for attachment_name, data in mail.iter_pdf_attachments(path):
+        yield NamedSource(f"{path}::{attachment_name}", data)
+
+
+@dataclasses.dataclass(frozen=True)
+class AnalysisResult:
+    """The outcome of analysing a single document."""
+
+    source: str
+    path: Path | None
+    # Renamers stop being tried once two of them matched, so at most two are listed.
+    matches: tuple[RenamerMatch, ...] = ()
+    renamer_failures: tuple[RenamerFailure, ...] = ()
+    error: str | None = None
+    timings: Mapping[str, float] = dataclasses.field(default_factory=dict)
+    io_stats: Mapping[str, int] | None = None
+    cached: bool = False
+    renamer_calls: tuple[RenamerCall, ...] = ()
+    trace_events: tuple[tracing.TraceEvent, ...] = ()
+    # Debug logs of the analysis, only kept if it failed.
+    debug_log: tuple[str, ...] = ()
+    memory_stages: tuple[memory.StageMemory, ...] = ()
+    # The first page shows no text, such as in scans, so no renamer was tried.
+    no_text_layer: bool = False
+
+    @property
+    def match(self) -> RenamerMatch | None:
+        """The matched renamer, only if exactly one renamer matched."""
+        if len(self.matches) == 1:
+            return self.matches[0]
+        return None
+
+    @property
+    def is_ambiguous(self) -> bool:
+        return len(self.matches) > 1
+
+    @property
+    def failed(self) -> bool:
+        """Whether the document could not be analysed, or not unambiguously."""
+        return bool(self.error or self.renamer_failures or self.is_ambiguous)
+
+    @property
+    def name(self) -> NameComponents | None:
+        if match := self.match:
+            return match.name
+        return None
+
+    @property
+    def renamer(self) -> str | None:
+        if match := self.match:
+            return match.renamer
+        return None
+
+
+class ResultCache(Protocol):
+    """Storage for results of previous analyses of files on disk."""
+
+    def get(self, path: Path) -> AnalysisResult | None: ...
+
+    def put(self, path: Path, result: AnalysisResult) -> None: ...
+
+
+class MemoryCache:
+    """Simple in-process cache, invalidated when the file size or mtime change."""
+
+    _results: dict[Path, tuple[tuple[int, int], AnalysisResult]]
+
+    def __init__(self) -> None:
+        self._results = {}
+
+    @staticmethod
+    def _key(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, path: Path) -> AnalysisResult | None:
+        if (entry := self._results.get(path.resolve())) is None:
+            return None
+
+        key, result = entry
+        if key != self._key(path):
+            return None
+
+        return result
+
+    def put(self, path: Path, result: AnalysisResult) -> None:
+        self._results[path.resolve()] = (self._key(path), result)
+
+
+class XattrCache:
+    """Cache results in extended attributes of the files themselves.
+
+    Stamps are ignored if they were produced by a different version of the code, or
+    if the file changed since.
+    """
+
+    def get(self, path: Path) -> AnalysisResult | None:
+        if (stamp := xattrs.read_stamp(path)) is None:
+            return None
+
+        if stamp.fingerprint != renamers_fingerprint():
+            return None
+
+        matches: tuple[RenamerMatch, ...] = ()
+        if stamp.renamer and stamp.components:
+            matches = (
+                RenamerMatch(stamp.renamer, NameComponents.from_json(stamp.components)),
+            )
+
+        return AnalysisResult(source=str(path), path=path, matches=matches, cached=True)
+
+    def put(self, path: Path, result: AnalysisResult) -> None:
+        # Only stamp results that are reproducible.
+        if result.is_ambiguous or result.renamer_failures:
+            return
+
+        xattrs.write_stamp(
+            path,
+            xattrs.Stamp(
+                fingerprint=renamers_fingerprint(),
+                renamer=result.renamer,
+                components=result.name.as_json() if result.name else None,
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class AnalysisOptions:
+    """Options affecting how each document is analysed."""
+
+    use_mmap: bool = False
+    profile_renamers: bool = False
+    # Record Chrome trace events for each stage, returned in the results.
+    trace: bool = False
+    # Capture debug logs for each document, and return them if the analysis failed.
+    debug_on_failure: bool = False
+    # Account for the memory allocated and retained by each stage, with tracemalloc.
+    memory_report: bool = False
+    # Extract the later pages that renamers are likely to request in the background.
+    prefetch: bool = False
+    # Extract the pages renamers look at together in parallel worker processes, to
+    # reduce the latency of single documents. Remote documents are not extracted in
+    # parallel, as that needs their whole content.
+    parallel_pages: bool = False
+
+
+def _source_label(source: Source, index: int) -> str:
+    if isinstance(source, (Path, str)):
+        return str(source)
+    elif isinstance(source, NamedSource):
+        return source.name
+    return f"<bytes #{index}>"
+
+
+def _analyze_document(
+    document: Document, source: str, path: Path | None, options: AnalysisOptions
+) -> AnalysisResult:
+    failures: list[RenamerFailure] = []
+    calls: list[RenamerCall] | None = [] if options.profile_renamers else None
+
+    start_time = time.perf_counter()
+    matches = tuple(
+        match_all_renamers(
+            document, failures=failures, calls=calls, stop_when_ambiguous=True
+        )
+    )
+    renamers_time = time.perf_counter() - start_time
+
+    return AnalysisResult(
+        source=source,
+        path=path,
+        matches=matches,
+        renamer_failures=tuple(failures),
+        timings={"renamers": renamers_time},
+        io_stats=(
+            dataclasses.asdict(io_stats) if (io_stats := document.io_stats) else None
+        ),
+        renamer_calls=tuple(calls or ()),
+        no_text_layer=not has_text_layer(document),
+    )
+
+
+def _open_source(source: Source, use_mmap: bool) -> BinaryIO:
+    if isinstance(source, str):
+        if not http_range.is_url(source):
+            raise ValueError(f"Unsupported source {source}: only HTTP(S) URLs are.")
+        return http_range.open_url(source)
+    elif isinstance(source, NamedSource):
+        return buffers.open_buffer(source.data)
+    elif not isinstance(source, Path):
+        return buffers.open_buffer(source)
+    elif use_mmap:
+        return buffers.map_file(source)
+    else:
+        return block_cache.open_cached(source.open("rb", buffering=0))
+
+
+@functools.cache
+def _shared_prefetcher() -> prefetch.Prefetcher:
+    """The prefetcher of this process, so that its budget covers the whole batch."""
+    return prefetch.Prefetcher()
+
+
+@functools.cache
+def _shared_page_executor() -> concurrent.futures.Executor | None:
+    """The worker processes extracting pages for the documents of this process.
+
+    With a single CPU, extracting pages in other processes only adds overhead.
+    """
+    if (os.cpu_count() or 1) < 2:
+        return None
+    return workers.ProcessPool(initializer=apply_pdfminer_log_filters)
+
+
+def _analyze_source(
+    source: Source, label: str, options: AnalysisOptions
+) -> AnalysisResult:
+    path = source if isinstance(source, Path) else None
+    start_time = time.perf_counter()
+
+    try:
+        with tracing.span("open", "document"):
+            pdf_file = _open_source(source, options.use_mmap)
+    except (ValueError, OSError) as e:
+        # Empty files cannot be mapped into memory, and remote files might not be
+        # accessible.
+        return AnalysisResult(
+            source=label,
+            path=path,
+            error=f"Unable to open {label}: {e}",
+            timings={"total": time.perf_counter() - start_time},
+        )
+
+    with pdf_file:
+        try:
+            document = Document(
+                Path(label),
+                pdf_file=pdf_file,
+                prefetcher=_shared_prefetcher() if options.prefetch else None,
+                # Workers need the whole content of the document, rather than only
+                # the ranges read of remote documents.
+                page_executor=(
+                    _shared_page_executor()
+                    if options.parallel_pages and not isinstance(source, str)
+                    else None
+                ),
+            )
+        except ValueError as e:
+            return AnalysisResult(
+                source=label,
+                path=path,
+                error=str(e),
+                timings={"total": time.perf_counter() - start_time},
+            )
+        except OSError as e:
+            # Remote files are only read once parsed, and might fail to be then.
+            return AnalysisResult(
+                source=label,
+                path=path,
+                error=f"Unable to read {label}: {e}",
+                timings={"total": time.perf_counter() - start_time},
+            )
+        open_time = time.perf_counter() - start_time
+        memory.checkpoint("open")
+
+        with document:
+            result = _analyze_document(document, label, path, options)
+            memory.checkpoint("renamers")
+
+    memory.checkpoint("close")
+
+    return dataclasses.replace(
+        result,
+        timings={
+            "open": open_time,
+            **result.timings,
+            "total": time.perf_counter() - start_time,
+        },
+    )
+
+
+def _run_analysis(
+    source: Source, label: str, options: AnalysisOptions
+) -> AnalysisResult:
+    with contextlib.ExitStack() as stack:
+        recorder = stack.enter_context(tracing.recording()) if options.trace else None
+        ring_buffer = (
+            stack.enter_context(debug_log.capture())
+            if options.debug_on_failure
+            else None
+        )
+        tracker = (
+            stack.enter_context(memory.tracking()) if options.memory_report else None
+        )
+
+        with tracing.span("analyze", "document", source=label):
+            result = _analyze_source(source, label, options)
+
+    if recorder:
+        result = dataclasses.replace(result, trace_events=tuple(recorder.events))
+    if ring_buffer and result.failed:
+        result = dataclasses.replace(result, debug_log=ring_buffer.format_records())
+    if tracker:
+        result = dataclasses.replace(result, memory_stages=tuple(tracker.stages))
+
+    return result
+
+
+def _initialize_worker() -> None:
+    apply_pdfminer_log_filters()
+    load_all_renamers()
+
+
+def analyze(
+    source: Source, *, options: AnalysisOptions = AnalysisOptions()
+) -> AnalysisResult:
+    """Analyse a single document, provided either as a path or as its content."""
+    load_all_renamers()
+    return _run_analysis(source, _source_label(source, 0), options)
+
+
+def analyze_many(
+    sources: Iterable[Source],
+    *,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    options: AnalysisOptions = AnalysisOptions(),
+) -> Iterator[AnalysisResult]:
+    """Analyse documents, yielding results in the same order as the sources.
+
+    With `jobs` greater than one, documents are analysed in a pool of worker
+    processes, while results are still yielded in order as they become available.
+
+    With `options.use_mmap`, files are mapped into memory rather than read through
+    buffered I/O. In-memory sources are never copied.
+
+    With `jobs` greater than one, `options.parallel_pages` is ignored, as the worker
+    processes already keep the CPUs busy.
+
+    With `options.trace`, each result carries the trace events recorded while
+    analysing it, in whichever process that happened.
+    """
+    load_all_renamers()
+
+    labelled_sources = (
+        (source, _source_label(source, index)) for index, source in enumerate(sources)
+    )
+
+    def _cached(source: Source) -> AnalysisResult | None:
+        if cache is not None and isinstance(source, Path):
+            return cache.get(source)
+        return None
+
+    def _store(result: AnalysisResult) -> None:
+        if cache is not None and result.path is not None and result.error is None:
+            cache.put(result.path, result)
+
+    if jobs <= 1:
+        for source, label in labelled_sources:
+            if (result := _cached(source)) is None:
+                result = _run_analysis(source, label, options)
+                _store(result)
+            yield result
+        return
+
+    options = dataclasses.replace(options, parallel_pages=False)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_initialize_worker
+    ) as executor:
+        # Keep a bounded number of documents in flight, so that the sources can be
+        # a lazy iterable, and results are yielded in order.
+        pending: collections.deque[
+            AnalysisResult | concurrent.futures.Future[AnalysisResult]
+        ] = collections.deque()
+
+        def _drain(limit: int) -> Iterator[AnalysisResult]:
+            while len(pending) > limit:
+                entry = pending.popleft()
+                if isinstance(entry, AnalysisResult):
+                    yield entry
+                else:
+                    result = entry.result()
+                    _store(result)
+                    yield result
+
+        for source, label in labelled_sources:
+            if (cached_result := _cached(source)) is not None:
+                pending.append(cached_result)
+            else:
+                pending.append(executor.submit(_run_analysis, source, label, options))
+            yield from _drain(jobs * 2)
+
+        yield from _drain(0)
@@ -0,0 +1,4 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Benchmarks over a synthetic corpus of documents, run with `python -m pdfrename.bench`."""
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+import click
+
+from ..lib.utils import apply_pdfminer_log_filters
+from . import baseline, corpus, runner
+
+
+@click.command()
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=5,
+    help="Number of timed runs over the corpus.",
+)
+@click.option(
+    "--noise",
+    type=click.IntRange(min=0),
+    default=8,
+    help="Number of noise documents, matching no renamer, in the corpus.",
+)
+@click.option(
+    "--large-pages",
+    type=click.IntRange(min=1),
+    default=60,
+    help="Number of pages of the large noise document.",
+)
+@click.option(
+    "--cli/--no-cli",
+    default=True,
+    help="Whether to also time the command line tool end-to-end.",
+)
+@click.option(
+    "--json",
+    "json_output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write the results as JSON to this file.",
+)
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Compare against a baseline written by --json, and fail on regressions.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    show_default=True,
+    help="Relative slowdown (or memory increase) considered a regression.",
+)
+@click.option(
+    "--write-corpus",
+    "corpus_directory",
+    type=click.Path(exists=True, file_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write the corpus to this directory, and exit.",
+)
+def main(
+    *,
+    repeat: int,
+    noise: int,
+    large_pages: int,
+    cli: bool,
+    json_output: Path | None,
+    baseline_path: Path | None,
+    threshold: float,
+    corpus_directory: Path | None,
+) -> None:
+    apply_pdfminer_log_filters()
+    # Renamers failing are reported as mismatches, rather than logged.
+    logging.disable(logging.ERROR)
+
+    documents = list(corpus.iter_corpus(noise=noise, large_pages=large_pages))
+
+    if corpus_directory:
+        corpus.write_corpus(corpus_directory, documents)
+        return
+
+    results = runner.run_benchmarks(documents, repeat=repeat, cli=cli)
+
+    click.echo(results.format_table())
+    for mismatch in results.mismatches:
+        click.echo(f"MISMATCH {mismatch}", err=True)
+
+    if json_output:
+        json_output.write_text(json.dumps(results.as_json(), indent=2))
+
+    if results.mismatches:
+        sys.exit(1)
+
+    if baseline_path:
+        baseline_results = json.loads(baseline_path.read_text())
+        for dependency, (old, new) in baseline.changed_versions(
+            results, baseline_results
+        ).items():
+            click.echo(f"{dependency} changed from {old} to {new}.")
+
+        try:
+            comparisons = baseline.compare(results, baseline_results)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+
+        click.echo()
+        click.echo(baseline.format_comparisons(comparisons, threshold))
+
+        if regressions := [
+            comparison.metric
+            for comparison in comparisons
+            if comparison.is_regression(threshold)
+        ]:
+            click.echo(f"Regressions in: {', '.join(regressions)}", err=True)
+            sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
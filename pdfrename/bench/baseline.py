@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Compare benchmark results against a stored baseline, to catch regressions.
+
+Baselines are the JSON output of the benchmarks on the same corpus. They also record
+the versions of pdfminer.six and dateparser, so that the cost of upgrading them can
+be measured before rolling it out.
+"""
+
+import dataclasses
+from collections.abc import Mapping, Sequence
+from typing import Any, Final
+
+from .runner import BenchmarkResults
+
+PEAK_MEMORY: Final[str] = "peak_memory"
+ALLOCATIONS: Final[str] = "allocations"
+
+SECONDS: Final[str] = "seconds"
+BYTES: Final[str] = "bytes"
+BLOCKS: Final[str] = "blocks"
+
+# The allocation metrics recorded for each stage, their unit, and the suffix of the
+# metric they are compared as.
+_ALLOCATION_METRICS: Final[Sequence[tuple[str, str, str]]] = (
+    ("peak_bytes", BYTES, "peak"),
+    ("retained_bytes", BYTES, "retained"),
+    ("retained_blocks", BLOCKS, "blocks"),
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Comparison:
+    metric: str
+    baseline: float
+    current: float
+    unit: str = SECONDS
+
+    @property
+    def ratio(self) -> float:
+        # Stages can release more than they allocate, and retain less than nothing.
+        if self.baseline <= 0:
+            return 1.0
+        return self.current / self.baseline
+
+    def format_value(self, value: float) -> str:
+        if self.unit == BYTES:
+            return f"{value / 1024:.0f} KiB"
+        elif self.unit == BLOCKS:
+            return f"{value:.0f}"
+        return f"{value * 1000:.1f} ms"
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def compare(results: BenchmarkResults, baseline: Mapping[str, Any]) -> list[Comparison]:
+    """Compare each stage median, and the memory metrics, present in both results."""
+    if baseline.get("documents") != results.documents:
+        raise ValueError(
+            f"Baseline was recorded on a different corpus ({baseline.get('documents')}"
+            f" documents rather than {results.documents})."
+        )
+
+    comparisons = [
+        Comparison(stage, stage_baseline["median_seconds"], results.median(stage))
+        for stage, stage_baseline in baseline.get("stages", {}).items()
+        if stage in results.stages
+    ]
+
+    if PEAK_MEMORY in baseline:
+        comparisons.append(
+            Comparison(PEAK_MEMORY, baseline[PEAK_MEMORY], results.peak_memory, BYTES)
+        )
+
+    for stage, stage_baseline in baseline.get(ALLOCATIONS, {}).items():
+        if (allocations := results.allocations.get(stage)) is None:
+            continue
+        for key, unit, suffix in _ALLOCATION_METRICS:
+            if key in stage_baseline:
+                comparisons.append(
+                    Comparison(
+                        f"{stage} {suffix}",
+                        stage_baseline[key],
+                        getattr(allocations, key),
+                        unit,
+                    )
+                )
+
+    return comparisons
+
+
+def changed_versions(
+    results: BenchmarkResults, baseline: Mapping[str, Any]
+) -> dict[str, tuple[str, str]]:
+    """Return the dependencies whose version differs from the baseline."""
+    baseline_versions = baseline.get("versions", {})
+    return {
+        dependency: (baseline_versions[dependency], version)
+        for dependency, version in results.versions.items()
+        if baseline_versions.get(dependency, version) != version
+    }
+
+
+def format_comparisons(comparisons: list[Comparison], threshold: float) -> str:
+    header = f"{'metric':<17} {'baseline':>12} {'current':>12} {'change':>8}"
+    lines = [header, "-" * len(header)]
+    for comparison in comparisons:
+        marker = "  REGRESSION" if comparison.is_regression(threshold) else ""
+        lines.append(
+            f"{comparison.metric:<17} {comparison.format_value(comparison.baseline):>12} "
+            f"{comparison.format_value(comparison.current):>12} "
+            f"{comparison.ratio - 1:>+8.1%}{marker}"
+        )
+    return "\n".join(lines)
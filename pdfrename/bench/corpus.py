@@ -0,0 +1,347 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Synthetic documents exercising the renamers, generated without any network access.
+
+Each template reproduces the boxes and metadata a renamer looks for, with made-up
+content. Noise documents match no renamer, and large statements stress the cost of
+documents with many pages.
+"""
+
+import dataclasses
+import random
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Final
+
+from .pdfwriter import Page, stacked_boxes, write_pdf
+
+
+@dataclasses.dataclass(frozen=True)
+class CorpusDocument:
+    name: str
+    data: bytes
+    # The renamer expected to match, or None for documents that should not match.
+    expected_renamer: str | None
+
+
+_TEMPLATES: Final[list[Callable[[], CorpusDocument]]] = []
+
+
+def _template(func: Callable[[], CorpusDocument]) -> Callable[[], CorpusDocument]:
+    _TEMPLATES.append(func)
+    return func
+
+
+_WORDS: Final[Sequence[str]] = (
+    "account balance payment amount total period reference customer service "
+    "energy water transaction interest charges summary details direct debit "
+    "please contact online statement credit opening closing number date"
+).split()
+
+
+def _filler_boxes(rng: random.Random, count: int) -> list[str]:
+    return [
+        "\n".join(
+            " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 8)))
+            for _ in range(rng.randint(1, 3))
+        )
+        for _ in range(count)
+    ]
+
+
+def _transaction_page(rng: random.Random, page: int, pages: int) -> Page:
+    return stacked_boxes(
+        [
+            f"Page {page} of {pages}",
+            *(
+                f"{rng.randint(1, 28):02d}/03/2024 {rng.choice(_WORDS).title()} "
+                f"{rng.randint(1, 99999) / 100:.2f}"
+                for _ in range(20)
+            ),
+        ]
+    )
+
+
+@_template
+def xero_invoice() -> CorpusDocument:
+    return CorpusDocument(
+        "xero-invoice.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "TAX INVOICE",
+                        "Jane Doe\n1 Example Street\nLondon\nN1 1AA",
+                        "Acme Widgets Ltd\n2 Industrial Road\nManchester\nM1 1AA",
+                        "Invoice Date\n5 Mar 2024",
+                        "Invoice Number\nINV-0042",
+                        "VAT Number\nGB 123 4567 89",
+                        "Description\nWidgets\nTotal GBP 120.00",
+                    ]
+                )
+            ],
+            info={"Producer": "Aspose.Pdf for .NET 6.6"},
+        ),
+        "xero.invoice",
+    )
+
+
+@_template
+def hetzner_invoice() -> CorpusDocument:
+    return CorpusDocument(
+        "hetzner-invoice.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Hetzner Online GmbH • Industriestr. 25 • 91710 Gunzenhausen",
+                        "Jane Doe\n1 Example Street\nLondon",
+                        "Invoice R0012345678",
+                        "Invoice date: 05/03/2024",
+                        "Dedicated server\nEUR 39.00",
+                    ]
+                )
+            ]
+        ),
+        "hetzner.invoice",
+    )
+
+
+@_template
+def aws_invoice() -> CorpusDocument:
+    return CorpusDocument(
+        "aws-invoice.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Amazon Web Services, Inc. Invoice\nEmail or talk to us",
+                        "Invoice Number:\nInvoice Date:\nTotal Amount:",
+                        "123456789\nMarch 2 , 2024\nUSD 12.34",
+                        "Bill to Address:\nATTN: Jane Doe\n1 Example Street\nLondon",
+                    ]
+                )
+            ]
+        ),
+        "aws.invoice",
+    )
+
+
+@_template
+def adp_payslip() -> CorpusDocument:
+    return CorpusDocument(
+        "adp-payslip.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "PRIVATE & CONFIDENTIAL\nJane Doe\n1 Example Street\nLondon",
+                        " Company Name : Acme Widgets Ltd    Employee : 12345\n"
+                        "Pay Date     : 28.03.2024",
+                        "Payments\nSalary 2000.00",
+                    ]
+                )
+            ],
+            info={"Creator": "Form ZF_XADP_M01_PAYSLIP_NEW EN"},
+        ),
+        "adp_payslips.payslip_en",
+    )
+
+
+@_template
+def enel_bill() -> CorpusDocument:
+    return CorpusDocument(
+        "enel-bill.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Enel Energia - Mercato libero dell'energia\n"
+                        "Casella Postale 1100\n85100 Potenza",
+                        "MARIO ROSSI\nVIA ROMA 1\n00100 ROMA",
+                        "Totale da pagare\n€ 84,20",
+                        "Entro il 10/04/2024",
+                        "N. Fattura 0123456789",
+                        "Del 05/03/2024",
+                    ]
+                )
+            ]
+        ),
+        "enel.bill",
+    )
+
+
+@_template
+def natwest_statement() -> CorpusDocument:
+    return CorpusDocument(
+        "natwest-statement.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Statement",
+                        "Period",
+                        "1 February 2024 to 29 February 2024",
+                        "IBAN: GB00 NWBK 0000 0000 0000 00",
+                        "JANE DOE\nSELECT ACCOUNT",
+                        "Branch Details\nLondon",
+                        "www.natwest.com",
+                    ]
+                )
+            ]
+        ),
+        "natwest.statement",
+    )
+
+
+@_template
+def santander_credit_card_statement() -> CorpusDocument:
+    return CorpusDocument(
+        "santander-credit-card.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Santander Credit Card ",
+                        "MRS JANE DOE\n1 EXAMPLE STREET\nLONDON",
+                        "Account summary as at: 5th March 2024 for card number ending 1234",
+                        "Balance\n120.00",
+                    ]
+                )
+            ]
+        ),
+        "santander.credit_card_statement",
+    )
+
+
+@_template
+def santander_current_account_statement() -> CorpusDocument:
+    # A long statement, where the account holder is only found on the second page.
+    rng = random.Random(1)
+    pages = 40
+    return CorpusDocument(
+        "santander-current-account.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Select Current Account",
+                        "MRS JANE DOE\n1 EXAMPLE STREET\nLONDON",
+                        "Your account summary for  \n1st Feb 2024 to 29th Feb 2024",
+                        "Balance brought forward\n1,234.56",
+                    ]
+                ),
+                stacked_boxes(
+                    [
+                        "Account name: MRS JANE DOE\n"
+                        "Account number: 12345678 (Sort Code 09 01 28)\n"
+                        "Statement number: 02/2024",
+                        *_filler_boxes(rng, 10),
+                    ]
+                ),
+                *(_transaction_page(rng, page, pages) for page in range(3, pages + 1)),
+            ]
+        ),
+        "santander.current_account_statement",
+    )
+
+
+@_template
+def thameswater_bill() -> CorpusDocument:
+    return CorpusDocument(
+        "thameswater-bill.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Jane Doe\n1 Example Street\nLondon",
+                        "Your latest bill",
+                        "Bill date\n5 March 2024",
+                        "Amount due\n£123.45",
+                        "Manage your account online\nthameswater.co.uk/myaccount",
+                        "Registered office: Clearwater Court, Reading",
+                    ]
+                )
+            ]
+        ),
+        "thameswater.bill_2022",
+    )
+
+
+@_template
+def thameswater_letter() -> CorpusDocument:
+    return CorpusDocument(
+        "thameswater-letter.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Jane Doe\n1 Example Street\nLondon",
+                        "Date\n5 March 2024",
+                        "Dear Jane Doe\nWe are writing about your account.",
+                        "Thames Water Utilities Limited, Clearwater Court, Reading",
+                    ]
+                )
+            ]
+        ),
+        "thameswater.letter",
+    )
+
+
+@_template
+def octopus_energy_statement() -> CorpusDocument:
+    return CorpusDocument(
+        "octopus-statement.pdf",
+        write_pdf(
+            [
+                stacked_boxes(
+                    [
+                        "Jane Doe\n1 Example Street\nLondon",
+                        "Your Account Number: A-1234ABCD\n"
+                        "Bill Reference: 123456789 (5th Mar. 2024)",
+                        "Octopus Energy Limited\nUK House, London",
+                    ]
+                )
+            ],
+            info={"Producer": "kraken-tech-statements"},
+        ),
+        "octopus_energy.statement",
+    )
+
+
+def _noise_document(index: int, pages: int) -> CorpusDocument:
+    rng = random.Random(index)
+    return CorpusDocument(
+        f"noise-{index:02d}.pdf",
+        write_pdf(
+            [stacked_boxes(_filler_boxes(rng, 12)) for _ in range(pages)],
+            info={"Producer": "pdfrename benchmarks"},
+        ),
+        None,
+    )
+
+
+def iter_corpus(*, noise: int = 8, large_pages: int = 60) -> Iterator[CorpusDocument]:
+    """Yield the templates, followed by noise documents and a large noise document.
+
+    The corpus is deterministic, so results are comparable across runs.
+    """
+    for template in _TEMPLATES:
+        yield template()
+
+    for index in range(noise):
+        yield _noise_document(index, pages=1 + index % 3)
+
+    yield dataclasses.replace(
+        _noise_document(noise, pages=large_pages), name="noise-large.pdf"
+    )
+
+
+def write_corpus(directory: Path, corpus: Sequence[CorpusDocument]) -> list[Path]:
+    paths = []
+    for document in corpus:
+        path = directory / document.name
+        path.write_bytes(document.data)
+        paths.append(path)
+    return paths
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""A minimal PDF writer, producing text-only documents for the benchmarks.
+
+Only what is needed to lay out text boxes with a standard font is supported. Each
+box is written as its own text object, far enough from the others that pdfminer's
+layout analysis keeps it as a separate text box.
+"""
+
+import dataclasses
+import zlib
+from collections.abc import Mapping, Sequence
+from typing import Final
+
+_PAGE_WIDTH: Final[int] = 595
+_PAGE_HEIGHT: Final[int] = 842
+_FONT_SIZE: Final[int] = 10
+_LINE_HEIGHT: Final[int] = 12
+# Vertical space between boxes, large enough for them not to be merged.
+_BOX_GAP: Final[int] = 20
+_MARGIN: Final[int] = 40
+
+
+@dataclasses.dataclass(frozen=True)
+class TextBox:
+    x: float
+    y: float
+    lines: Sequence[str]
+
+
+Page = Sequence[TextBox]
+
+
+def stacked_boxes(boxes: Sequence[str], *, x: float = _MARGIN) -> list[TextBox]:
+    """Lay out the boxes top to bottom in a single column, in the order provided.
+
+    Each box is a string with one line per newline, the same way pdfminer returns
+    them (the trailing newline is optional).
+    """
+    text_boxes = []
+    y = _PAGE_HEIGHT - _MARGIN
+    for box in boxes:
+        lines = box.removesuffix("\n").split("\n")
+        text_boxes.append(TextBox(x, y, lines))
+        y -= len(lines) * _LINE_HEIGHT + _BOX_GAP
+
+    if y < 0:
+        raise ValueError(f"Too many boxes to fit a page ({len(boxes)})")
+
+    return text_boxes
+
+
+def _literal_string(text: str) -> bytes:
+    encoded = text.encode("cp1252")
+    return (
+        b"("
+        + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+        + b")"
+    )
+
+
+def _content_stream(page: Page) -> bytes:
+    operations = []
+    for box in page:
+        operations.append(
+            b"BT /F1 %d Tf %d TL %.2f %.2f Td"
+            % (_FONT_SIZE, _LINE_HEIGHT, box.x, box.y)
+        )
+        operations.extend(_literal_string(line) + b" Tj T*" for line in box.lines)
+        operations.append(b"ET")
+    return b"\n".join(operations)
+
+
+class _ObjectTable:
+    def __init__(self) -> None:
+        self.objects: list[bytes] = []
+
+    def reserve(self) -> int:
+        self.objects.append(b"")
+        return len(self.objects)
+
+    def add(self, content: bytes) -> int:
+        self.objects.append(content)
+        return len(self.objects)
+
+    def set(self, object_id: int, content: bytes) -> None:
+        self.objects[object_id - 1] = content
+
+
+def write_pdf(
+    pages: Sequence[Page],
+    *,
+    info: Mapping[str, str] | None = None,
+    compress: bool = True,
+) -> bytes:
+    """Write a PDF file with the given pages, and optional document information."""
+    table = _ObjectTable()
+
+    font_id = table.add(
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica"
+        b" /Encoding /WinAnsiEncoding >>"
+    )
+    pages_id = table.reserve()
+
+    page_ids = []
+    for page in pages:
+        content = _content_stream(page)
+        if compress:
+            content = zlib.compress(content)
+            stream_dictionary = b"<< /Length %d /Filter /FlateDecode >>" % len(content)
+        else:
+            stream_dictionary = b"<< /Length %d >>" % len(content)
+        content_id = table.add(
+            stream_dictionary + b"\nstream\n" + content + b"\nendstream"
+        )
+        page_ids.append(
+            table.add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d]"
+                b" /Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                % (pages_id, _PAGE_WIDTH, _PAGE_HEIGHT, font_id, content_id)
+            )
+        )
+
+    table.set(
+        pages_id,
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids)),
+    )
+    catalog_id = table.add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    trailer = b"/Size %d /Root %d 0 R" % (len(table.objects) + 1, catalog_id)
+    if info:
+        info_id = table.add(
+            b"<< "
+            + b" ".join(
+                b"/" + key.encode("ascii") + b" " + _literal_string(value)
+                for key, value in info.items()
+            )
+            + b" >>"
+        )
+        trailer = b"/Size %d /Root %d 0 R /Info %d 0 R" % (
+            len(table.objects) + 1,
+            catalog_id,
+            info_id,
+        )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, content in enumerate(table.objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % object_id + content + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(table.objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< " + trailer + b" >>\nstartxref\n%d\n%%%%EOF\n" % xref_offset
+
+    return bytes(output)
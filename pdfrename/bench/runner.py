@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Time each stage of the analysis over the synthetic corpus.
+
+Stage timings come from the same trace spans recorded by `--trace-json`, so they
+measure exactly the code paths used when renaming real documents.
+
+Allocations are accounted separately for opening the document, prescanning and laying
+out its first page, and running the renamers, by going through the stages one at a
+time, as the analysis otherwise interleaves them.
+"""
+
+import dataclasses
+import importlib.metadata
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Final
+
+from .. import api
+from ..lib import memory
+from ..lib.pdf_document import Document
+from ..lib.renamer import match_all_renamers
+from .corpus import CorpusDocument, write_corpus
+
+# Trace spans to aggregate, and the name of the stage they are reported as.
+_STAGE_SPANS: Final[Mapping[str, str]] = {
+    "validation": "validation",
+    "page 1 prescan": "page_1_prescan",
+    "page 1 layout": "page_1_layout",
+}
+
+VALIDATION: Final[str] = "validation"
+PAGE_1_PRESCAN: Final[str] = "page_1_prescan"
+PAGE_1_LAYOUT: Final[str] = "page_1_layout"
+DISPATCH: Final[str] = "dispatch"
+ANALYSIS: Final[str] = "analysis"
+CLI: Final[str] = "cli"
+
+# The stages whose allocations are accounted for.
+OPEN: Final[str] = "open"
+PRESCAN: Final[str] = "prescan"
+LAYOUT: Final[str] = "layout"
+RENAMERS: Final[str] = "renamers"
+
+# The libraries whose upgrades are most likely to change the performance.
+_DEPENDENCIES: Final[Sequence[str]] = ("pdfminer.six", "dateparser")
+
+
+@dataclasses.dataclass
+class StageAllocations:
+    # The highest memory allocated at once during the stage, for a single document.
+    peak_bytes: int = 0
+    # Memory allocated during the stage, and still allocated at its end, in total.
+    retained_bytes: int = 0
+    retained_blocks: int = 0
+
+    def add(self, stage: memory.StageMemory) -> None:
+        self.peak_bytes = max(self.peak_bytes, stage.peak_bytes)
+        self.retained_bytes += stage.retained_bytes
+        self.retained_blocks += stage.retained_blocks
+
+
+@dataclasses.dataclass
+class BenchmarkResults:
+    documents: int
+    # Seconds spent in each stage over the whole corpus, once per repetition.
+    stages: dict[str, list[float]] = dataclasses.field(default_factory=dict)
+    # Documents that were not renamed as expected.
+    mismatches: list[str] = dataclasses.field(default_factory=list)
+    # The highest memory allocated at once while analysing a single document.
+    peak_memory: int = 0
+    allocations: dict[str, StageAllocations] = dataclasses.field(default_factory=dict)
+    versions: dict[str, str] = dataclasses.field(
+        default_factory=lambda: {
+            dependency: importlib.metadata.version(dependency)
+            for dependency in _DEPENDENCIES
+        }
+    )
+
+    def median(self, stage: str) -> float:
+        return statistics.median(self.stages[stage])
+
+    def files_per_second(self, stage: str) -> float:
+        return self.documents / self.median(stage)
+
+    def as_json(self) -> dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "stages": {
+                stage: {
+                    "median_seconds": self.median(stage),
+                    "files_per_second": self.files_per_second(stage),
+                    "runs": runs,
+                }
+                for stage, runs in self.stages.items()
+            },
+            "mismatches": self.mismatches,
+            "peak_memory": self.peak_memory,
+            "allocations": {
+                stage: dataclasses.asdict(allocations)
+                for stage, allocations in self.allocations.items()
+            },
+            "versions": self.versions,
+        }
+
+    def format_table(self) -> str:
+        header = f"{'stage':<15} {'median ms':>10} {'files/s':>9}"
+        lines = [header, "-" * len(header)]
+        for stage in self.stages:
+            lines.append(
+                f"{stage:<15} {self.median(stage) * 1000:>10.1f} "
+                f"{self.files_per_second(stage):>9.1f}"
+            )
+        lines.append(f"Peak memory per document: {self.peak_memory / 1024:.0f} KiB")
+
+        if self.allocations:
+            header = (
+                f"{'stage':<15} {'peak KiB':>10} {'retained KiB':>13} {'blocks':>9}"
+            )
+            lines.extend(("", header, "-" * len(header)))
+            for stage, allocations in self.allocations.items():
+                lines.append(
+                    f"{stage:<15} {allocations.peak_bytes / 1024:>10.1f} "
+                    f"{allocations.retained_bytes / 1024:>13.1f} "
+                    f"{allocations.retained_blocks:>9}"
+                )
+        return "\n".join(lines)
+
+
+def _check_result(document: CorpusDocument, result: api.AnalysisResult) -> str | None:
+    if result.error:
+        return f"{document.name}: {result.error}"
+    elif result.renamer_failures:
+        failed = ", ".join(failure.renamer for failure in result.renamer_failures)
+        return f"{document.name}: renamers failed: {failed}"
+    elif result.renamer != document.expected_renamer or result.is_ambiguous:
+        matched = ", ".join(match.renamer for match in result.matches) or "none"
+        return (
+            f"{document.name}: expected {document.expected_renamer}, matched {matched}"
+        )
+    return None
+
+
+def _time_analysis(corpus: Sequence[CorpusDocument], results: BenchmarkResults) -> None:
+    totals = dict.fromkeys(
+        (VALIDATION, PAGE_1_PRESCAN, PAGE_1_LAYOUT, DISPATCH, ANALYSIS), 0.0
+    )
+
+    for document in corpus:
+        result = api.analyze(
+            api.NamedSource(document.name, document.data),
+            options=api.AnalysisOptions(trace=True),
+        )
+        for event in result.trace_events:
+            if (stage := _STAGE_SPANS.get(event["name"])) is not None:
+                totals[stage] += event["dur"] / 1_000_000
+        totals[DISPATCH] += result.timings.get("renamers", 0.0)
+        totals[ANALYSIS] += result.timings["total"]
+
+    for stage, seconds in totals.items():
+        results.stages.setdefault(stage, []).append(seconds)
+
+
+def _measure_memory(
+    corpus: Sequence[CorpusDocument], results: BenchmarkResults
+) -> None:
+    tracemalloc.start()
+    try:
+        for document in corpus:
+            tracemalloc.reset_peak()
+            api.analyze(api.NamedSource(document.name, document.data))
+            results.peak_memory = max(
+                results.peak_memory, tracemalloc.get_traced_memory()[1]
+            )
+    finally:
+        tracemalloc.stop()
+
+
+def _measure_stage_allocations(
+    corpus: Sequence[CorpusDocument], results: BenchmarkResults
+) -> None:
+    for stage in (OPEN, PRESCAN, LAYOUT, RENAMERS):
+        results.allocations[stage] = StageAllocations()
+
+    for document in corpus:
+        with memory.tracking() as tracker:
+            with Document.from_bytes(
+                document.data, filename=Path(document.name)
+            ) as pdf_document:
+                memory.checkpoint(OPEN)
+                has_text_layer = pdf_document.page_has_text(1)
+                memory.checkpoint(PRESCAN)
+                if has_text_layer:
+                    pdf_document.get_textboxes(1)
+                memory.checkpoint(LAYOUT)
+                for _ in match_all_renamers(pdf_document, stop_when_ambiguous=True):
+                    pass
+                memory.checkpoint(RENAMERS)
+
+        for stage_memory in tracker.stages:
+            if (allocations := results.allocations.get(stage_memory.stage)) is not None:
+                allocations.add(stage_memory)
+
+
+def _time_cli(paths: Sequence[Path], results: BenchmarkResults) -> None:
+    start_time = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pdfrename.pdfrename", *map(str, paths)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    results.stages.setdefault(CLI, []).append(time.perf_counter() - start_time)
+
+
+def run_benchmarks(
+    corpus: Sequence[CorpusDocument], *, repeat: int = 5, cli: bool = True
+) -> BenchmarkResults:
+    """Analyse the corpus `repeat` times, after an untimed warm-up run.
+
+    The warm-up run also verifies that each document matches the expected renamer.
+    """
+    results = BenchmarkResults(documents=len(corpus))
+
+    for document in corpus:
+        result = api.analyze(api.NamedSource(document.name, document.data))
+        if (mismatch := _check_result(document, result)) is not None:
+            results.mismatches.append(mismatch)
+
+    for _ in range(repeat):
+        _time_analysis(corpus, results)
+
+    # Tracing allocations slows everything down, so it has separate runs.
+    _measure_memory(corpus, results)
+    _measure_stage_allocations(corpus, results)
+
+    if cli:
+        with tempfile.TemporaryDirectory(prefix="pdfrename-bench-") as directory:
+            paths = write_corpus(Path(directory), corpus)
+            for _ in range(repeat):
+                _time_cli(paths, results)
+
+    return results
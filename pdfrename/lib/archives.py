@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Read PDF files from within zip and tar archives, without extracting them."""
+
+import logging
+import shutil
+import tarfile
+import zipfile
+from collections.abc import Iterator, Mapping
+from pathlib import Path, PurePosixPath
+from typing import Final, Literal
+
+_LOGGER = logging.getLogger(__name__)
+
+# Suffixes of tar archives, and the mode to write a renamed copy with.
+_TAR_SUFFIXES: Final[Mapping[str, Literal["w", "w:gz", "w:bz2", "w:xz"]]] = {
+    ".tar.bz2": "w:bz2",
+    ".tar.gz": "w:gz",
+    ".tar.xz": "w:xz",
+    ".tbz2": "w:bz2",
+    ".tgz": "w:gz",
+    ".txz": "w:xz",
+    ".tar": "w",
+}
+_ZIP_SUFFIX: Final[str] = ".zip"
+
+
+def _archive_suffix(path: Path) -> str | None:
+    name = path.name.lower()
+    for suffix in (_ZIP_SUFFIX, *_TAR_SUFFIXES):
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+def is_archive(path: Path) -> bool:
+    return _archive_suffix(path) is not None
+
+
+def _is_pdf_member(name: str) -> bool:
+    return name.lower().endswith(".pdf")
+
+
+def iter_pdf_members(path: Path) -> Iterator[tuple[str, bytes]]:
+    """Yield the name and content of each PDF file in the archive.
+
+    Tar archives are read as a stream, so compressed tarballs are only decompressed
+    once, and only one member is held in memory at a time.
+    """
+    if _archive_suffix(path) == _ZIP_SUFFIX:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_pdf_member(info.filename):
+                    yield info.filename, archive.read(info)
+        return
+
+    with tarfile.open(path, "r|*") as tar_archive:
+        for member in tar_archive:
+            if not member.isfile() or not _is_pdf_member(member.name):
+                continue
+            if (member_file := tar_archive.extractfile(member)) is None:
+                continue
+            with member_file:
+                yield member.name, member_file.read()
+
+
+def renamed_archive_path(path: Path) -> Path:
+    """Return the path of the renamed copy of the archive, next to the original."""
+    suffix = _archive_suffix(path)
+    assert suffix is not None
+    stem = path.name[: -len(suffix)]
+    return path.with_name(f"{stem}.renamed{path.name[-len(suffix):]}")
+
+
+def _renamed_member(name: str, renames: Mapping[str, str]) -> str:
+    if (new_basename := renames.get(name)) is None:
+        return name
+    return str(PurePosixPath(name).with_name(new_basename))
+
+
+def write_renamed_archive(
+    source: Path, destination: Path, renames: Mapping[str, str]
+) -> None:
+    """Copy the archive, renaming the members as requested.
+
+    Members are copied without being extracted to disk. If the new name of a member
+    is already in use in the archive, the member keeps its original name.
+    """
+    suffix = _archive_suffix(source)
+
+    if suffix == _ZIP_SUFFIX:
+        with (
+            zipfile.ZipFile(source) as source_archive,
+            zipfile.ZipFile(destination, "w") as destination_archive,
+        ):
+            used_names = set(source_archive.namelist())
+            for info in source_archive.infolist():
+                new_name = _renamed_member(info.filename, renames)
+                if new_name != info.filename and new_name in used_names:
+                    _LOGGER.warning(
+                        "%s: %s already exists, not renaming %s.",
+                        source,
+                        new_name,
+                        info.filename,
+                    )
+                    new_name = info.filename
+                used_names.add(new_name)
+
+                new_info = zipfile.ZipInfo(new_name, info.date_time)
+                new_info.compress_type = info.compress_type
+                new_info.external_attr = info.external_attr
+                new_info.comment = info.comment
+                with (
+                    source_archive.open(info) as member_file,
+                    destination_archive.open(new_info, "w") as new_member_file,
+                ):
+                    shutil.copyfileobj(member_file, new_member_file)
+        return
+
+    assert suffix is not None
+    with (
+        tarfile.open(source, "r:*") as source_tar,
+        tarfile.open(destination, _TAR_SUFFIXES[suffix]) as destination_tar,
+    ):
+        used_names = set(source_tar.getnames())
+        for member in source_tar:
+            new_member = member
+            if member.isfile():
+                new_name = _renamed_member(member.name, renames)
+                if new_name != member.name and new_name in used_names:
+                    _LOGGER.warning(
+                        "%s: %s already exists, not renaming %s.",
+                        source,
+                        new_name,
+                        member.name,
+                    )
+                elif new_name != member.name:
+                    used_names.add(new_name)
+                    new_member = member.replace(name=new_name, deep=False)
+
+            destination_tar.addfile(
+                new_member,
+                source_tar.extractfile(member) if member.isfile() else None,
+            )
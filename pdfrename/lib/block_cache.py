@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Block-cached random access reader.
+
+pdfminer seeks back and forth through a PDF file, issuing small reads: first at the
+tail of the file (for the xref and trailer), then around each object it resolves.
+On slow storage (network filesystems, or remote objects) each of those becomes a
+round trip. This reader serves them from a small cache of aligned blocks instead,
+reading ahead at the tail of the file and on sequential runs.
+"""
+
+import collections
+import dataclasses
+import io
+from typing import BinaryIO, cast
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_MAX_BLOCKS = 64
+DEFAULT_TAIL_BLOCKS = 2
+DEFAULT_READAHEAD_BLOCKS = 4
+
+
+@dataclasses.dataclass
+class BlockCacheStats:
+    hits: int = 0
+    misses: int = 0
+    raw_reads: int = 0
+    raw_bytes: int = 0
+
+
+class BlockCachedReader(io.BufferedIOBase):
+    """A seekable, read-only file object serving reads from cached blocks."""
+
+    stats: BlockCacheStats
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        *,
+        size: int | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+        tail_blocks: int = DEFAULT_TAIL_BLOCKS,
+        readahead_blocks: int = DEFAULT_READAHEAD_BLOCKS,
+    ) -> None:
+        self._raw = raw
+        if size is None:
+            size = raw.seek(0, io.SEEK_END)
+        self._size = size
+
+        self._block_size = block_size
+        # A single fetch reads either the whole tail, or a block and its readahead,
+        # and all of them need to fit, or the requested block could be evicted.
+        self._max_blocks = max(max_blocks, tail_blocks, readahead_blocks + 1)
+        self._readahead_blocks = readahead_blocks
+        self._blocks: collections.OrderedDict[int, bytes] = collections.OrderedDict()
+        self._last_block = (size - 1) // block_size if size else 0
+        self._first_tail_block = max(0, self._last_block - tail_blocks + 1)
+        self._last_fetched_block: int | None = None
+        self._position = 0
+
+        self.stats = BlockCacheStats()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def _read_raw(self, offset: int, length: int) -> bytes:
+        self._raw.seek(offset)
+        chunks = []
+        while length > 0:
+            # Unbuffered files and sockets can return short reads.
+            if not (chunk := self._raw.read(length)):
+                break
+            chunks.append(chunk)
+            length -= len(chunk)
+
+        data = b"".join(chunks)
+        self.stats.raw_reads += 1
+        self.stats.raw_bytes += len(data)
+        return data
+
+    def _fetch(self, block: int) -> None:
+        if block >= self._first_tail_block:
+            # The xref table and trailer are at the end of the file, and are needed
+            # first, so read the whole tail in one go.
+            first_block, last_block = self._first_tail_block, self._last_block
+        elif self._last_fetched_block is not None and block == (
+            self._last_fetched_block + 1
+        ):
+            first_block = block
+            last_block = min(block + self._readahead_blocks, self._last_block)
+        else:
+            first_block = last_block = block
+
+        # Do not re-read blocks that are already cached at the edges of the range.
+        while first_block < block and first_block in self._blocks:
+            first_block += 1
+        while last_block > block and last_block in self._blocks:
+            last_block -= 1
+
+        data = self._read_raw(
+            first_block * self._block_size,
+            (last_block - first_block + 1) * self._block_size,
+        )
+        for index in range(first_block, last_block + 1):
+            offset = (index - first_block) * self._block_size
+            self._blocks[index] = data[offset : offset + self._block_size]
+            self._blocks.move_to_end(index)
+
+        self._last_fetched_block = last_block
+
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+
+    def _get_block(self, block: int) -> bytes:
+        if block in self._blocks:
+            self.stats.hits += 1
+            self._blocks.move_to_end(block)
+        else:
+            self.stats.misses += 1
+            self._fetch(block)
+
+        return self._blocks[block]
+
+    def read(self, size: int | None = -1) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if size is None or size < 0:
+            end = self._size
+        else:
+            end = min(self._position + size, self._size)
+
+        chunks = []
+        while self._position < end:
+            block, block_offset = divmod(self._position, self._block_size)
+            data = self._get_block(block)[
+                block_offset : block_offset + end - self._position
+            ]
+            if not data:
+                # The file is shorter than it was declared to be.
+                break
+            chunks.append(data)
+            self._position += len(data)
+
+        return b"".join(chunks)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self._blocks.clear()
+        self._raw.close()
+        super().close()
+
+
+def open_cached(raw: BinaryIO, **kwargs: int) -> BinaryIO:
+    """Wrap the raw file object in a block cache, which takes ownership of it."""
+    return cast(BinaryIO, BlockCachedReader(raw, **kwargs))
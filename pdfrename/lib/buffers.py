@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Read-only file objects backed by in-memory buffers.
+
+pdfminer needs a seekable binary file object, and issues a lot of small reads and
+seeks against it. Serving those from a buffer that is already in memory (or mapped
+into memory) avoids both temporary files and a system call for each read.
+"""
+
+import io
+import mmap
+from pathlib import Path
+from typing import BinaryIO, cast
+
+ReadableBuffer = bytes | bytearray | memoryview | mmap.mmap
+
+
+class BufferReader(io.BufferedIOBase):
+    """A seekable, read-only binary file object over an existing buffer.
+
+    Unlike `io.BytesIO`, this never copies the whole buffer, so it can be used over
+    a `bytearray`, a `memoryview` or a `mmap.mmap` as well as over `bytes`.
+
+    The buffer is only closed together with the reader if `owns_buffer` is set,
+    otherwise it remains the caller's to manage.
+    """
+
+    _buffer: ReadableBuffer
+    _view: memoryview
+    _position: int
+    _owns_buffer: bool
+
+    def __init__(self, buffer: ReadableBuffer, *, owns_buffer: bool = False) -> None:
+        self._buffer = buffer
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+        self._owns_buffer = owns_buffer
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def read(self, size: int | None = -1) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(self._position + size, len(self._view))
+
+        data = self._view[self._position : end].tobytes()
+        self._position = max(self._position, end)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self._view.release()
+        if self._owns_buffer and isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        super().close()
+
+
+def open_buffer(buffer: ReadableBuffer) -> BinaryIO:
+    """Return a binary file object reading from the buffer, without copying it."""
+    return cast(BinaryIO, BufferReader(buffer))
+
+
+def map_file(path: Path) -> BinaryIO:
+    """Map the file into memory, and return a reader over the mapping.
+
+    The mapping is released when the reader is closed.
+    """
+    with path.open("rb") as pdf_file:
+        mapping = mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return cast(BinaryIO, BufferReader(mapping, owns_buffer=True))
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Keep the debug logs of a single document in memory, to report them on failure.
+
+This avoids running a whole batch with debug logging enabled just to diagnose the
+one file that could not be renamed. Records are only formatted if they are
+reported, so the cost of capturing them is little more than creating them.
+"""
+
+import collections
+import contextlib
+import logging
+from collections.abc import Iterator
+from typing import Final
+
+_CAPTURED_LOGGER: Final[str] = "pdfrename"
+_DEFAULT_CAPACITY: Final[int] = 200
+_FORMAT: Final[str] = "%(levelname)s %(name)s: %(message)s"
+
+
+class DebugRingBuffer(logging.Handler):
+    """Hold the most recent log records, discarding the oldest ones."""
+
+    records: Final[collections.deque[logging.LogRecord]]
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        super().__init__(logging.DEBUG)
+        self.records = collections.deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(_FORMAT))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def format_records(self) -> tuple[str, ...]:
+        return tuple(self.format(record) for record in self.records)
+
+
+@contextlib.contextmanager
+def capture(capacity: int = _DEFAULT_CAPACITY) -> Iterator[DebugRingBuffer]:
+    """Capture debug logs of the package, without changing what is printed.
+
+    The logger level needs to be lowered for debug records to be created at all, so
+    the handlers that were already configured are raised to the previous level for
+    the duration, to keep their output unchanged.
+    """
+    logger = logging.getLogger(_CAPTURED_LOGGER)
+    previous_level = logger.getEffectiveLevel()
+
+    existing_handlers = [
+        handler
+        for handler in (*logger.handlers, *logging.getLogger().handlers)
+        if handler.level < previous_level
+    ]
+    handler_levels = [handler.level for handler in existing_handlers]
+
+    ring_buffer = DebugRingBuffer(capacity)
+    logger_level = logger.level
+    for handler in existing_handlers:
+        handler.setLevel(previous_level)
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(ring_buffer)
+
+    try:
+        yield ring_buffer
+    finally:
+        logger.removeHandler(ring_buffer)
+        logger.setLevel(logger_level)
+        for handler, level in zip(existing_handlers, handler_levels):
+            handler.setLevel(level)
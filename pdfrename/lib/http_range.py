@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Lazy access to PDF files over HTTP(S), through range requests.
+
+Only the byte ranges pdfminer actually reads are fetched: the tail of the file for
+the xref table and trailer, then the objects needed for the pages being extracted.
+Reads go through the block cache, so each request fetches a whole aligned block,
+and connections are kept alive and reused across files on the same host.
+
+Redirects are followed, and the size of the file is taken from the first ranged
+response when the server refuses HEAD requests, as it happens for presigned URLs.
+"""
+
+import contextlib
+import http.client
+import io
+import logging
+import re
+import threading
+import urllib.parse
+from collections.abc import Iterator
+from typing import BinaryIO, Final, cast
+
+from . import block_cache
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMES: Final[frozenset[str]] = frozenset({"http", "https"})
+_TIMEOUT: Final[float] = 30.0
+_MAX_REDIRECTS: Final[int] = 5
+_REDIRECT_STATUSES: Final[frozenset[int]] = frozenset({301, 302, 303, 307, 308})
+# The complete length of the file, from a partial response's Content-Range.
+_CONTENT_RANGE_SIZE: Final[re.Pattern[str]] = re.compile(r"bytes \d+-\d+/(\d+)")
+
+# Round trips are expensive, so prefer reading slightly more data per request.
+_BLOCK_SIZE: Final[int] = 256 * 1024
+_TAIL_BLOCKS: Final[int] = 1
+
+
+class HTTPRangeError(OSError):
+    pass
+
+
+def is_url(value: str) -> bool:
+    return urllib.parse.urlsplit(value).scheme in _SCHEMES
+
+
+_ConnectionKey = tuple[str, str, int | None]
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections, shared by all files on the same host."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[_ConnectionKey, list[http.client.HTTPConnection]] = {}
+
+    def _connect(self, key: _ConnectionKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=_TIMEOUT)
+        return http.client.HTTPConnection(host, port, timeout=_TIMEOUT)
+
+    @contextlib.contextmanager
+    def connection(self, key: _ConnectionKey) -> Iterator[http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            connection = idle.pop() if idle else self._connect(key)
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+
+        with self._lock:
+            self._idle[key].append(connection)
+
+
+_POOL: Final[_ConnectionPool] = _ConnectionPool()
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """A seekable, read-only file object fetching byte ranges of a remote file."""
+
+    url: Final[str]
+    size: Final[int]
+
+    _location: str
+    _key: _ConnectionKey
+    _target: str
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+        if not is_url(url) or not urllib.parse.urlsplit(url).hostname:
+            raise ValueError(f"Unsupported URL {url}")
+
+        self._set_location(url)
+        self._position = 0
+        # Only used if the server does not support range requests.
+        self._content: bytes | None = None
+
+        self.size = self._fetch_size()
+
+    def _set_location(self, url: str) -> None:
+        split_url = urllib.parse.urlsplit(url)
+        if split_url.scheme not in _SCHEMES or not split_url.hostname:
+            raise HTTPRangeError(f"unsupported redirect to {url}")
+
+        self._location = url
+        self._key = (
+            split_url.scheme,
+            split_url.hostname,
+            split_url.port,
+        )
+        self._target = urllib.parse.urlunsplit(
+            ("", "", split_url.path or "/", split_url.query, "")
+        )
+
+    def _fetch_size(self) -> int:
+        try:
+            response_headers = self._request("HEAD")[1]
+        except HTTPRangeError as e:
+            # Presigned URLs are only valid for GET requests, and refuse HEAD.
+            _LOGGER.debug("%s: HEAD request failed (%s)", self.url, e)
+        else:
+            if (content_length := response_headers.get("Content-Length")) is not None:
+                return int(content_length)
+
+        status, response_headers, body = self._request("GET", {"Range": "bytes=0-0"})
+        if status != http.client.PARTIAL_CONTENT:
+            _LOGGER.warning(
+                "%s: server does not support range requests, downloading in full.",
+                self.url,
+            )
+            self._content = body
+            return len(body)
+
+        content_range = response_headers.get("Content-Range", "")
+        if not (match := _CONTENT_RANGE_SIZE.fullmatch(content_range.strip())):
+            raise HTTPRangeError(f"no file size provided ({content_range!r}).")
+        return int(match.group(1))
+
+    def _send(
+        self, method: str, headers: dict[str, str]
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        # A kept-alive connection might have been closed by the server in the mean
+        # time, so retry once on a fresh connection.
+        for attempt in range(2):
+            try:
+                with _POOL.connection(self._key) as connection:
+                    connection.request(method, self._target, headers=headers)
+                    response = connection.getresponse()
+                    return response, response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                if attempt:
+                    raise
+            except http.client.HTTPException as e:
+                # Truncated or garbled responses are not OSErrors otherwise.
+                raise HTTPRangeError(f"invalid HTTP response: {e!r}") from e
+
+        raise AssertionError("unreachable")
+
+    def _request(
+        self, method: str, headers: dict[str, str] | None = None
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        for _ in range(_MAX_REDIRECTS + 1):
+            response, body = self._send(method, headers or {})
+            if response.status not in _REDIRECT_STATUSES:
+                break
+
+            if (location := response.headers.get("Location")) is None:
+                raise HTTPRangeError(
+                    f"HTTP redirect {response.status} without a location"
+                )
+            # Later range requests go straight to the redirect's target.
+            self._set_location(urllib.parse.urljoin(self._location, location))
+        else:
+            raise HTTPRangeError(f"too many redirects (more than {_MAX_REDIRECTS})")
+
+        if response.status >= 400:
+            raise HTTPRangeError(f"HTTP error {response.status} {response.reason}")
+
+        return response.status, response.headers, body
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self._position
+        if size == 0 or self._position >= self.size:
+            return b""
+
+        if self._content is not None:
+            data = self._content[self._position : self._position + size]
+        else:
+            last_byte = min(self._position + size, self.size) - 1
+            status, _, data = self._request(
+                "GET", {"Range": f"bytes={self._position}-{last_byte}"}
+            )
+            if status != http.client.PARTIAL_CONTENT:
+                _LOGGER.warning(
+                    "%s: server does not support range requests, downloading in full.",
+                    self.url,
+                )
+                self._content = data
+                data = data[self._position : self._position + size]
+
+        self._position += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+def open_url(url: str) -> BinaryIO:
+    """Open a remote PDF file for lazy, cached reading."""
+    raw = HTTPRangeFile(url)
+    return block_cache.open_cached(
+        cast(BinaryIO, raw),
+        size=raw.size,
+        block_size=_BLOCK_SIZE,
+        tail_blocks=_TAIL_BLOCKS,
+    )
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Read PDF attachments directly out of Maildir folders and mbox files."""
+
+import email.message
+import email.parser
+import email.policy
+import logging
+import mailbox
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Final
+
+_LOGGER = logging.getLogger(__name__)
+
+_PDF_CONTENT_TYPE: Final[str] = "application/pdf"
+_MBOX_SUFFIX: Final[str] = ".mbox"
+_MBOX_MAGIC: Final[bytes] = b"From "
+
+
+def is_maildir(path: Path) -> bool:
+    return path.is_dir() and (path / "cur").is_dir() and (path / "new").is_dir()
+
+
+def is_mbox(path: Path) -> bool:
+    if not path.is_file():
+        return False
+
+    if (suffix := path.suffix.lower()) == _MBOX_SUFFIX:
+        return True
+    elif suffix == ".pdf":
+        return False
+
+    with path.open("rb") as mbox_file:
+        return mbox_file.read(len(_MBOX_MAGIC)) == _MBOX_MAGIC
+
+
+def is_mailbox(path: Path) -> bool:
+    return is_maildir(path) or is_mbox(path)
+
+
+def _pdf_attachments(
+    message: email.message.EmailMessage,
+) -> Iterator[tuple[str | None, bytes]]:
+    for part in message.walk():
+        if part.is_multipart() or part.get_content_type() != _PDF_CONTENT_TYPE:
+            continue
+
+        # Only the PDF parts are ever decoded.
+        if not isinstance(payload := part.get_payload(decode=True), bytes):
+            continue
+
+        yield part.get_filename(), payload
+
+
+def iter_pdf_attachments(path: Path) -> Iterator[tuple[str, bytes]]:
+    """Yield a name and the content of each PDF attachment in the mailbox.
+
+    Messages are parsed one at a time. The name is made of the message key and the
+    attachment's file name, so that it is unique within the mailbox.
+    """
+    box: mailbox.Mailbox
+    if is_maildir(path):
+        box = mailbox.Maildir(path, factory=None, create=False)
+    else:
+        box = mailbox.mbox(path, factory=None, create=False)
+
+    parser = email.parser.BytesParser(policy=email.policy.default)
+
+    try:
+        for key in box.iterkeys():
+            message = parser.parsebytes(box.get_bytes(key))
+
+            assert isinstance(message, email.message.EmailMessage)
+            for index, (filename, data) in enumerate(_pdf_attachments(message)):
+                _LOGGER.debug("%s: found PDF attachment %r in %s", path, filename, key)
+                yield f"{key}/{filename or f'attachment-{index}.pdf'}", data
+    finally:
+        box.close()
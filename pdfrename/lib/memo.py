@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Memoize helpers for the duration of a single document's analysis.
+
+Different renamers often derive the same values from the same boxes, such as parsing
+the same date, or building the same table out of two boxes. Helpers decorated with
+`document_memoized` only compute those once per document, as long as they are called
+while the document's memo store is current.
+
+Helpers cheaper than building and hashing their key, such as splitting a string,
+should not be memoized.
+"""
+
+import collections
+import contextlib
+import contextvars
+import functools
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any, Final, ParamSpec, TypeVar
+
+_DEFAULT_MAX_ENTRIES: Final[int] = 1024
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class MemoStore:
+    """Results of memoized helpers, dropping the least recently used ones."""
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: collections.OrderedDict[Hashable, Any] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        try:
+            result = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+
+        result = self._entries[key] = compute()
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_CURRENT_STORE: Final[contextvars.ContextVar[MemoStore | None]] = (
+    contextvars.ContextVar("pdfrename_memo_store", default=None)
+)
+
+
+@contextlib.contextmanager
+def using(store: MemoStore) -> Iterator[MemoStore]:
+    """Make the store current, so memoized helpers use it within the context."""
+    token = _CURRENT_STORE.set(store)
+    try:
+        yield store
+    finally:
+        _CURRENT_STORE.reset(token)
+
+
+def _freeze(value: Any) -> Any:
+    # Language lists are commonly passed to date parsing.
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def document_memoized(func: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Memoize the helper in the current memo store, if any.
+
+    The helper's arguments need to be hashable (lists are converted to tuples), and
+    its results should not be modified by the callers, as they are shared.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        if (store := _CURRENT_STORE.get()) is None:
+            return func(*args, **kwargs)
+
+        key = (
+            func,
+            tuple(_freeze(arg) for arg in args),
+            tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        return store.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
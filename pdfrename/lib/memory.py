@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Account for the memory allocated, and retained, by each stage of the analysis.
+
+Snapshots of the traced allocations are taken at the end of each stage, and compared
+with the previous one. This is slow, and only meant to diagnose memory growth over
+long batches.
+"""
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import gc
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from typing import Any, Final
+
+_TOP_SITES: Final[int] = 5
+
+_IGNORED_TRACES: Final[tuple[tracemalloc.Filter, ...]] = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class StageMemory:
+    stage: str
+    # Bytes still allocated at the end of the stage, that were not at its start.
+    retained_bytes: int
+    # Memory blocks still allocated at the end of the stage, that were not at its start.
+    retained_blocks: int
+    # The highest memory allocated at once during the stage, over its start.
+    peak_bytes: int
+    top_sites: tuple[AllocationSite, ...]
+
+    def as_json(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # pdfminer objects have reference cycles, so collect them first to only count
+    # what is actually retained, rather than waiting for the garbage collector.
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+
+
+class MemoryTracker:
+    """Record the memory retained by each stage, since the previous checkpoint."""
+
+    def __init__(self) -> None:
+        self.stages: list[StageMemory] = []
+        self._first_snapshot = self._snapshot = _snapshot()
+        self._start_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    @staticmethod
+    def _stage(
+        stage: str,
+        since: tracemalloc.Snapshot,
+        snapshot: tracemalloc.Snapshot,
+        peak_bytes: int,
+    ) -> StageMemory:
+        differences = snapshot.compare_to(since, "lineno")
+        return StageMemory(
+            stage=stage,
+            retained_bytes=sum(difference.size_diff for difference in differences),
+            retained_blocks=sum(difference.count_diff for difference in differences),
+            peak_bytes=peak_bytes,
+            top_sites=tuple(
+                AllocationSite(
+                    str(difference.traceback[0]),
+                    difference.size_diff,
+                    difference.count_diff,
+                )
+                for difference in differences[:_TOP_SITES]
+                if difference.size_diff > 0
+            ),
+        )
+
+    def checkpoint(self, stage: str) -> None:
+        peak_bytes = max(tracemalloc.get_traced_memory()[1] - self._start_memory, 0)
+        snapshot = _snapshot()
+        self.stages.append(self._stage(stage, self._snapshot, snapshot, peak_bytes))
+        self._snapshot = snapshot
+        self._start_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def finish(self) -> None:
+        """Record what is retained after the whole analysis, as the "total" stage."""
+        peak_bytes = max((stage.peak_bytes for stage in self.stages), default=0)
+        self.stages.append(
+            self._stage("total", self._first_snapshot, _snapshot(), peak_bytes)
+        )
+
+
+_CURRENT_TRACKER: Final[contextvars.ContextVar[MemoryTracker | None]] = (
+    contextvars.ContextVar("pdfrename_memory_tracker", default=None)
+)
+
+
+@contextlib.contextmanager
+def tracking() -> Iterator[MemoryTracker]:
+    """Trace allocations within the context, starting tracemalloc if needed."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    tracker = MemoryTracker()
+    token = _CURRENT_TRACKER.set(tracker)
+    try:
+        yield tracker
+        tracker.finish()
+    finally:
+        _CURRENT_TRACKER.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+def checkpoint(stage: str) -> None:
+    """Mark the end of a stage, if memory is being tracked."""
+    if (tracker := _CURRENT_TRACKER.get()) is not None:
+        tracker.checkpoint(stage)
+
+
+class MemoryReport:
+    """Aggregate the memory accounting of a batch of documents."""
+
+    def __init__(self) -> None:
+        self._retained: collections.Counter[str] = collections.Counter()
+        self._peak: collections.Counter[str] = collections.Counter()
+        self._sites: collections.defaultdict[str, collections.Counter[str]] = (
+            collections.defaultdict(collections.Counter)
+        )
+        self._documents = 0
+
+    def add(self, stages: Iterable[StageMemory]) -> None:
+        counted = False
+        for stage in stages:
+            counted = True
+            self._retained[stage.stage] += stage.retained_bytes
+            self._peak[stage.stage] = max(self._peak[stage.stage], stage.peak_bytes)
+            for site in stage.top_sites:
+                self._sites[stage.stage][site.location] += site.size
+        self._documents += counted
+
+    def format_table(self) -> str:
+        lines = [f"Memory accounting over {self._documents} documents:"]
+        for stage, retained in self._retained.items():
+            lines.append(
+                f"{stage}: {retained / 1024:+.1f} KiB retained in total, "
+                f"peak {self._peak[stage] / 1024:.1f} KiB"
+            )
+            for location, size in self._sites[stage].most_common(_TOP_SITES):
+                lines.append(f"    {size / 1024:+10.1f} KiB  {location}")
+        return "\n".join(lines)
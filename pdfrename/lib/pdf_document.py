@@ -2,22 +2,38 @@
 #
 # SPDX-License-Identifier: MIT
 
+import concurrent.futures
+import contextlib
+import functools
+import io
 import logging
+import multiprocessing.shared_memory
 import re
-from collections.abc import Callable, Iterator, Mapping, Sequence
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
-from functools import cached_property
 from pathlib import Path
 from typing import Any, BinaryIO, Final
 
+import pdfminer.converter
 import pdfminer.high_level
 import pdfminer.layout
 import pdfminer.pdfdocument
+import pdfminer.pdfinterp
+import pdfminer.pdfpage
 import pdfminer.pdfparser
+import pdfminer.pdftypes
+import pdfminer.psparser
 from more_itertools import only
 
+from . import block_cache, buffers, memo, prefetch, prescan, resources, tracing
+
 _LOGGER = logging.getLogger(__name__)
 
+# How much of the file is copied at a time into memory shared with page workers.
+_SHARED_CHUNK_SIZE = 1024 * 1024
+
 _AUTHOR_METADATA = "Author"
 _CREATOR_METADATA = "Creator"
 _PRODUCER_METADATA = "Producer"
@@ -26,6 +42,10 @@ _TITLE_METADATA = "Title"
 _CREATION_DATE_METADATA = "CreationDate"
 
 
+class PageExtractionError(Exception):
+    """The page already failed to be extracted, as raised from the `__cause__`."""
+
+
 class PageTextBoxes:
     _boxes: Final[Sequence[str]]
 
@@ -77,55 +97,414 @@ class PageTextBoxes:
         return self.find_index_with_match(lambda box: box.startswith(prefix))
 
 
+def _extract_page_in_worker(shared_name: str, size: int, page: int) -> list[str]:
+    shared = multiprocessing.shared_memory.SharedMemory(shared_name)
+    assert shared.buf is not None
+    try:
+        # The view has to be released before the shared memory can be closed.
+        with shared.buf[:size] as data, Document.from_bytes(data) as document:
+            return list(document.get_textboxes(page))
+    finally:
+        shared.close()
+
+
 class Document:
     original_filename: Final[Path]
     _pdf_file: Final[BinaryIO]
-    doc: Final[pdfminer.pdfdocument.PDFDocument]
+    _close_file: Final[bool]
+    _doc: pdfminer.pdfdocument.PDFDocument | None
     _logger: Final[logging.Logger]
     _extracted_pages: Final[dict[int, PageTextBoxes]]
+    _requested_pages: set[int] | None
+    _failed_pages: Final[dict[int, Exception]]
+    _page_texts: Final[dict[int, str | None]]
+    _pages_with_text: Final[dict[int, bool]]
+    _prefetcher: Final[prefetch.Prefetcher | None]
+    _prefetches: Final[
+        dict[int, concurrent.futures.Future[tuple[PageTextBoxes | Exception, float]]]
+    ]
+    page_executor: Final[concurrent.futures.Executor | None]
+    # Serializes access to the file, and to the parsed document, with prefetching.
+    _file_lock: Final[threading.RLock]
+    memo_store: Final[memo.MemoStore]
 
     def __init__(
         self,
         filename: Path,
         *,
         pdf_file: BinaryIO | None = None,
+        close_file: bool = False,
         logger: logging.Logger | None = None,
+        prefetcher: prefetch.Prefetcher | None = None,
+        page_executor: concurrent.futures.Executor | None = None,
     ) -> None:
+        """Open and validate the document. Pages are only extracted when requested.
+
+        If `pdf_file` is not provided, the file is opened by the document itself, and
+        closed together with it. Otherwise it is only closed if `close_file` is set.
+
+        With a `prefetcher`, pages likely to be requested are extracted in the
+        background, see `prefetch()`. With a `page_executor`, pages requested
+        together are extracted in parallel, see `get_pages()`.
+        """
         self.original_filename = filename
         if pdf_file is None:
-            pdf_file = self.original_filename.open("rb")
+            with tracing.span("open", "document"):
+                pdf_file = block_cache.open_cached(
+                    self.original_filename.open("rb", buffering=0)
+                )
+            close_file = True
         self._pdf_file = pdf_file
+        self._close_file = close_file
 
         self._logger = logger or _LOGGER
 
+        self._extracted_pages = {}
+        self._requested_pages = None
+        self._failed_pages = {}
+        self._page_texts = {}
+        self._pages_with_text = {}
+        self._prefetcher = prefetcher
+        self._prefetches = {}
+        self.page_executor = page_executor
+        self._file_lock = threading.RLock()
+        # Helpers memoized while analysing this document, see `memo.using()`.
+        self.memo_store = memo.MemoStore()
+
         try:
-            pdfminer.high_level.extract_pages(self._pdf_file)  # type: ignore
-        except pdfminer.pdfparser.PDFSyntaxError as error:
-            raise ValueError(f"Invalid PDF file {self.original_filename}: {error}")
+            parser = pdfminer.pdfparser.PDFParser(self._pdf_file)
+            try:
+                with tracing.span("validation", "document"):
+                    self._doc = pdfminer.pdfdocument.PDFDocument(parser)
+            except pdfminer.psparser.PSException as error:
+                raise ValueError(f"Invalid PDF file {self.original_filename}: {error}")
+        except BaseException:
+            self.close()
+            raise
 
-        self._parser = pdfminer.pdfparser.PDFParser(self._pdf_file)
-        self.doc = pdfminer.pdfdocument.PDFDocument(self._parser)
+    @classmethod
+    def from_bytes(
+        cls,
+        data: buffers.ReadableBuffer,
+        *,
+        filename: Path = Path("<bytes>"),
+        logger: logging.Logger | None = None,
+    ) -> "Document":
+        """Create a document from its content, already in memory.
 
-        self._extracted_pages = {}
+        The buffer is not copied, so it should not be modified while the document is
+        in use.
+        """
+        return cls(
+            filename, pdf_file=buffers.open_buffer(data), close_file=True, logger=logger
+        )
 
-        # Always extract the first page.
-        self.get_textboxes(1)
+    @classmethod
+    def from_mmap(
+        cls, filename: Path, *, logger: logging.Logger | None = None
+    ) -> "Document":
+        """Create a document from a file, mapping it into memory rather than reading it."""
+        return cls(
+            filename,
+            pdf_file=buffers.map_file(filename),
+            close_file=True,
+            logger=logger,
+        )
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def doc(self) -> pdfminer.pdfdocument.PDFDocument:
+        if self._doc is None:
+            raise ValueError(f"{self.original_filename} is closed.")
+        return self._doc
+
+    @property
+    def io_stats(self) -> block_cache.BlockCacheStats | None:
+        """Block cache counters, if the document is read through a block cache."""
+        if isinstance(self._pdf_file, block_cache.BlockCachedReader):
+            return self._pdf_file.stats
+        return None
 
     def close(self) -> None:
-        self._parser.close()
+        """Release the parsed document structure, and close the file if owned.
+
+        Pages extracted so far remain available, as they only hold their text.
+        """
+        # Pending prefetches are not needed anymore, but a page being extracted needs
+        # to be finished before the file can be closed.
+        for future in self._prefetches.values():
+            if not future.cancel():
+                _, seconds = future.result()
+                assert self._prefetcher is not None
+                self._prefetcher.account(seconds, used=False)
+        self._prefetches.clear()
+
+        # The document holds the parser, the cross-reference tables, and any object
+        # resolved through them.
+        self._doc = None
+        self.memo_store.clear()
+        if self._close_file:
+            self._pdf_file.close()
+
+    @functools.cached_property
+    def page_count(self) -> int | None:
+        """The number of pages declared in the document catalog, if valid."""
+        try:
+            with self._file_lock:
+                pages = pdfminer.pdftypes.resolve1(self.doc.catalog["Pages"])
+                count = pdfminer.pdftypes.resolve1(pages["Count"])
+        except (KeyError, TypeError, pdfminer.psparser.PSException):
+            return None
+
+        if not isinstance(count, int) or count < 1:
+            return None
+        return count
+
+    @contextlib.contextmanager
+    def recording_page_requests(self) -> Iterator[set[int]]:
+        """Record the pages requested within the context, even if already extracted."""
+        requested_pages: set[int] = set()
+        self._requested_pages = requested_pages
+        try:
+            yield requested_pages
+        finally:
+            self._requested_pages = None
 
     def get_textboxes(self, page: int) -> PageTextBoxes:
+        """Return the text boxes of the (1-indexed) page."""
         if page < 1:
             raise IndexError("Document pages are 1-indexed.")
 
+        if self._requested_pages is not None:
+            self._requested_pages.add(page)
+
+        if (failure := self._failed_pages.get(page)) is not None:
+            # Do not repeat the work for every renamer requesting the page. Raising
+            # the same exception again would extend its traceback every time.
+            if isinstance(failure, IndexError):
+                raise IndexError(*failure.args) from failure
+            raise PageExtractionError(
+                f"Page {page} of {self.original_filename} failed to be extracted."
+            ) from failure
+
         if page not in self._extracted_pages:
-            self._logger.debug(
-                f"{self.original_filename}: page {page} is beyond the extracted pages, extracting now."
+            if (prefetched := self._prefetches.pop(page, None)) is not None:
+                self._extracted_pages[page] = self._use_prefetched(page, prefetched)
+            else:
+                self._extracted_pages[page] = self._extract_new_page(page)
+                # Renamers requesting a later page tend to go on to the next one.
+                if page > 1:
+                    self.prefetch((page + 1,))
+        return self._extracted_pages[page]
+
+    def _extract_new_page(self, page: int) -> PageTextBoxes:
+        if self._doc is None:
+            raise ValueError(f"{self.original_filename} is closed.")
+
+        try:
+            with self._file_lock:
+                return self._extract_page(page)
+        except Exception as e:
+            self._failed_pages[page] = e
+            raise
+
+    def get_pages(self, pages: Iterable[int]) -> dict[int, PageTextBoxes]:
+        """Return the text boxes of the (1-indexed) pages the document has.
+
+        With a page executor, the pages that are not extracted yet are laid out in
+        parallel, each by a separate worker process, and merged back. Pages that fail
+        to be extracted are left out, and raise again through `get_textboxes()`.
+        """
+        pages = sorted(set(pages))
+        missing = [
+            page
+            for page in pages
+            if page >= 1
+            and page not in self._extracted_pages
+            and page not in self._failed_pages
+            and page not in self._prefetches
+            and (self.page_count is None or page <= self.page_count)
+        ]
+        if self.page_executor is not None and len(missing) > 1:
+            try:
+                self._extract_in_parallel(self.page_executor, missing)
+            except Exception:
+                # The pages are extracted in this process instead.
+                self._logger.warning(
+                    "%s: unable to extract pages %s in parallel.",
+                    self.original_filename,
+                    missing,
+                    exc_info=True,
+                )
+
+        result = {}
+        for page in pages:
+            try:
+                result[page] = self.get_textboxes(page)
+            except IndexError:
+                continue
+            except Exception:
+                self._logger.debug(
+                    "%s: unable to extract page %s.",
+                    self.original_filename,
+                    page,
+                    exc_info=True,
+                )
+        return result
+
+    def _extract_in_parallel(
+        self, executor: concurrent.futures.Executor, pages: Sequence[int]
+    ) -> None:
+        if self._doc is None:
+            raise ValueError(f"{self.original_filename} is closed.")
+
+        self._logger.debug(
+            "%s: extracting pages %s in parallel.", self.original_filename, pages
+        )
+        with tracing.span(f"pages {pages} parallel layout", "layout", pages=pages):
+            with self._file_lock:
+                position = self._pdf_file.tell()
+                size = self._pdf_file.seek(0, io.SEEK_END)
+                self._pdf_file.seek(position)
+
+            # The content is shared with the workers once, rather than sent along with
+            # each page.
+            shared = multiprocessing.shared_memory.SharedMemory(create=True, size=size)
+            assert shared.buf is not None
+            try:
+                with self._file_lock:
+                    position = self._pdf_file.tell()
+                    self._pdf_file.seek(0)
+                    offset = 0
+                    while chunk := self._pdf_file.read(_SHARED_CHUNK_SIZE):
+                        shared.buf[offset : offset + len(chunk)] = chunk
+                        offset += len(chunk)
+                    self._pdf_file.seek(position)
+
+                self._collect_parallel_pages(executor, shared.name, size, pages)
+            finally:
+                shared.close()
+                shared.unlink()
+
+    def _collect_parallel_pages(
+        self,
+        executor: concurrent.futures.Executor,
+        shared_name: str,
+        size: int,
+        pages: Sequence[int],
+    ) -> None:
+        futures = {}
+        try:
+            for page in pages:
+                futures[page] = executor.submit(
+                    _extract_page_in_worker, shared_name, size, page
+                )
+        except Exception:
+            # Pages not submitted are extracted in this process when requested.
+            self._logger.warning(
+                "%s: unable to submit pages to the workers.",
+                self.original_filename,
+                exc_info=True,
             )
 
-            extract_pages_generator = pdfminer.high_level.extract_pages(
-                self._pdf_file, page_numbers=(page - 1,)  # type: ignore
+        broken_pages = []
+        for page, future in futures.items():
+            try:
+                self._extracted_pages[page] = PageTextBoxes(future.result())
+            except concurrent.futures.BrokenExecutor:
+                broken_pages.append(page)
+            except Exception as e:
+                self._failed_pages[page] = e
+
+        if broken_pages:
+            self._logger.warning(
+                "%s: page workers failed, extracting pages %s in process.",
+                self.original_filename,
+                broken_pages,
+            )
+
+    def prefetch(self, pages: Iterable[int]) -> None:
+        """Extract the pages in the background, if they are likely to be requested.
+
+        This does nothing without a prefetcher, or once its budget is exhausted.
+        Pages that are already extracted, or that the document does not have, are
+        ignored.
+        """
+        if self._prefetcher is None or self._doc is None:
+            return
+
+        for page in pages:
+            if (
+                page < 1
+                or page in self._extracted_pages
+                or page in self._failed_pages
+                or page in self._prefetches
+                or (self.page_count is not None and page > self.page_count)
+            ):
+                continue
+
+            future = self._prefetcher.submit(
+                functools.partial(self._prefetch_page, page)
             )
+            if future is None:
+                return
+            self._prefetches[page] = future
+
+    def _prefetch_page(self, page: int) -> tuple[PageTextBoxes | Exception, float]:
+        start_time = time.perf_counter()
+        result: PageTextBoxes | Exception
+        try:
+            with self._file_lock:
+                if self._doc is None:
+                    raise ValueError(f"{self.original_filename} is closed.")
+                result = self._extract_page(page)
+        except Exception as e:
+            result = e
+
+        return result, time.perf_counter() - start_time
+
+    def _use_prefetched(
+        self,
+        page: int,
+        future: concurrent.futures.Future[tuple[PageTextBoxes | Exception, float]],
+    ) -> PageTextBoxes:
+        result, seconds = future.result()
+        assert self._prefetcher is not None
+        self._prefetcher.account(seconds, used=True)
+        self._logger.debug(
+            "%s: using prefetched page %s.", self.original_filename, page
+        )
+
+        if isinstance(result, Exception):
+            self._failed_pages[page] = result
+            raise result
+        return result
+
+    def _layout_page(self, page: int) -> Iterator[pdfminer.layout.LTPage]:
+        # The same as `extract_pages`, but reusing the parsed document and its
+        # resolved objects, and sharing parsed fonts with other pages and documents.
+        resource_manager = resources.SharedResourceManager()
+        device = pdfminer.converter.PDFPageAggregator(
+            resource_manager, laparams=pdfminer.layout.LAParams()
+        )
+        interpreter = pdfminer.pdfinterp.PDFPageInterpreter(resource_manager, device)
+        try:
+            pdf_page = prescan.get_page(self.doc, page)
+        except IndexError:
+            return
+        interpreter.process_page(pdf_page)
+        yield device.get_result()
+
+    def _extract_page(self, page: int) -> PageTextBoxes:
+        self._logger.debug("%s: extracting page %s.", self.original_filename, page)
+
+        with tracing.span(f"page {page} layout", "layout", page=page):
+            extract_pages_generator = self._layout_page(page)
 
             try:
                 page_content = list(next(extract_pages_generator))
@@ -134,46 +513,133 @@ class Document:
                     f"{self.original_filename} does not have page {page}"
                 ) from e
 
-            if len(page_content) == 1 and isinstance(
-                page_content[0], pdfminer.layout.LTFigure
-            ):
-                self._logger.debug(
-                    f"{self.original_filename} p{page}: figure-based PDF, extracting raw text instead."
-                )
+        if len(page_content) == 1 and isinstance(
+            page_content[0], pdfminer.layout.LTFigure
+        ):
+            self._logger.debug(
+                "%s p%s: figure-based PDF, extracting raw text instead.",
+                self.original_filename,
+                page,
+            )
+            with tracing.span(f"page {page} figure fallback", "layout", page=page):
                 page_text = pdfminer.high_level.extract_text(
                     self._pdf_file, page_numbers=(page - 1,)  # type: ignore
                 )
-                text_boxes = [page_text]
-            else:
-                text_boxes = [
-                    obj.get_text()
-                    for obj in page_content
-                    if isinstance(obj, pdfminer.layout.LTTextBoxHorizontal)
-                ]
+            text_boxes = [page_text]
+        else:
+            text_boxes = [
+                obj.get_text()
+                for obj in page_content
+                if isinstance(obj, pdfminer.layout.LTTextBoxHorizontal)
+            ]
+
+        if not text_boxes:
+            # Only log the types of the layout objects, so that the log record
+            # does not keep them alive.
+            self._logger.debug(
+                "%s p%s: no text boxes found among %s",
+                self.original_filename,
+                page,
+                [type(obj).__name__ for obj in page_content],
+            )
+        else:
+            self._logger.debug("%s p%s: %r", self.original_filename, page, text_boxes)
+
+        return PageTextBoxes(text_boxes)
 
-            if not text_boxes:
+    def _prescan_page(self, page: int) -> str | None:
+        if page not in self._page_texts:
+            if self._doc is None:
+                raise ValueError(f"{self.original_filename} is closed.")
+
+            with (
+                self._file_lock,
+                tracing.span(f"page {page} prescan", "layout", page=page),
+            ):
+                try:
+                    self._page_texts[page] = prescan.page_text(self._doc, page)
+                except IndexError:
+                    self._page_texts[page] = ""
+                except Exception:
+                    self._logger.debug(
+                        "%s p%s: unable to prescan the page.",
+                        self.original_filename,
+                        page,
+                        exc_info=True,
+                    )
+                    self._page_texts[page] = None
+
+        return self._page_texts[page]
+
+    def has_any_marker(self, markers: Iterable[str], pages: Iterable[int]) -> bool:
+        """Whether any of the normalized markers is shown on any of the pages.
+
+        This only decodes the text shown on the pages, without extracting them. Pages
+        that the document does not have are ignored, while pages whose text could not
+        be decoded are assumed to contain the markers.
+        """
+        markers = tuple(markers)
+        for page in pages:
+            if (text := self._prescan_page(page)) is None or any(
+                marker in text for marker in markers
+            ):
+                return True
+
+        return False
+
+    def page_has_text(self, page: int) -> bool:
+        """Whether the (1-indexed) page shows any text, rather than only images.
+
+        Pages without font resources are told apart without interpreting them. Pages
+        that could not be checked are assumed to have text, and pages the document
+        does not have are not.
+        """
+        if page in self._pages_with_text:
+            return self._pages_with_text[page]
+
+        if self._doc is None:
+            raise ValueError(f"{self.original_filename} is closed.")
+
+        with self._file_lock, tracing.span(f"page {page} fonts", "layout", page=page):
+            try:
+                has_fonts = prescan.has_fonts(self._doc, page)
+            except IndexError:
+                has_fonts = False
+            except Exception:
                 self._logger.debug(
-                    f"{self.original_filename} p{page}: no text boxes found: {page_content!r}"
+                    "%s p%s: unable to look up the fonts of the page.",
+                    self.original_filename,
+                    page,
+                    exc_info=True,
                 )
-            else:
-                self._logger.debug(f"{self.original_filename} p{page}: {text_boxes!r}")
+                has_fonts = True
 
-            self._extracted_pages[page] = PageTextBoxes(text_boxes)
+        # Fonts can be declared without being used.
+        has_text = has_fonts and (
+            (text := self._prescan_page(page)) is None
+            or bool(text.strip(prescan.SEGMENT_SEPARATOR))
+        )
+        self._pages_with_text[page] = has_text
+        return has_text
 
-        return self._extracted_pages[page]
+    @property
+    def extracted_pages(self) -> frozenset[int]:
+        """The (1-indexed) pages that have been extracted so far."""
+        return frozenset(self._extracted_pages)
 
     def __getitem__(self, key: Any) -> PageTextBoxes:
         if not isinstance(key, int):
             raise TypeError("Only integer page indexes are supported.")
         return self.get_textboxes(key)
 
-    @cached_property
+    @functools.cached_property
     def _info(self) -> Mapping[str, bytes]:
         doc_info = {}
-        for info in self.doc.info:
-            doc_info.update(info)
+        with self._file_lock, tracing.span("info", "document"):
+            for info in self.doc.info:
+                doc_info.update(info)
 
-        self._logger.debug(f"{self.original_filename}: extracted info {doc_info!r}")
+        self._logger.debug("%s: extracted info %r", self.original_filename, doc_info)
 
         return doc_info
 
@@ -199,27 +665,27 @@ class Document:
 
         return datetime.strptime(date_str, date_format)
 
-    @cached_property
+    @functools.cached_property
     def author(self) -> bytes | None:
         return self._document_metadata(_AUTHOR_METADATA)
 
-    @cached_property
+    @functools.cached_property
     def creator(self) -> bytes | None:
         return self._document_metadata(_CREATOR_METADATA)
 
-    @cached_property
+    @functools.cached_property
     def producer(self) -> bytes | None:
         return self._document_metadata(_PRODUCER_METADATA)
 
-    @cached_property
+    @functools.cached_property
     def subject(self) -> bytes | None:
         return self._document_metadata(_SUBJECT_METADATA)
 
-    @cached_property
+    @functools.cached_property
     def title(self) -> bytes | None:
         return self._document_metadata(_TITLE_METADATA)
 
-    @cached_property
+    @functools.cached_property
     def creation_date(self) -> datetime | None:
         if creation_date := self._document_metadata(_CREATION_DATE_METADATA):
             return self._date_property_to_datetime(creation_date)
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Speculatively extract later pages in the background, within a wasted-work budget.
+
+pdfminer is pure Python, so extracting a page in a background thread holds the GIL
+just as much as the renamers running on the first page do. Prefetching only pays off
+when extraction waits on I/O, such as for remote documents or for files that are not
+in the page cache; otherwise it only reorders the work.
+
+The time spent on prefetched pages that no renamer requested is accounted as wasted,
+and once it exceeds the budget, no more pages are prefetched by the same prefetcher.
+"""
+
+import concurrent.futures
+import contextvars
+import logging
+import threading
+from collections.abc import Callable
+from typing import Final, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+# Wasted work allowed before any prefetched page is used, to let prefetching prove
+# itself useful.
+_DEFAULT_WASTE_ALLOWANCE_SECONDS: Final[float] = 1.0
+# Wasted work allowed for each second of prefetched work that was used.
+_DEFAULT_WASTE_RATIO: Final[float] = 0.5
+
+_T = TypeVar("_T")
+
+
+class Prefetcher:
+    """A single background worker, shared by all the documents of a batch."""
+
+    def __init__(
+        self,
+        *,
+        waste_allowance: float = _DEFAULT_WASTE_ALLOWANCE_SECONDS,
+        waste_ratio: float = _DEFAULT_WASTE_RATIO,
+    ) -> None:
+        self._waste_allowance = waste_allowance
+        self._waste_ratio = waste_ratio
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pdfrename-prefetch"
+        )
+        self._lock = threading.Lock()
+        self.useful_seconds = 0.0
+        self.wasted_seconds = 0.0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether too much of the prefetched work went unused."""
+        return (
+            self.wasted_seconds
+            > self._waste_allowance + self._waste_ratio * self.useful_seconds
+        )
+
+    def submit(self, func: Callable[[], _T]) -> concurrent.futures.Future[_T] | None:
+        """Run the function in the background, unless the budget is exhausted.
+
+        The function runs in a copy of the current context, so that it is traced
+        together with the document it is prefetching for.
+        """
+        if self.exhausted:
+            return None
+
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, func)
+
+    def account(self, seconds: float, *, used: bool) -> None:
+        with self._lock:
+            if used:
+                self.useful_seconds += seconds
+            else:
+                self.wasted_seconds += seconds
+                if self.exhausted:
+                    _LOGGER.debug(
+                        "Prefetch budget exhausted: %.2fs wasted, %.2fs used.",
+                        self.wasted_seconds,
+                        self.useful_seconds,
+                    )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
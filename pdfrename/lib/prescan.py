@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Collect the text shown on a page, without analysing its layout.
+
+The content streams are interpreted as usual, but the strings passed to the text
+showing operators are only decoded through their fonts, rather than positioned and
+grouped into boxes. This is much cheaper than layout analysis, and is enough to tell
+whether a vendor's marker appears on the page at all.
+
+Layout analysis only ever groups characters that are consecutive within the same
+content stream level, so whitespace aside, any text within a single line of a text
+box also appears in the collected text. Characters shown by the page and by each form
+XObject are kept apart for the same reason.
+
+Pages without any font resource cannot show text at all, such as scans without a
+text layer, which can be told without interpreting their content streams.
+"""
+
+import itertools
+from collections.abc import Iterable
+from typing import Any, Final
+
+import pdfminer.pdfdevice
+import pdfminer.pdfdocument
+import pdfminer.pdffont
+import pdfminer.pdfinterp
+import pdfminer.pdfpage
+import pdfminer.pdftypes
+import pdfminer.psparser
+
+from . import resources
+
+# Separates the text of different content stream levels, so that markers cannot match
+# across them.
+SEGMENT_SEPARATOR: Final[str] = "\0"
+
+
+def normalize(text: str) -> str:
+    """Drop all whitespace, as layout analysis adds or removes it between characters."""
+    return "".join(text.split())
+
+
+class _TextCollector(pdfminer.pdfdevice.PDFDevice):
+    def __init__(self, rsrcmgr: pdfminer.pdfinterp.PDFResourceManager) -> None:
+        super().__init__(rsrcmgr)
+        self.segments: list[list[str]] = [[]]
+        self._levels: list[list[str]] = [self.segments[0]]
+
+    def begin_figure(self, name: str, bbox: Any, matrix: Any) -> None:
+        segment: list[str] = []
+        self.segments.append(segment)
+        self._levels.append(segment)
+
+    def end_figure(self, name: str) -> None:
+        self._levels.pop()
+
+    def render_string(
+        self,
+        textstate: pdfminer.pdfinterp.PDFTextState,
+        seq: Iterable[Any],
+        ncs: Any,
+        graphicstate: Any,
+    ) -> None:
+        if (font := textstate.font) is None:
+            return
+
+        segment = self._levels[-1]
+        for obj in seq:
+            if not isinstance(obj, bytes):
+                continue
+            for cid in font.decode(obj):
+                try:
+                    segment.append(font.to_unichr(cid))
+                except pdfminer.pdffont.PDFUnicodeNotDefined:
+                    # The same placeholder used by layout analysis.
+                    segment.append(f"(cid:{cid})")
+
+
+def get_page(
+    doc: pdfminer.pdfdocument.PDFDocument, page: int
+) -> pdfminer.pdfpage.PDFPage:
+    """Return the (1-indexed) page, raising IndexError if the document lacks it."""
+    try:
+        (pdf_page,) = itertools.islice(
+            pdfminer.pdfpage.PDFPage.create_pages(doc), page - 1, page
+        )
+    except ValueError as e:
+        raise IndexError(f"Document does not have page {page}") from e
+    return pdf_page
+
+
+def _has_fonts(resources: Any, visited: set[int]) -> bool:
+    resources = pdfminer.pdftypes.dict_value(resources)
+    if pdfminer.pdftypes.dict_value(resources.get("Font")):
+        return True
+
+    for xobject_ref in pdfminer.pdftypes.dict_value(resources.get("XObject")).values():
+        if isinstance(xobject_ref, pdfminer.pdftypes.PDFObjRef):
+            if xobject_ref.objid in visited:
+                continue
+            visited.add(xobject_ref.objid)
+
+        xobject = pdfminer.pdftypes.resolve1(xobject_ref)
+        if (
+            isinstance(xobject, pdfminer.pdftypes.PDFStream)
+            and xobject.get("Subtype") is pdfminer.psparser.LIT("Form")
+            and _has_fonts(xobject.get("Resources"), visited)
+        ):
+            return True
+
+    return False
+
+
+def has_fonts(doc: pdfminer.pdfdocument.PDFDocument, page: int) -> bool:
+    """Whether the (1-indexed) page, or any form XObject it uses, has font resources.
+
+    Raises IndexError if the document does not have the page.
+    """
+    return _has_fonts(get_page(doc, page).resources, set())
+
+
+def page_text(doc: pdfminer.pdfdocument.PDFDocument, page: int) -> str:
+    """Return the normalized text shown on the (1-indexed) page.
+
+    Raises IndexError if the document does not have the page.
+    """
+    pdf_page = get_page(doc, page)
+
+    rsrcmgr = resources.SharedResourceManager()
+    collector = _TextCollector(rsrcmgr)
+    pdfminer.pdfinterp.PDFPageInterpreter(rsrcmgr, collector).process_page(pdf_page)
+
+    return SEGMENT_SEPARATOR.join(
+        normalize("".join(segment)) for segment in collector.segments
+    )
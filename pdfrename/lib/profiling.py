@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Aggregate per-renamer profiling information across a batch of documents."""
+
+import collections
+import dataclasses
+import statistics
+from collections.abc import Iterable
+from typing import Any
+
+from .renamer import RenamerCall
+
+
+@dataclasses.dataclass
+class RenamerStats:
+    calls: int = 0
+    matches: int = 0
+    exceptions: int = 0
+    durations: list[float] = dataclasses.field(default_factory=list)
+    # How many times each page was extracted because of this renamer.
+    pages: collections.Counter[int] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.durations)
+
+    def percentile(self, percent: int) -> float:
+        if len(self.durations) < 2:
+            return self.durations[0] if self.durations else 0.0
+        return statistics.quantiles(self.durations, n=100, method="inclusive")[
+            percent - 1
+        ]
+
+
+class RenamerProfile:
+    _stats: collections.defaultdict[str, RenamerStats]
+
+    def __init__(self) -> None:
+        self._stats = collections.defaultdict(RenamerStats)
+
+    def add(self, calls: Iterable[RenamerCall]) -> None:
+        for call in calls:
+            stats = self._stats[call.renamer]
+            stats.calls += 1
+            stats.matches += call.matched
+            stats.exceptions += call.failed
+            stats.durations.append(call.seconds)
+            stats.pages.update(call.pages)
+
+    def _sorted_stats(self) -> list[tuple[str, RenamerStats]]:
+        return sorted(
+            self._stats.items(), key=lambda item: item[1].total_seconds, reverse=True
+        )
+
+    def as_json(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "renamer": renamer,
+                "calls": stats.calls,
+                "matches": stats.matches,
+                "exceptions": stats.exceptions,
+                "total_seconds": stats.total_seconds,
+                "p50_seconds": stats.percentile(50),
+                "p90_seconds": stats.percentile(90),
+                "p99_seconds": stats.percentile(99),
+                "pages_extracted": {
+                    str(page): count for page, count in sorted(stats.pages.items())
+                },
+            }
+            for renamer, stats in self._sorted_stats()
+        ]
+
+    def format_table(self) -> str:
+        header = (
+            f"{'renamer':<45} {'calls':>6} {'total ms':>9} {'p50 ms':>7} "
+            f"{'p90 ms':>7} {'p99 ms':>7} {'match':>5} {'exc':>4}  pages"
+        )
+        lines = [header, "-" * len(header)]
+        for renamer, stats in self._sorted_stats():
+            pages = ", ".join(
+                f"p{page}×{count}" for page, count in sorted(stats.pages.items())
+            )
+            lines.append(
+                f"{renamer:<45} {stats.calls:>6} {stats.total_seconds * 1000:>9.1f} "
+                f"{stats.percentile(50) * 1000:>7.2f} "
+                f"{stats.percentile(90) * 1000:>7.2f} "
+                f"{stats.percentile(99) * 1000:>7.2f} "
+                f"{stats.matches:>5} {stats.exceptions:>4}  {pages}"
+            )
+
+        return "\n".join(lines)
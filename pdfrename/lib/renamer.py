@@ -2,14 +2,24 @@
 #
 # SPDX-License-Identifier: MIT
 
+import collections
 import dataclasses
 import datetime
+import enum
+import functools
+import hashlib
+import importlib.metadata
 import logging
+import time
+import traceback
 import typing
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
-from . import pdf_document, utils
+from . import memo, pdf_document, prescan, tracing, utils
+
+_LOGGER = logging.getLogger(__name__)
 
 # This is only implemented for Windows, unfortunately.
 # So fall back to something else if not implemented.
@@ -91,26 +101,520 @@ class NameComponents:
 
         return filename
 
+    def as_json(self) -> dict[str, Any]:
+        """Return the components as a JSON-serializable dictionary."""
+
+        return {
+            "date": self.date.isoformat(),
+            "service_name": self.service_name,
+            "account_holder": (
+                self.account_holder
+                if isinstance(self.account_holder, str)
+                else list(self.account_holder)
+            ),
+            "document_type": self.document_type,
+            "account_number": self.account_number,
+            "document_number": self.document_number,
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "NameComponents":
+        """Rebuild the components from the output of `as_json()`."""
+
+        account_holder = data["account_holder"]
+        return cls(
+            date=datetime.datetime.fromisoformat(data["date"]),
+            service_name=data["service_name"],
+            account_holder=(
+                account_holder
+                if isinstance(account_holder, str)
+                else tuple(account_holder)
+            ),
+            document_type=data["document_type"],
+            account_number=data.get("account_number"),
+            document_number=data.get("document_number"),
+        )
+
 
 Boxes = Sequence[str]
 RenamerV2 = Callable[[pdf_document.Document], NameComponents | None]
+# A quick check of whether a renamer applies to the document, without extracting the
+# name components. Detectors should only return True if the renamer will match.
+Detector = Callable[[pdf_document.Document], bool]
+
+
+class RenamerCost(enum.IntEnum):
+    """How expensive it is for a renamer to reject a document, from cheapest."""
+
+    # Only the document metadata is looked at.
+    METADATA = 0
+    # The text of the first page is looked at, which is always extracted.
+    FIRST_PAGE = 1
+    # Further pages are extracted.
+    LATER_PAGES = 2
+
+
+@dataclasses.dataclass
+class _RegisteredRenamer:
+    # Renamers in a vendor group also take the evidence returned by the group's gate.
+    renamer: Callable[..., NameComponents | None]
+    detect: Detector | None
+    declared_cost: RenamerCost | None
+    # Documents with fewer pages than this are never matched by the renamer.
+    min_pages: int
+    group: "VendorGroup[Any] | None" = None
+    # Normalized text, one of which needs to be shown on one of the marker pages for
+    # the renamer to match. Without markers, the renamer is always called.
+    markers: tuple[str, ...] = ()
+    marker_pages: tuple[int, ...] = (1,)
+    # The cost observed for each call of the renamer (or its detector) in this
+    # process.
+    observed_costs: collections.Counter[RenamerCost] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    @property
+    def cost(self) -> RenamerCost:
+        """The most common observed cost, or the declared one until observed."""
+        if self.observed_costs:
+            return self.observed_costs.most_common(1)[0][0]
+        return self.declared_cost or RenamerCost.FIRST_PAGE
+
+    @property
+    def later_pages(self) -> tuple[int, ...]:
+        """The pages after the first that the renamer is declared to look at."""
+        return tuple(
+            sorted({page for page in (*self.marker_pages, self.min_pages) if page > 1})
+        )
+
+
+_ALL_RENAMERS: list[_RegisteredRenamer] = []
+
+
+@typing.overload
+def pdfrenamer(func: RenamerV2, /) -> RenamerV2: ...
+
+
+@typing.overload
+def pdfrenamer(
+    *,
+    detect: Detector | None = None,
+    cost: RenamerCost | None = None,
+    min_pages: int = 1,
+    markers: Iterable[str] = (),
+    marker_pages: Sequence[int] = (1,),
+) -> Callable[[RenamerV2], RenamerV2]: ...
 
-_ALL_RENAMERS: list[RenamerV2] = []
 
+def pdfrenamer(
+    func: RenamerV2 | None = None,
+    /,
+    *,
+    detect: Detector | None = None,
+    cost: RenamerCost | None = None,
+    min_pages: int = 1,
+    markers: Iterable[str] = (),
+    marker_pages: Sequence[int] = (1,),
+) -> RenamerV2 | Callable[[RenamerV2], RenamerV2]:
+    """Register a renamer, optionally declaring its detector, cost and page count.
+
+    With a detector, the renamer itself is only called to extract the name
+    components once its detector is the only one to apply to the document. The
+    cost then refers to the detector.
+
+    Renamers are tried cheapest first. The declared cost is only used until the
+    actual cost is observed, so declaring it is only useful for renamers that are
+    more expensive than just looking at the first page.
+
+    Markers are text that the renamer requires on one of the marker pages (the first
+    one by default), such as the vendor's name. They need to fit within a single line
+    of a text box, and are compared ignoring whitespace. Renamers whose markers are
+    not shown on the pages are not called, which avoids analysing the layout of pages
+    that no renamer would match.
+    """
+
+    def _register(func: RenamerV2) -> RenamerV2:
+        _ALL_RENAMERS.append(
+            _RegisteredRenamer(
+                func,
+                detect,
+                cost,
+                min_pages,
+                markers=_normalize_markers(markers),
+                marker_pages=tuple(marker_pages),
+            )
+        )
+        return func
 
-def pdfrenamer(func: RenamerV2) -> RenamerV2:
-    """Register a renamer."""
-    func = typing.cast(RenamerV2, func)
+    if func is not None:
+        return _register(func)
+    return _register
 
-    _ALL_RENAMERS.append(func)
 
-    return func
+def _normalize_markers(markers: Iterable[str]) -> tuple[str, ...]:
+    if isinstance(markers, str):
+        raise TypeError("Markers should be a sequence of strings, not a string.")
+    return tuple(prescan.normalize(marker) for marker in markers)
+
+
+_E = typing.TypeVar("_E")
+GroupRenamer = Callable[[pdf_document.Document, _E], NameComponents | None]
+
+
+class VendorGroup(typing.Generic[_E]):
+    """Renamers for documents of the same vendor, sharing the check for the vendor.
+
+    The gate is called at most once per document, and returns the evidence that the
+    document comes from the vendor (such as the markers found on it), or None to
+    reject all the renamers in the group at once. The renamers in the group are
+    called with the evidence as their second argument.
+    """
+
+    def __init__(
+        self,
+        gate: Callable[[pdf_document.Document], _E | None],
+        *,
+        markers: Iterable[str] = (),
+    ) -> None:
+        """Create a group, whose gate is only called if one of the markers is shown
+        on the first page (see `pdfrenamer`)."""
+        self.gate = gate
+        self.markers = _normalize_markers(markers)
+
+    @typing.overload
+    def pdfrenamer(self, func: GroupRenamer[_E], /) -> GroupRenamer[_E]: ...
+
+    @typing.overload
+    def pdfrenamer(
+        self, /, *, cost: RenamerCost | None = None, min_pages: int = 1
+    ) -> Callable[[GroupRenamer[_E]], GroupRenamer[_E]]: ...
+
+    def pdfrenamer(
+        self,
+        func: GroupRenamer[_E] | None = None,
+        /,
+        *,
+        cost: RenamerCost | None = None,
+        min_pages: int = 1,
+    ) -> GroupRenamer[_E] | Callable[[GroupRenamer[_E]], GroupRenamer[_E]]:
+        """Register a renamer in the group, as `pdfrenamer` does."""
+
+        def _register(func: GroupRenamer[_E]) -> GroupRenamer[_E]:
+            _ALL_RENAMERS.append(
+                _RegisteredRenamer(func, None, cost, min_pages, group=self)
+            )
+            return func
+
+        if func is not None:
+            return _register(func)
+        return _register
+
+
+@functools.cache
+def renamers_fingerprint() -> str:
+    """Return a fingerprint of the code that produced the renaming results.
+
+    This covers the source code of the whole package, as well as the versions of the
+    libraries used for parsing, so that cached results are invalidated when any of
+    them change.
+    """
+    fingerprint = hashlib.sha256()
+    for dependency in ("pdfminer.six", "dateparser"):
+        fingerprint.update(
+            f"{dependency}={importlib.metadata.version(dependency)}\n".encode()
+        )
+
+    package_root = Path(__file__).parent.parent
+    for source_file in sorted(package_root.rglob("*.py")):
+        fingerprint.update(str(source_file.relative_to(package_root)).encode())
+        fingerprint.update(source_file.read_bytes())
+
+    return fingerprint.hexdigest()[:32]
+
+
+def renamer_name(renamer: Callable[..., Any]) -> str:
+    """Return a short, stable name for the renamer, such as `soenergy.bills_2021`."""
+    module = renamer.__module__.removeprefix("pdfrename.renamers.")
+    return f"{module}.{renamer.__qualname__}"
+
+
+@dataclasses.dataclass(frozen=True)
+class RenamerMatch:
+    renamer: str
+    # None if the renamer was only detected, as the document was already ambiguous.
+    name: NameComponents | None
+
+
+@dataclasses.dataclass(frozen=True)
+class RenamerFailure:
+    renamer: str
+    message: str
+    traceback: str
+
+
+@dataclasses.dataclass(frozen=True)
+class RenamerCall:
+    """Profiling information about a single renamer call."""
+
+    renamer: str
+    seconds: float
+    matched: bool
+    failed: bool
+    # The pages that had to be extracted because of this call.
+    pages: tuple[int, ...]
+
+
+def _observed_cost(requested_pages: set[int]) -> RenamerCost:
+    if not requested_pages:
+        return RenamerCost.METADATA
+    elif max(requested_pages) == 1:
+        return RenamerCost.FIRST_PAGE
+    return RenamerCost.LATER_PAGES
+
+
+_T = typing.TypeVar("_T")
+
+
+def _call_renamer(
+    document: pdf_document.Document,
+    name: str,
+    func: Callable[..., _T],
+    *args: Any,
+    failures: list[RenamerFailure] | None,
+    calls: list[RenamerCall] | None,
+) -> tuple[_T | None, RenamerCost]:
+    """Call a renamer, or its detector, recording failures and profiling."""
+    result = None
+    failed = False
+    extracted_pages = document.extracted_pages
+    start_time = time.perf_counter()
+    try:
+        with (
+            tracing.span(name, "renamer"),
+            document.recording_page_requests() as requested_pages,
+            memo.using(document.memo_store),
+        ):
+            result = func(document, *args)
+    except pdf_document.PageExtractionError as e:
+        # The traceback of the page's failure was logged with the first renamer
+        # requesting it.
+        failed = True
+        logging.error("%s: renamer %s failed: %s", document.original_filename, name, e)
+        if failures is not None:
+            failures.append(
+                RenamerFailure(
+                    name, repr(e), "".join(traceback.format_exception(e, chain=False))
+                )
+            )
+    except Exception as e:
+        failed = True
+        logging.exception("%s: renamer %s failed", document.original_filename, name)
+        if failures is not None:
+            failures.append(RenamerFailure(name, repr(e), traceback.format_exc()))
+
+    if calls is not None:
+        calls.append(
+            RenamerCall(
+                name,
+                time.perf_counter() - start_time,
+                matched=bool(result),
+                failed=failed,
+                pages=tuple(sorted(document.extracted_pages - extracted_pages)),
+            )
+        )
+
+    return result, _observed_cost(requested_pages)
+
+
+def _text_layer_pages() -> tuple[int, ...]:
+    return (
+        1,
+        *sorted(
+            {page for registered in _ALL_RENAMERS for page in registered.later_pages}
+        ),
+    )
+
+
+def has_text_layer(document: pdf_document.Document) -> bool:
+    """Whether any of the pages renamers look at shows text, rather than only images.
+
+    Those are the first page, and the later pages renamers are declared to look at,
+    so that a scanned cover does not hide the text of the following pages.
+    """
+    return any(document.page_has_text(page) for page in _text_layer_pages())
+
+
+def _match_registered(
+    document: pdf_document.Document,
+    *,
+    failures: list[RenamerFailure] | None,
+    calls: list[RenamerCall] | None,
+    stop_when_ambiguous: bool,
+) -> Iterator[tuple[_RegisteredRenamer, NameComponents | None]]:
+    if not has_text_layer(document):
+        _LOGGER.debug(
+            "%s: no text layer on pages %s, skipping renamers.",
+            document.original_filename,
+            _text_layer_pages(),
+        )
+        return
+
+    page_count = document.page_count
+    matches = 0
+    detected: list[_RegisteredRenamer] = []
+    evidence: dict[VendorGroup[Any], Any] = {}
+
+    for registered in sorted(_ALL_RENAMERS, key=lambda registered: registered.cost):
+        if stop_when_ambiguous and matches + len(detected) > 1:
+            break
+
+        if page_count is not None and page_count < registered.min_pages:
+            continue
+
+        if not any(
+            document.page_has_text(page) for page in (1, *registered.later_pages)
+        ):
+            _LOGGER.debug(
+                "%s: no text layer on the pages %s looks at, skipping it.",
+                document.original_filename,
+                renamer_name(registered.renamer),
+            )
+            continue
+
+        group_args: tuple[Any, ...] = ()
+        if registered.markers and not document.has_any_marker(
+            registered.markers, registered.marker_pages
+        ):
+            continue
+
+        if (group := registered.group) is not None:
+            if group.markers and not document.has_any_marker(group.markers, (1,)):
+                evidence[group] = None
+            elif group not in evidence:
+                evidence[group], _ = _call_renamer(
+                    document,
+                    renamer_name(group.gate),
+                    group.gate,
+                    failures=failures,
+                    calls=calls,
+                )
+            if evidence[group] is None:
+                continue
+            group_args = (evidence[group],)
+
+        if (registered.markers or group is not None) and registered.later_pages:
+            # The document looks like the vendor's, so the renamer is likely to go on
+            # to its later pages. Extract them together with the first one if they can
+            # be in parallel, or otherwise while it looks at the first one. This is
+            # only an optimization: pages are extracted again when requested.
+            try:
+                if document.page_executor is not None:
+                    document.get_pages((1, *registered.later_pages))
+                else:
+                    document.prefetch(registered.later_pages)
+            except Exception:
+                _LOGGER.debug(
+                    "%s: unable to extract pages ahead for %s.",
+                    document.original_filename,
+                    renamer_name(registered.renamer),
+                    exc_info=True,
+                )
+
+        name = renamer_name(registered.renamer)
+        if registered.detect is not None:
+            applies, cost = _call_renamer(
+                document,
+                f"{name}:detect",
+                registered.detect,
+                failures=failures,
+                calls=calls,
+            )
+            registered.observed_costs[cost] += 1
+            if applies:
+                detected.append(registered)
+            continue
+
+        components, cost = _call_renamer(
+            document,
+            name,
+            registered.renamer,
+            *group_args,
+            failures=failures,
+            calls=calls,
+        )
+        registered.observed_costs[cost] += 1
+        if components:
+            matches += 1
+            yield registered, components
+
+    if matches == 0 and len(detected) == 1:
+        (registered,) = detected
+        name = renamer_name(registered.renamer)
+        components, _ = _call_renamer(
+            document,
+            f"{name}:extract",
+            registered.renamer,
+            failures=failures,
+            calls=calls,
+        )
+        if components:
+            yield registered, components
+        else:
+            _LOGGER.debug(
+                "%s: %s was detected, but failed to extract the name.",
+                document.original_filename,
+                name,
+            )
+    else:
+        for registered in detected:
+            yield registered, None
+
+
+def match_all_renamers(
+    document: pdf_document.Document,
+    *,
+    failures: list[RenamerFailure] | None = None,
+    calls: list[RenamerCall] | None = None,
+    stop_when_ambiguous: bool = False,
+) -> Iterator[RenamerMatch]:
+    """Try all the renamers on the document, cheapest first.
+
+    Renamers with a detector are only used to extract the name components if they
+    are the only one to apply to the document; otherwise they are reported as
+    matches without a name.
+
+    Renamers requiring more pages than the document has, or whose markers are not
+    shown on the document, are skipped. So are the renamers in a vendor group if the
+    group's gate rejects the document, and the renamers for which none of the pages
+    they look at shows text. With `stop_when_ambiguous`, no more renamers are tried
+    once two of them matched, as the document cannot be renamed anyway.
+    """
+    for registered, components in _match_registered(
+        document,
+        failures=failures,
+        calls=calls,
+        stop_when_ambiguous=stop_when_ambiguous,
+    ):
+        yield RenamerMatch(renamer_name(registered.renamer), components)
 
 
 def try_all_renamers(document: pdf_document.Document) -> Iterator[NameComponents]:
-    for renamer in _ALL_RENAMERS:
-        try:
-            if name := renamer(document):
-                yield name
-        except Exception:
-            logging.exception(f"{document.original_filename}: renamer {renamer} failed")
+    """Yield the name components of every renamer matching the document.
+
+    Renamers that were only detected, because more than one renamer applies to the
+    document, are still called to extract their name components, so that callers
+    can tell ambiguous documents apart.
+    """
+    for registered, components in _match_registered(
+        document, failures=None, calls=None, stop_when_ambiguous=False
+    ):
+        if components is None:
+            components, _ = _call_renamer(
+                document,
+                f"{renamer_name(registered.renamer)}:extract",
+                registered.renamer,
+                failures=None,
+                calls=None,
+            )
+        if components:
+            yield components
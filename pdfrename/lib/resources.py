@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Share parsed fonts across the pages, and documents, analysed by a process.
+
+pdfminer only caches fonts within a resource manager, by object id, so fonts are
+parsed again for every page extracted. Documents from the same issuer embed the same
+fonts, so they are also shared across documents, keyed by a digest of the font's
+dictionary and of the streams it references, such as the embedded font program and
+its ToUnicode map.
+
+Predefined CMaps are already cached by name, for the whole process, by pdfminer's
+CMapDB.
+"""
+
+import hashlib
+import threading
+from collections.abc import Mapping
+from typing import Final
+
+import pdfminer.pdffont
+import pdfminer.pdfinterp
+import pdfminer.pdftypes
+import pdfminer.psparser
+
+from . import memo
+
+_MAX_SHARED_FONTS: Final[int] = 256
+# Font dictionaries nest a few levels at most (Type0 fonts, their descendants, and
+# their descriptors), anything deeper is not shared.
+_MAX_DEPTH: Final[int] = 8
+
+# Type3 glyphs are content streams using the document's own resources.
+_UNSHARED_SUBTYPES: Final[frozenset[object]] = frozenset(
+    {pdfminer.psparser.LIT("Type3")}
+)
+
+_SHARED_FONTS: Final[memo.MemoStore] = memo.MemoStore(max_entries=_MAX_SHARED_FONTS)
+_SHARED_FONTS_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class _Unshareable(Exception):
+    """The font references something that cannot be digested reliably."""
+
+
+def _update_digest(
+    hasher: "hashlib.blake2b", obj: object, visited: set[int], depth: int
+) -> None:
+    if depth > _MAX_DEPTH:
+        raise _Unshareable()
+
+    if isinstance(obj, pdfminer.pdftypes.PDFObjRef):
+        if obj.objid in visited:
+            raise _Unshareable()
+        visited = visited | {obj.objid}
+        obj = obj.resolve()
+
+    if isinstance(obj, pdfminer.pdftypes.PDFStream):
+        hasher.update(b"S")
+        _update_digest(hasher, obj.attrs, visited, depth + 1)
+        data = obj.rawdata if obj.rawdata is not None else obj.get_data()
+        hasher.update(b"%d:" % len(data))
+        hasher.update(data)
+    elif isinstance(obj, dict):
+        hasher.update(b"D%d:" % len(obj))
+        for key in sorted(obj):
+            hasher.update(repr(key).encode())
+            _update_digest(hasher, obj[key], visited, depth + 1)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b"L%d:" % len(obj))
+        for item in obj:
+            _update_digest(hasher, item, visited, depth + 1)
+    elif isinstance(obj, pdfminer.psparser.PSLiteral):
+        hasher.update(b"N" + repr(obj.name).encode())
+    elif obj is None or isinstance(obj, (bool, int, float, bytes, str)):
+        hasher.update(b"V" + repr(obj).encode())
+    else:
+        raise _Unshareable()
+
+
+def _font_digest(spec: Mapping[str, object]) -> bytes | None:
+    if spec.get("Subtype") in _UNSHARED_SUBTYPES:
+        return None
+
+    hasher = hashlib.blake2b(digest_size=20)
+    try:
+        _update_digest(hasher, spec, set(), 0)
+    except Exception:
+        # Unshareable fonts, or streams that fail to decode: let pdfminer deal with
+        # them as usual.
+        return None
+    return hasher.digest()
+
+
+def _detach(font: pdfminer.pdffont.PDFFont) -> pdfminer.pdffont.PDFFont:
+    """Drop the references to the document's objects, only needed to create the font.
+
+    Otherwise, the font would keep the whole document it came from alive.
+    """
+    font.descriptor = {
+        key: value
+        for key, value in font.descriptor.items()
+        if not isinstance(
+            value, (pdfminer.pdftypes.PDFObjRef, pdfminer.pdftypes.PDFStream)
+        )
+    }
+    if "fontfile" in vars(font):
+        vars(font)["fontfile"] = None
+    return font
+
+
+class SharedResourceManager(pdfminer.pdfinterp.PDFResourceManager):
+    """A resource manager looking up fonts in the cache shared by the process."""
+
+    def get_font(
+        self, objid: object, spec: Mapping[str, object]
+    ) -> pdfminer.pdffont.PDFFont:
+        # Descendants of Type0 fonts are created without an object id, and are part
+        # of their parent's digest.
+        if not objid or objid in self._cached_fonts:
+            return super().get_font(objid, spec)
+
+        if (digest := _font_digest(spec)) is None:
+            return super().get_font(objid, spec)
+
+        def _create() -> pdfminer.pdffont.PDFFont:
+            return _detach(super(SharedResourceManager, self).get_font(objid, spec))
+
+        with _SHARED_FONTS_LOCK:
+            font = _SHARED_FONTS.get_or_compute(digest, _create)
+        self._cached_fonts[objid] = font
+        return font
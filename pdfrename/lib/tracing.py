@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Record the time spent in each stage of the analysis as Chrome trace events.
+
+The exported JSON can be loaded in Perfetto (https://ui.perfetto.dev) or in
+chrome://tracing. Spans are only recorded while a recorder is active, so that the
+instrumentation costs next to nothing otherwise.
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Final
+
+TraceEvent = Mapping[str, Any]
+
+
+class TraceRecorder:
+    """Collect complete ("X") trace events for the current process."""
+
+    events: Final[list[TraceEvent]]
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: Mapping[str, Any],
+    ) -> None:
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            # The monotonic clock is shared by all processes on the same host, so
+            # events from worker processes line up with the main process.
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+        }
+        if args:
+            event["args"] = dict(args)
+        self.events.append(event)
+
+
+_CURRENT_RECORDER: Final[contextvars.ContextVar[TraceRecorder | None]] = (
+    contextvars.ContextVar("pdfrename_trace_recorder", default=None)
+)
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[TraceRecorder]:
+    """Record all the spans entered within the context."""
+    recorder = TraceRecorder()
+    token = _CURRENT_RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _CURRENT_RECORDER.reset(token)
+
+
+@contextlib.contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[None]:
+    """Time the code within the context, if a recorder is active."""
+    if (recorder := _CURRENT_RECORDER.get()) is None:
+        yield
+        return
+
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        recorder.add_span(name, category, start_ns, time.perf_counter_ns(), args)
+
+
+def _process_name_events(events: Iterable[TraceEvent]) -> list[TraceEvent]:
+    main_pid = os.getpid()
+    return [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "pdfrename" if pid == main_pid else f"worker {pid}"},
+        }
+        for pid in sorted({event["pid"] for event in events})
+    ]
+
+
+def write_trace(path: Path, events: Iterable[TraceEvent]) -> None:
+    """Write the events as a Chrome trace-event JSON file.
+
+    Each process gets its own named track, so that with multiple jobs the documents
+    analysed by each worker can be told apart.
+    """
+    events = sorted(events, key=lambda event: event["ts"])
+    path.write_text(
+        json.dumps(
+            {
+                "traceEvents": _process_name_events(events) + events,
+                "displayTimeUnit": "ms",
+            }
+        ),
+        encoding="utf-8",
+    )
@@ -2,12 +2,17 @@
 #
 # SPDX-License-Identifier: MIT
 
+import datetime
 import logging
 import warnings
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
+import dateparser
 import pdfminer
 
+from . import tracing
+from .memo import document_memoized
+
 _honorifics = {"mr", "mr.", "mrs", "ms", "miss"}
 
 
@@ -49,6 +54,7 @@ def normalize_account_holder_name(name: str, do_drop_honorific: bool) -> str:
     return name
 
 
+@document_memoized
 def build_dict_from_fake_table(fields_box: str, values_box: str) -> Mapping[str, str]:
     """Build a dictionary out of two boxes of a fake table.
 
@@ -66,3 +72,14 @@ def build_dict_from_fake_table(fields_box: str, values_box: str) -> Mapping[str,
 
 def extract_account_holder_from_address(address: str) -> str:
     return address.split("\n", 1)[0].strip().title()
+
+
+@document_memoized
+def parse_date(
+    date_string: str, languages: Sequence[str] | None = None
+) -> datetime.datetime | None:
+    """Parse a free-form date with dateparser."""
+    with tracing.span("parse_date", "dates", date=date_string):
+        return dateparser.parse(
+            date_string, languages=list(languages) if languages else None
+        )
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""A pool of worker processes that replaces itself when it breaks.
+
+A worker process dying abruptly, such as when killed for running out of memory,
+breaks the whole process pool, and anything submitted to it afterwards fails. The
+pool is shared by all the documents of a batch, so it is replaced rather than
+losing parallel extraction for the rest of the batch.
+"""
+
+import concurrent.futures
+import functools
+import logging
+import multiprocessing.resource_tracker
+import os
+import threading
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class ProcessPool(concurrent.futures.Executor):
+    """A process pool executor, replaced by a new one once broken."""
+
+    def __init__(self, *, initializer: Callable[[], object] | None = None) -> None:
+        self._initializer = initializer
+        self._lock = threading.Lock()
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def _current(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                if os.name == "posix":
+                    # Workers started after the resource tracker share it, so that
+                    # shared memory they attach to is released when this process
+                    # unlinks it, rather than reported as leaked when they exit.
+                    multiprocessing.resource_tracker.ensure_running()
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    initializer=self._initializer
+                )
+            return self._executor
+
+    def _discard(self, executor: concurrent.futures.ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+
+        _LOGGER.warning("Worker processes failed, starting new ones.")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _check_broken(
+        self,
+        executor: concurrent.futures.ProcessPoolExecutor,
+        future: concurrent.futures.Future[object],
+    ) -> None:
+        if not future.cancelled() and isinstance(
+            future.exception(), concurrent.futures.BrokenExecutor
+        ):
+            self._discard(executor)
+
+    def submit(
+        self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> concurrent.futures.Future[_T]:
+        executor = self._current()
+        try:
+            future = executor.submit(fn, *args, **kwargs)
+        except concurrent.futures.BrokenExecutor:
+            self._discard(executor)
+            raise
+
+        future.add_done_callback(functools.partial(self._check_broken, executor))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
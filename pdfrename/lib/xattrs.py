@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+"""Store renaming results in extended attributes of the files themselves.
+
+The stamp travels with the file when it is renamed or moved within the same
+filesystem, so re-running over an already-processed archive does not require any
+parsing, nor a central cache to keep in sync. This is only supported on Linux, the
+only platform where Python provides `os.getxattr`.
+"""
+
+import dataclasses
+import errno
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Final
+
+_LOGGER = logging.getLogger(__name__)
+
+_PREFIX: Final[str] = "user.pdfrename."
+_FINGERPRINT_ATTRIBUTE: Final[str] = _PREFIX + "fingerprint"
+_FILE_ATTRIBUTE: Final[str] = _PREFIX + "file"
+_RENAMER_ATTRIBUTE: Final[str] = _PREFIX + "renamer"
+_COMPONENTS_ATTRIBUTE: Final[str] = _PREFIX + "components"
+
+# Errors meaning that the attribute is missing, or that the filesystem does not
+# support extended attributes at all.
+_MISSING_ERRNOS: Final[frozenset[int]] = frozenset(
+    getattr(errno, name)
+    for name in ("ENODATA", "ENOTSUP", "EOPNOTSUPP")
+    if hasattr(errno, name)
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Stamp:
+    fingerprint: str
+    renamer: str | None
+    components: dict[str, Any] | None
+
+
+def is_supported() -> bool:
+    return sys.platform == "linux"
+
+
+def _file_identity(path: Path) -> str:
+    # Writing extended attributes does not change the modification time, and
+    # neither does renaming the file, so this only changes with the content.
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_stamp(path: Path) -> Stamp | None:
+    """Read the stamp from the file, if present and still matching its content."""
+    # Compared directly, rather than through is_supported(), for type checkers.
+    if sys.platform != "linux":
+        return None
+
+    try:
+        if os.getxattr(path, _FILE_ATTRIBUTE).decode() != _file_identity(path):
+            return None
+
+        fingerprint = os.getxattr(path, _FINGERPRINT_ATTRIBUTE).decode()
+        renamer = os.getxattr(path, _RENAMER_ATTRIBUTE).decode() or None
+        components = json.loads(os.getxattr(path, _COMPONENTS_ATTRIBUTE))
+    except OSError as e:
+        if e.errno not in _MISSING_ERRNOS:
+            _LOGGER.debug("%s: unable to read stamp: %s", path, e)
+        return None
+
+    return Stamp(fingerprint, renamer, components)
+
+
+def write_stamp(path: Path, stamp: Stamp) -> None:
+    """Write the stamp to the file, ignoring filesystems not supporting it."""
+    if sys.platform != "linux":
+        return
+
+    try:
+        # The file identity is removed first and written last, so that a partially
+        # written stamp is never considered valid.
+        try:
+            os.removexattr(path, _FILE_ATTRIBUTE)
+        except OSError as e:
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+
+        os.setxattr(path, _FINGERPRINT_ATTRIBUTE, stamp.fingerprint.encode())
+        os.setxattr(path, _RENAMER_ATTRIBUTE, (stamp.renamer or "").encode())
+        os.setxattr(
+            path,
+            _COMPONENTS_ATTRIBUTE,
+            json.dumps(stamp.components, ensure_ascii=False).encode(),
+        )
+        os.setxattr(path, _FILE_ATTRIBUTE, _file_identity(path).encode())
+    except OSError as e:
+        _LOGGER.debug("%s: unable to write stamp: %s", path, e)
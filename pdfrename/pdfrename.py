@@ -2,17 +2,23 @@
 #
 # SPDX-License-Identifier: MIT
 
+import collections
+import contextlib
+import json
 import logging
+import mailbox
 import sys
-from collections.abc import Sequence
+import tarfile
+import zipfile
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
 import click
 import click_log
-from more_itertools import only
 
-from .lib.pdf_document import Document
-from .lib.renamer import try_all_renamers
+from . import api
+from .lib import archives, http_range, mail, memory, profiling, tracing
 from .lib.utils import apply_pdfminer_log_filters
 from .renamers import load_all_renamers
 
@@ -20,29 +26,197 @@ tool_logger = logging.getLogger("pdfrename")
 click_log.basic_config(tool_logger)
 
 
-class MultipleRenamersError(ValueError):
-    pass
+class InputFileType(click.Path):
+    """Accept either existing files, or HTTP(S) URLs to read remotely."""
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, str) and http_range.is_url(value):
+            return value
+        return super().convert(value, param, ctx)
+
+
+def _log_problems(result: api.AnalysisResult) -> None:
+    if result.error:
+        tool_logger.warning(result.error)
+    elif result.is_ambiguous:
+        logging.error("Unable to rename %s: multiple renamers matched.", result.source)
+    elif result.no_text_layer:
+        tool_logger.info("Unable to rename %s: no text layer.", result.source)
 
 
 def find_filename(original_filename: Path) -> Path | None:
-    try:
-        document = Document(original_filename)
-    except ValueError as e:
-        tool_logger.warning(str(e))
-        return None
-
-    try:
-        if name := only(try_all_renamers(document), too_long=MultipleRenamersError):
-            return name.render_filename()
-
-    except MultipleRenamersError:
-        logging.error(
-            f"Unable to rename {original_filename}: multiple renamers matched."
-        )
+    result = api.analyze(original_filename)
+    _log_problems(result)
+
+    if name := result.name:
+        return name.render_filename()
 
     return None
 
 
+def _emit_jsonl_record(
+    result: api.AnalysisResult,
+    new_filename: Path | None,
+    *,
+    renamed: bool,
+) -> None:
+    record: dict[str, Any] = {
+        "path": result.source,
+        "new_path": str(new_filename) if new_filename else None,
+        "renamer": result.renamer,
+        "components": result.name.as_json() if result.name else None,
+        "renamed": renamed,
+        "seconds": result.timings.get("total"),
+        "timings": result.timings,
+    }
+
+    if result.cached:
+        record["cached"] = True
+    if result.io_stats:
+        record["io"] = result.io_stats
+    if result.error:
+        record["error"] = result.error
+    if result.no_text_layer:
+        record["no_text_layer"] = True
+    if result.is_ambiguous:
+        record["matches"] = [
+            {
+                "renamer": match.renamer,
+                "components": match.name.as_json() if match.name else None,
+            }
+            for match in result.matches
+        ]
+    if result.renamer_failures:
+        record["renamer_failures"] = [
+            {"renamer": failure.renamer, "error": failure.message}
+            for failure in result.renamer_failures
+        ]
+    if result.debug_log:
+        record["debug_log"] = list(result.debug_log)
+    if result.memory_stages:
+        record["memory"] = [stage.as_json() for stage in result.memory_stages]
+
+    # Flush every record, so that consumers can act on it while the batch is
+    # still running.
+    print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+def _dump_debug_log(result: api.AnalysisResult) -> None:
+    click.echo(f"Debug log for {result.source}:", err=True)
+    for line in result.debug_log:
+        click.echo(f"  {line}", err=True)
+
+
+def _expand_inputs(
+    input_files: Sequence[Path | str],
+) -> Iterator[tuple[Path | str, api.Source]]:
+    """Yield each source to analyse, together with the input it came from."""
+    for input_file in input_files:
+        if isinstance(input_file, str):
+            yield input_file, input_file
+        elif archives.is_archive(input_file):
+            try:
+                for member_source in api.archive_sources(input_file):
+                    yield input_file, member_source
+            except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+                tool_logger.warning("Unable to read archive %s: %s", input_file, e)
+        elif mail.is_mailbox(input_file):
+            try:
+                for attachment_source in api.mailbox_sources(input_file):
+                    yield input_file, attachment_source
+            except (OSError, mailbox.Error) as e:
+                tool_logger.warning("Unable to read mailbox %s: %s", input_file, e)
+        elif input_file.is_dir():
+            tool_logger.warning("%s is a directory, but not a Maildir.", input_file)
+        else:
+            yield input_file, input_file
+
+
+def _process_file_result(
+    original_filename: Path,
+    result: api.AnalysisResult,
+    *,
+    rename: bool,
+    list_all: bool,
+    jsonl: bool,
+) -> None:
+    if not (name := result.name):
+        tool_logger.debug("No match for %s", original_filename)
+        if jsonl:
+            _emit_jsonl_record(result, None, renamed=False)
+        elif list_all:
+            print(f"# ? {original_filename}")
+        return
+
+    new_filename = original_filename.parent / name.render_filename()
+    renamed = False
+    if new_filename == original_filename:
+        if list_all and not jsonl:
+            print(f"# ✓ {original_filename}")
+    elif rename:
+        tool_logger.info("Renaming %s to %s", original_filename, new_filename)
+        if new_filename.exists():
+            tool_logger.warning(
+                "File %s already exists, not overwriting.", new_filename
+            )
+        else:
+            if list_all and not jsonl:
+                print(f"# {original_filename!r} → {new_filename!r}")
+            with tracing.span("rename", "rename", source=str(original_filename)):
+                original_filename.replace(new_filename)
+            renamed = True
+    elif not jsonl:
+        print(f'ren "{original_filename}" "{new_filename}"')
+
+    if jsonl:
+        _emit_jsonl_record(result, new_filename, renamed=renamed)
+
+
+def _report_proposed_name(
+    result: api.AnalysisResult, *, list_all: bool, jsonl: bool
+) -> Path | None:
+    """Report the proposed name of a document that cannot be renamed in place.
+
+    This is the case for remote documents, and for members of archives.
+    """
+    new_basename = result.name.render_filename() if result.name else None
+
+    if jsonl:
+        _emit_jsonl_record(result, new_basename, renamed=False)
+    elif new_basename:
+        print(f"# {result.source} → {new_basename}")
+    elif list_all:
+        print(f"# ? {result.source}")
+
+    return new_basename
+
+
+def _extract_attachment(
+    source: api.NamedSource, new_basename: Path, destination_directory: Path
+) -> None:
+    destination = destination_directory / new_basename
+    if destination.exists():
+        tool_logger.warning("File %s already exists, not overwriting.", destination)
+        return
+
+    tool_logger.info("Extracting %s to %s", source.name, destination)
+    destination.write_bytes(source.data)
+
+
+def _write_renamed_archives(archive_renames: Mapping[Path, Mapping[str, str]]) -> None:
+    for archive, renames in archive_renames.items():
+        if not renames:
+            continue
+
+        destination = archives.renamed_archive_path(archive)
+        if destination.exists():
+            tool_logger.warning("File %s already exists, not overwriting.", destination)
+            continue
+
+        tool_logger.info("Writing renamed copy of %s to %s", archive, destination)
+        archives.write_renamed_archive(archive, destination, renames)
+
+
 @click.command()
 @click_log.simple_verbosity_option()
 @click.option(
@@ -55,46 +229,214 @@ def find_filename(original_filename: Path) -> Path | None:
     default=False,
     help="Whether to print checkmarks/question marks as comment next to files that are note being renamed.",
 )
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["ren", "jsonl"]),
+    default="ren",
+    help="Output format: rename commands, or one JSON record per file.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes to analyse documents in parallel.",
+)
+@click.option(
+    "--mmap/--no-mmap",
+    "use_mmap",
+    default=False,
+    help="Map input files into memory rather than reading them through buffered I/O.",
+)
+@click.option(
+    "--prefetch/--no-prefetch",
+    default=False,
+    help="Extract pages that renamers are likely to need in a background thread.",
+)
+@click.option(
+    "--parallel-pages/--no-parallel-pages",
+    default=False,
+    help="Extract the pages renamers need in parallel worker processes (without --jobs).",
+)
+@click.option(
+    "--write-renamed-archives/--no-write-renamed-archives",
+    default=False,
+    help="For zip and tar inputs, write a copy of the archive with renamed members.",
+)
+@click.option(
+    "--extract-attachments",
+    type=click.Path(exists=True, file_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="For Maildir and mbox inputs, save recognised PDF attachments to this directory.",
+)
+@click.option(
+    "--xattr-cache/--no-xattr-cache",
+    default=False,
+    help="Store results in extended attributes of the files, and reuse them on later runs.",
+)
+@click.option(
+    "--profile-renamers/--no-profile-renamers",
+    default=False,
+    help="Print per-renamer timing and hit-rate statistics at the end of the batch.",
+)
+@click.option(
+    "--profile-renamers-json",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write per-renamer statistics as JSON to this file.",
+)
+@click.option(
+    "--debug-on-failure/--no-debug-on-failure",
+    default=False,
+    help="Print the debug logs of files that could not be renamed, without enabling them for all files.",
+)
+@click.option(
+    "--memory-report/--no-memory-report",
+    default=False,
+    help="Trace memory allocations, and report what each stage allocates and retains.",
+)
+@click.option(
+    "--trace-json",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write a Chrome trace-event JSON file of each processing stage, for Perfetto.",
+)
 @click.argument(
     "input-files",
     nargs=-1,
-    type=click.Path(exists=True, dir_okay=False, readable=True, path_type=Path),
+    type=InputFileType(exists=True, readable=True, path_type=Path),
 )
-def main(*, rename: bool, list_all: bool, input_files: Sequence[Path]):
+def main(
+    *,
+    rename: bool,
+    list_all: bool,
+    output_format: str,
+    jobs: int,
+    use_mmap: bool,
+    prefetch: bool,
+    parallel_pages: bool,
+    write_renamed_archives: bool,
+    extract_attachments: Path | None,
+    xattr_cache: bool,
+    profile_renamers: bool,
+    profile_renamers_json: Path | None,
+    trace_json: Path | None,
+    debug_on_failure: bool,
+    memory_report: bool,
+    input_files: Sequence[Path | str],
+):
     apply_pdfminer_log_filters()
     load_all_renamers()
 
-    for original_filename in input_files:
+    jsonl = output_format == "jsonl"
+
+    # Archives expand to multiple sources, so keep track of which input each of the
+    # sources in flight came from. Results are returned in order.
+    origins: collections.deque[tuple[Path | str, api.Source]] = collections.deque()
+
+    def _sources() -> Iterator[api.Source]:
+        for origin, source in _expand_inputs(input_files):
+            origins.append((origin, source))
+            yield source
+
+    archive_renames: dict[Path, dict[str, str]] = collections.defaultdict(dict)
+
+    no_text_layer = 0
+    renamer_profile = profiling.RenamerProfile()
+    batch_memory = memory.MemoryReport()
+    options = api.AnalysisOptions(
+        use_mmap=use_mmap,
+        prefetch=prefetch,
+        parallel_pages=parallel_pages,
+        profile_renamers=profile_renamers or profile_renamers_json is not None,
+        trace=trace_json is not None,
+        debug_on_failure=debug_on_failure,
+        memory_report=memory_report,
+    )
+
+    # Documents are traced wherever they are analysed, while the renaming itself is
+    # traced in this process.
+    trace_events: list[tracing.TraceEvent] = []
+    trace_recorder = contextlib.ExitStack()
+    if trace_json:
+        trace_events = trace_recorder.enter_context(tracing.recording()).events
+
+    results = api.analyze_many(
+        _sources(),
+        jobs=jobs,
+        cache=api.XattrCache() if xattr_cache else None,
+        options=options,
+    )
+    while True:
         try:
-            tool_logger.debug(f"Analysing {original_filename}")
-
-            if not (new_basename := find_filename(original_filename)):
-                tool_logger.debug(f"No match for {original_filename}")
-                if list_all:
-                    print(f"# ? {original_filename}")
-                continue
-
-            new_filename = original_filename.parent / new_basename
-            if new_filename == original_filename:
-                if list_all:
-                    print(f"# ✓ {original_filename}")
-                continue
-            if rename:
-                tool_logger.info(f"Renaming {original_filename} to {new_filename}")
-                if new_filename.exists():
-                    tool_logger.warning(
-                        f"File {new_filename} already exists, not overwriting."
-                    )
-                    continue
-                if list_all:
-                    print(f"# {original_filename!r} → {new_filename!r}")
-                original_filename.replace(new_filename)
+            result = next(results)
+        except StopIteration:
+            break
+        except:  # noqa: E722
+            tool_logger.exception("While processing %s: ", origins[0][0])
+            sys.exit(-1)
+
+        original_filename, source = origins.popleft()
+        renamer_profile.add(result.renamer_calls)
+        batch_memory.add(result.memory_stages)
+        no_text_layer += result.no_text_layer
+        trace_events.extend(result.trace_events)
+        try:
+            tool_logger.debug("Analysed %s", result.source)
+            _log_problems(result)
+            if result.debug_log and not jsonl:
+                _dump_debug_log(result)
+
+            if isinstance(original_filename, str):
+                _report_proposed_name(result, list_all=list_all, jsonl=jsonl)
+            elif archives.is_archive(original_filename):
+                new_basename = _report_proposed_name(
+                    result, list_all=list_all, jsonl=jsonl
+                )
+                if new_basename:
+                    _, member_name = result.source.split("::", 1)
+                    archive_renames[original_filename][member_name] = str(new_basename)
+            elif isinstance(source, api.NamedSource):
+                # Attachments found in a mailbox.
+                new_basename = _report_proposed_name(
+                    result, list_all=list_all, jsonl=jsonl
+                )
+                if new_basename and extract_attachments:
+                    _extract_attachment(source, new_basename, extract_attachments)
             else:
-                print(f'ren "{original_filename}" "{new_filename}"')
+                _process_file_result(
+                    original_filename,
+                    result,
+                    rename=rename,
+                    list_all=list_all,
+                    jsonl=jsonl,
+                )
         except:  # noqa: E722
-            tool_logger.exception(f"While processing {original_filename}: ")
+            tool_logger.exception("While processing %s: ", result.source)
             sys.exit(-1)
 
+    if write_renamed_archives:
+        _write_renamed_archives(archive_renames)
+
+    trace_recorder.close()
+    if trace_json:
+        tracing.write_trace(trace_json, trace_events)
+
+    if no_text_layer:
+        click.echo(
+            f"Documents without a text layer (scans?), not analysed: {no_text_layer}",
+            err=True,
+        )
+    if profile_renamers:
+        click.echo(renamer_profile.format_table(), err=True)
+    if memory_report:
+        click.echo(batch_memory.format_table(), err=True)
+    if profile_renamers_json:
+        profile_renamers_json.write_text(
+            json.dumps(renamer_profile.as_json(), indent=2), encoding="utf-8"
+        )
+
 
 if __name__ == "__main__":
     main()
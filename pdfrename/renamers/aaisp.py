@@ -14,7 +14,7 @@ _SERVICE = "Andrews & Arnold"
 _COMPANY_IDENTIFIER = "Andrews & Arnold Ltd\n"
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Andrews & Arnold Ltd",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if _COMPANY_IDENTIFIER not in first_page or first_page[0] != "Sales\xa0Invoice\n":
@@ -52,7 +52,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Andrews & Arnold Ltd",))
 def direct_debit_notice(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
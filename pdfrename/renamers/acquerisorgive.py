@@ -12,7 +12,7 @@ from ..lib.renamer import NameComponents, pdfrenamer
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("www.acquerisorgive.it",))
 def bill(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill")
 
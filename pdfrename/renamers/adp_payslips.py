@@ -7,7 +7,7 @@ import logging
 import re
 
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
 from ..lib.utils import extract_account_holder_from_address
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,16 +17,20 @@ _LOGGER = logging.getLogger(__name__)
 _ADP_PAYSLIP_CREATOR = re.compile(rb"Form ZF_XADP_M\d\d_PAYSLIP_NEW EN")
 
 
-@pdfrenamer
-def payslip_en(document: pdf_document.Document) -> NameComponents | None:
-    logger = _LOGGER.getChild("adp_payslips.payslip")
-
+def _is_payslip(document: pdf_document.Document) -> bool:
     creator = document.creator
-
     if creator is None or not _ADP_PAYSLIP_CREATOR.match(creator):
-        return None
+        return False
+
+    _LOGGER.debug("Possible ADP-generated payslip.")
 
-    logger.debug("Possible ADP-generated payslip.")
+    details_box = document[1].find_box_starting_with(" Company Name :")
+    return details_box is not None and "Pay Date" in details_box
+
+
+@pdfrenamer(detect=_is_payslip, cost=RenamerCost.FIRST_PAGE)
+def payslip_en(document: pdf_document.Document) -> NameComponents | None:
+    logger = _LOGGER.getChild("adp_payslips.payslip")
 
     text_boxes = document[1]
 
@@ -50,10 +54,16 @@ def payslip_en(document: pdf_document.Document) -> NameComponents | None:
         return None
     date = datetime.datetime.strptime(date_match.group(1), "%d.%m.%Y")
 
-    # There's a "PRIVATE & CONFIDENTIAL" line first.
-    _, address_box = text_boxes[details_box_index - 1].split("\n", 1)
+    # The address precedes the details, after a "PRIVATE & CONFIDENTIAL" line.
+    address_lines = (
+        text_boxes[details_box_index - 1].split("\n", 1) if details_box_index else []
+    )
+    if len(address_lines) != 2:
+        logger.debug("Unable to find the address box.")
+        return None
+    address_box = address_lines[1]
 
-    logger.debug(f"Found address box: {address_box!r}")
+    logger.debug("Found address box: %r", address_box)
     employee_name = extract_account_holder_from_address(address_box)
 
     return NameComponents(date, company_name, employee_name, "Payslip")
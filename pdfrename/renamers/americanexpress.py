@@ -92,7 +92,7 @@ def _statement_generic(
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("americanexpress",))
 def statement_gbr(document: pdf_document.Document) -> NameComponents | None:
     components = _statement_generic(
         document,
@@ -109,7 +109,7 @@ def statement_gbr(document: pdf_document.Document) -> NameComponents | None:
     return components
 
 
-@pdfrenamer
+@pdfrenamer(markers=("americanexpress",))
 def statement_ita(document: pdf_document.Document) -> NameComponents | None:
     # This was only tested on 2011 statements (!)
     return _statement_generic(
@@ -2,14 +2,13 @@
 #
 # SPDX-License-Identifier: MIT
 
-import dateparser
 
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table
+from ..lib.utils import build_dict_from_fake_table, parse_date
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Amazon Web Services",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if not first_page:
@@ -34,7 +33,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
 
     invoice_info = build_dict_from_fake_table(fields_box, values_box)
 
-    invoice_date = dateparser.parse(invoice_info["Invoice Date:"], languages=["en"])
+    invoice_date = parse_date(invoice_info["Invoice Date:"], languages=["en"])
     assert invoice_date
 
     address_box = first_page.find_box_starting_with("Bill to Address:\n")
@@ -48,7 +47,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
     return NameComponents(invoice_date, "AWS", account_holder, "Invoice")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("AMAZON WEB SERVICES EMEA SARL, UK BRANCH",))
 def uk_vat_invoice(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if not first_page:
@@ -67,7 +66,7 @@ def uk_vat_invoice(document: pdf_document.Document) -> NameComponents | None:
     account_holder = details[3]
 
     date_str = first_page[first_page.index("VAT Invoice Date:\n") + 4]
-    date = dateparser.parse(date_str, languages=["en"])
+    date = parse_date(date_str, languages=["en"])
     assert date
 
     invoice_number = first_page[first_page.index("VAT Invoice Number:\n") + 4]
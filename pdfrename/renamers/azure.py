@@ -11,7 +11,7 @@ from ..lib.renamer import NameComponents, pdfrenamer
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Microsoft Ireland Operations Ltd",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("azure.invoice")
     text_boxes = document[1]
@@ -29,7 +29,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
     for box in text_boxes:
         try:
             invoice_date = datetime.datetime.strptime(box, "%m/%d/%Y\n")
-            logger.debug(f"Found an invoice date line {invoice_date!r}")
+            logger.debug("Found an invoice date line %r", invoice_date)
             break
         except ValueError:
             continue
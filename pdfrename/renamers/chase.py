@@ -5,16 +5,14 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("JPMorgan Chase Bank, N.A.",))
 def statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("chase.statement")
     text_boxes = document[1]
@@ -38,9 +36,9 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
         return None
 
     assert period_match
-    logger.debug(f"found period specification: {period_match.group(0)!r}")
+    logger.debug("found period specification: %r", period_match.group(0))
 
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
     assert statement_date
 
     # We anchor the address on the contact numbers on the side, but that's not working for
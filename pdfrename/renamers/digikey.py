@@ -6,16 +6,14 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("www.digikey.",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("digikey.invoice")
     text_boxes = document[1]
@@ -31,20 +29,20 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
     # Looking for a stray 'i' from the 'Ship To' label.
     account_holder_name_idx = text_boxes.index("i\n")
     account_holder_name_str = text_boxes[account_holder_name_idx + 1]
-    logger.debug(f"The name line is {account_holder_name_str!r}")
+    logger.debug("The name line is %r", account_holder_name_str)
 
     account_holder_name = extract_account_holder_from_address(account_holder_name_str)
 
     invoice_date_line = text_boxes.find_box_starting_with("Invoice Date:\n")
     assert invoice_date_line
 
-    logger.debug(f"Found an invoice date line {invoice_date_line!r}")
+    logger.debug("Found an invoice date line %r", invoice_date_line)
     date_match = re.search(
         r"^Invoice Date:\n([0-9]{1,2}-[A-Z][a-z]{2,}-[0-9]{4}\n)", invoice_date_line
     )
     assert date_match is not None
 
-    invoice_date = dateparser.parse(date_match.group(1), languages=["en"])
+    invoice_date = parse_date(date_match.group(1), languages=["en"])
     assert invoice_date is not None
 
     return NameComponents(invoice_date, "Digikey", account_holder_name, "Invoice")
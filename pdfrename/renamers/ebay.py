@@ -2,13 +2,13 @@
 #
 # SPDX-License-Identifier: MIT
 
-import dateparser
 
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 
-@pdfrenamer
+@pdfrenamer(markers=("eBay S.à r.l.",))
 def financial_statement(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -19,7 +19,7 @@ def financial_statement(document: pdf_document.Document) -> NameComponents | Non
     assert date_box
     _, date_str = date_box.split(" ", 1)
 
-    date = dateparser.parse(date_str, languages=["en"])
+    date = parse_date(date_str, languages=["en"])
     assert date
 
     seller_name_label_idx = first_page.index("Seller name\n")
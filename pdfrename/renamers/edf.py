@@ -5,16 +5,14 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("edfenergy.com",))
 def bill(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("edf.bill")
     text_boxes = document[1]
@@ -31,14 +29,14 @@ def bill(document: pdf_document.Document) -> NameComponents | None:
     if not edf_statement_period_line:
         return None
 
-    logger.debug(f"Found EDF Energy bill period line {edf_statement_period_line!r}")
+    logger.debug("Found EDF Energy bill period line %r", edf_statement_period_line)
 
     period_match = re.match(
         r"^Bill date: ([0-9]{1,2} [A-Z][a-z]+ [0-9]{4})\\n",
         edf_statement_period_line,
     )
     assert period_match
-    bill_date = dateparser.parse(period_match.group(1), languages=["en"])
+    bill_date = parse_date(period_match.group(1), languages=["en"])
     assert bill_date
 
     return NameComponents(bill_date, "EDF Energy", account_holder_name, "Bill")
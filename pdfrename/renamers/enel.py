@@ -13,7 +13,7 @@ from ..lib.utils import extract_account_holder_from_address
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Enel Energia - Mercato libero dell'energia",))
 def bill(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill")
 
@@ -42,7 +42,7 @@ def bill(document: pdf_document.Document) -> NameComponents | None:
         address_box = first_page[address_box_index]
 
     account_holder_name = extract_account_holder_from_address(address_box)
-    logger.debug(f"Possible account holder found: {account_holder_name!r}")
+    logger.debug("Possible account holder found: %r", account_holder_name)
 
     # In 2018, the address was before the customer number instead, try again.
     if account_holder_name == "Periodo":
@@ -94,7 +94,7 @@ _DATE_EXTRACTION_2021_RE = re.compile(
 )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Per maggiori informazioni vedi il regolamento sul sito enel.it",))
 def bill_2021(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill_2021")
 
@@ -112,7 +112,7 @@ def bill_2021(document: pdf_document.Document) -> NameComponents | None:
     account_holder_name = extract_account_holder_from_address(
         first_page[more_info_index + 1]
     )
-    logger.debug(f"Possible account holder found: {account_holder_name!r}")
+    logger.debug("Possible account holder found: %r", account_holder_name)
 
     # There's a lot of text running together in the same box as the date, we can't easily
     # search for a prefix, so we actually re-use the regex.
@@ -136,7 +136,7 @@ _DATE_EXTRACTION_2023_RE = re.compile(
 )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Enel Energia",))
 def bill_2023(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill_2023")
 
@@ -166,7 +166,7 @@ def bill_2023(document: pdf_document.Document) -> NameComponents | None:
         first_page[account_holder_idx]
     )
 
-    logger.debug(f"Possible account holder found: {account_holder_name!r}")
+    logger.debug("Possible account holder found: %r", account_holder_name)
 
     account_number_box = first_page.find_box_starting_with("N° Cliente")
     assert account_number_box is not None
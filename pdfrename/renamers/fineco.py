@@ -6,15 +6,14 @@ import datetime
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("FinecoBank S.p.A.",))
 def quarterly_statement(
     document: pdf_document.Document,
 ) -> NameComponents | None:
@@ -33,7 +32,7 @@ def quarterly_statement(
     # We don't know if the spacing is always preserved or dropped, so let's
     # play it relatively safe.
     date_start = date_str.index("Date") + 4
-    date = dateparser.parse(date_str[date_start:])
+    date = parse_date(date_str[date_start:])
     assert date
 
     account_holder_start = account_holder_str.index("Account Holders") + len(
@@ -44,7 +43,7 @@ def quarterly_statement(
     return NameComponents(date, "FinecoBank", account_holder, "Statement")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("P&L SUMMARY",))
 def profit_loss(
     document: pdf_document.Document,
 ) -> NameComponents | None:
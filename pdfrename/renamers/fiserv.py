@@ -5,25 +5,35 @@
 import logging
 import re
 
-import dateparser
 from more_itertools import one
 
 from ..doctypes.en import CREDIT_CARD_STATEMENT
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
-def estatement(document: pdf_document.Document) -> NameComponents | None:
-    logger = _LOGGER.getChild("estatement")
+def _find_summary_index(first_page: pdf_document.PageTextBoxes) -> int | None:
+    try:
+        return first_page.index("Total Credit Limit\n")
+    except ValueError:
+        return first_page.find_index_starting_with("Summary\n")
 
+
+def _is_estatement(document: pdf_document.Document) -> bool:
     if document.author != b"Fiserv" or document.creator != b"eStatements":
-        return None
+        return False
+
+    _LOGGER.getChild("estatement").debug("Metadata suggest Fiserv eStatement")
 
-    logger.debug("Metadata suggest Fiserv eStatement")
+    return _find_summary_index(document[1]) is not None
+
+
+@pdfrenamer(detect=_is_estatement, cost=RenamerCost.FIRST_PAGE, min_pages=2)
+def estatement(document: pdf_document.Document) -> NameComponents | None:
+    logger = _LOGGER.getChild("estatement")
 
     # Good news, Fiserv follows the same template for years and there are
     # some very obvious fixed positions.
@@ -31,11 +41,7 @@ def estatement(document: pdf_document.Document) -> NameComponents | None:
     # but the giro credit tab at the bottom of the first page.
 
     first_page = document[1]
-    try:
-        credit_limit_index: int | None = first_page.index("Total Credit Limit\n")
-    except ValueError:
-        credit_limit_index = first_page.find_index_starting_with("Summary\n")
-
+    credit_limit_index = _find_summary_index(first_page)
     if credit_limit_index is None:
         logger.debug("But could not find the Summary table.")
         return None
@@ -44,11 +50,11 @@ def estatement(document: pdf_document.Document) -> NameComponents | None:
     # of the summary table we attempt the next ~8 boxes until one is a
     # simple date.
     for date_index in range(credit_limit_index + 1, credit_limit_index + 8):
-        statement_date = dateparser.parse(first_page[date_index], languages=["en"])
+        statement_date = parse_date(first_page[date_index], languages=["en"])
         if statement_date is not None:
             break
     else:
-        logging.debug("Unable to find a valid statement date")
+        logger.debug("Unable to find a valid statement date")
         return None
 
     account_holder = extract_account_holder_from_address(first_page[0])
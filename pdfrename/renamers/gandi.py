@@ -4,15 +4,15 @@
 
 import re
 
-import dateparser
 from more_itertools import one
 
 from ..doctypes.en import INVOICE
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Gandi International",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
 
     if not (first_page := document[1]):
@@ -30,7 +30,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
             re.compile(r"(?:.*\n)?Status: .*\nDate: ([^\n]+)\n")
         )
     )
-    date = dateparser.parse(date_match.group(1), languages=["en"])
+    date = parse_date(date_match.group(1), languages=["en"])
     assert date is not None
 
     account_holder_box = first_page.find_box_starting_with("To:\n")
@@ -4,15 +4,14 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Google Commerce Limited",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("google.invoice")
     text_boxes = document[1]
@@ -44,7 +43,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
         case 3:
             invoice_date_str = invoice_date_box.split("\n")[2]
 
-    invoice_date = dateparser.parse(invoice_date_str, languages=["en"])
+    invoice_date = parse_date(invoice_date_str, languages=["en"])
     assert invoice_date is not None
 
     return NameComponents(
@@ -15,7 +15,7 @@ _LOGGER = logging.getLogger(__name__)
 _HETZNER_SERVICE = "Hetzner"
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Hetzner Online",))
 def invoice(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -17,7 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 _HL_SERVICE = "Hargreaves Lansdown"
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Hargreaves Lansdown Asset Management Limited",))
 def tax_certificate(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -42,7 +42,7 @@ def tax_certificate(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Hargreaves Lansdown Savings Limited",))
 def savings_statement(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -71,7 +71,7 @@ def savings_statement(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Hargreaves Lansdown Asset Management Limited",))
 def investment_report(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("investment_report")
 
@@ -123,7 +123,7 @@ _CONTRACT_NOTE_ACCOUNTS = {
 }
 
 
-@pdfrenamer
+@pdfrenamer(markers=_CONTRACT_NOTE_ACCOUNTS)
 def contract_note(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     first_page_set = set(first_page)
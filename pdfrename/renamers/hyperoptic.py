@@ -6,16 +6,14 @@ import datetime
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table
+from ..lib.utils import build_dict_from_fake_table, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("www.hyperoptic.com",))
 def bill_2018(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("hyperoptic.bill_2018")
 
@@ -30,7 +28,7 @@ def bill_2018(document: pdf_document.Document) -> NameComponents | None:
     if not (account_holder_box := text_boxes.find_box_starting_with("Customer Name: ")):
         return None
 
-    logger.debug(f"looking for customer name in {account_holder_box!r}")
+    logger.debug("looking for customer name in %r", account_holder_box)
     account_holder_match = re.search(r"Customer Name: ([^\n]+)\n", account_holder_box)
     assert account_holder_match
     account_holder_name = account_holder_match.group(1)
@@ -68,7 +66,7 @@ def bill_2018(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Hypernews", "DD Ref:"))
 def bill_2020(document: pdf_document.Document) -> NameComponents | None:
     text_boxes = document[1]
 
@@ -110,7 +108,7 @@ def bill_2020(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Here's your latest bill from Hyperoptic.",))
 def bill_2021(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill_2021")
 
@@ -133,7 +131,9 @@ def bill_2021(document: pdf_document.Document) -> NameComponents | None:
     account_number_idx = text_boxes.index("Account number:\n")
     bill_number_idx = text_boxes.index("Bill number:\n")
     logger.debug(
-        f"Bill date header at index {bill_date_header_idx}, payment date header at index {payment_date_header_idx}"
+        "Bill date header at index %s, payment date header at index %s",
+        bill_date_header_idx,
+        payment_date_header_idx,
     )
 
     if payment_date_header_idx == bill_date_header_idx + 2:
@@ -149,7 +149,7 @@ def bill_2021(document: pdf_document.Document) -> NameComponents | None:
         account_number_string = text_boxes[account_number_idx + 3].strip()
         bill_number_string = text_boxes[bill_number_idx + 3].strip()
 
-    bill_date = dateparser.parse(bill_date_string, languages=["en"])
+    bill_date = parse_date(bill_date_string, languages=["en"])
     assert bill_date
 
     return NameComponents(
@@ -4,16 +4,14 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("ICONIE2D",))
 def statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("kbc.statement")
     text_boxes = document[1]
@@ -26,7 +24,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
 
     account_holder_name = extract_account_holder_from_address(text_boxes[0])
 
-    statement_date = dateparser.parse(text_boxes[1], languages=["en"])
+    statement_date = parse_date(text_boxes[1], languages=["en"])
 
     assert statement_date is not None
 
@@ -5,15 +5,14 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("logo, Lloyds Bank.",))
 def statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("lloyds.statement")
     text_boxes = document[1]
@@ -40,7 +39,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
 
     assert date_match
 
-    bill_date = dateparser.parse(date_match.group(1), languages=["en"])
+    bill_date = parse_date(date_match.group(1), languages=["en"])
     assert bill_date is not None
 
     return NameComponents(bill_date, "Lloyds", account_holder_name, "Statement")
@@ -4,16 +4,14 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Mouser Part Number",))
 def mouser_invoice(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("mouser_invoice")
     text_boxes = document[1]
@@ -25,7 +23,7 @@ def mouser_invoice(document: pdf_document.Document) -> NameComponents | None:
         return None
 
     account_holder_name_str = text_boxes[26]
-    logger.debug(f"The name line is {account_holder_name_str!r}")
+    logger.debug("The name line is %r", account_holder_name_str)
 
     account_holder_str = extract_account_holder_from_address(account_holder_name_str)
 
@@ -34,8 +32,8 @@ def mouser_invoice(document: pdf_document.Document) -> NameComponents | None:
     invoice_date_box_idx = text_boxes.index("Invoice Date\n")
     invoice_date_str = text_boxes[invoice_date_box_idx + 3]
 
-    logger.debug(f"Found an invoice date line {invoice_date_str!r}")
-    invoice_date = dateparser.parse(invoice_date_str, languages=["en"])
+    logger.debug("Found an invoice date line %r", invoice_date_str)
+    invoice_date = parse_date(invoice_date_str, languages=["en"])
     assert invoice_date
 
     return NameComponents(invoice_date, "Mouser", account_holder_name, "Invoice")
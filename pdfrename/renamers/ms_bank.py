@@ -5,15 +5,14 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("M&S Bank",))
 def statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("ms_bank.statement")
     text_boxes = document[1]
@@ -30,7 +29,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     period_box_index = text_boxes.index(account_name_box) - 1
     period_line = text_boxes[period_box_index]
 
-    logger.debug(f"found period specification {period_line!r}")
+    logger.debug("found period specification %r", period_line)
 
     period_match = re.search(
         r"^[0-9]{2} [A-Z][a-z]+(?: [0-9]{4})? to ([0-9]{2} [A-Z][a-z]+ [0-9]{4})\\n$",
@@ -38,7 +37,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     )
     assert period_match
 
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
     assert statement_date
 
     return NameComponents(
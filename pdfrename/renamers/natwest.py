@@ -7,12 +7,10 @@ import enum
 import logging
 import re
 
-import dateparser
-
 from ..doctypes.en import CERTIFICATE_OF_INTEREST, STATEMENT, STATEMENT_OF_FEES
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import drop_honorific
+from ..lib.renamer import NameComponents, VendorGroup, pdfrenamer
+from ..lib.utils import drop_honorific, parse_date
 
 
 class Bank(enum.StrEnum):
@@ -50,8 +48,16 @@ def _bank_name_from_boxes(document: pdf_document.Document) -> Bank | None:
     return bank_name
 
 
-@pdfrenamer
-def statement(document: pdf_document.Document) -> NameComponents | None:
+# Documents carrying the bank's website on the first page.
+_BANK_WEBSITE: VendorGroup[Bank] = VendorGroup(
+    _bank_name_from_boxes, markers=("natwest.com", "ulsterbank.co.uk")
+)
+
+
+@_BANK_WEBSITE.pdfrenamer
+def statement(
+    document: pdf_document.Document, bank_name: Bank
+) -> NameComponents | None:
     logger = _LOGGER.getChild("statement")
 
     first_page = document[1]
@@ -63,15 +69,11 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     ):
         return None
 
-    bank_name = _bank_name_from_boxes(document)
-    if not bank_name:
-        return None
-
-    logger.debug(f"Possible {bank_name} statement.")
+    logger.debug("Possible %s statement.", bank_name)
     period_line_index = first_page.index("Period\n") + 1
     period_line = first_page[period_line_index]
 
-    logger.debug(f"Found period line: {period_line!r}")
+    logger.debug("Found period line: %r", period_line)
 
     date_match = re.match(
         r"^[0-9]{1,2} [A-Z][a-z]+ [0-9]{4} to ([0-9]{1,2} [A-Z][a-z]+ [0-9]{4}\n)",
@@ -80,7 +82,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     if date_match is None:
         return None
 
-    statement_date = dateparser.parse(date_match.group(1), languages=["en"])
+    statement_date = parse_date(date_match.group(1), languages=["en"])
     if statement_date is None:
         return None
 
@@ -106,18 +108,16 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     return NameComponents(statement_date, bank_name, account_holders, STATEMENT)
 
 
-@pdfrenamer
-def statement_2023(document: pdf_document.Document) -> NameComponents | None:
+@_BANK_WEBSITE.pdfrenamer
+def statement_2023(
+    document: pdf_document.Document, bank_name: Bank
+) -> NameComponents | None:
     logger = _LOGGER.getChild("statement_2023")
 
     if document.title != b"Retail_Statements_V2":
         return None
 
-    bank_name = _bank_name_from_boxes(document)
-    if not bank_name:
-        return None
-
-    logger.debug(f"Possible {bank_name} 2023 statement.")
+    logger.debug("Possible %s 2023 statement.", bank_name)
 
     first_page = document[1]
 
@@ -141,7 +141,7 @@ def statement_2023(document: pdf_document.Document) -> NameComponents | None:
         logger.debug("Unable to find statement date in summary: %r", summary)
         return None
 
-    statement_date = dateparser.parse(statement_date_str, languages=["en"])
+    statement_date = parse_date(statement_date_str, languages=["en"])
     assert statement_date is not None
 
     return NameComponents(statement_date, bank_name, account_holders, STATEMENT)
@@ -151,8 +151,10 @@ _STATEMENT_OF_FEES = "Statement of Fees\n"
 _HONORIFICS = {"MR", "MRS"}
 
 
-@pdfrenamer
-def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
+@_BANK_WEBSITE.pdfrenamer
+def statement_of_fees(
+    document: pdf_document.Document, bank_name: Bank
+) -> NameComponents | None:
     logger = _LOGGER.getChild("statement_of_fees")
 
     first_page = document[1]
@@ -160,10 +162,7 @@ def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     if not first_page or _STATEMENT_OF_FEES not in first_page:
         return None
 
-    if (bank_name := _bank_name_from_boxes(document)) is None:
-        return None
-
-    logger.debug(f"Possible {bank_name} statement of fees.")
+    logger.debug("Possible %s statement of fees.", bank_name)
 
     # Different documents have the first two boxes inverted, so check which one is the document
     # type, the other is the address.
@@ -211,15 +210,15 @@ def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     assert period_line_idx is not None
     date_string = first_page[period_line_idx + 1]
 
-    statement_date = dateparser.parse(date_string, languages=["en"])
+    statement_date = parse_date(date_string, languages=["en"])
     assert statement_date is not None
 
     return NameComponents(statement_date, bank_name, account_holders, STATEMENT_OF_FEES)
 
 
-@pdfrenamer
+@_BANK_WEBSITE.pdfrenamer
 def certificate_of_interest(
-    document: pdf_document.Document,
+    document: pdf_document.Document, bank_name: Bank
 ) -> NameComponents | None:
     logger = _LOGGER.getChild("certificate_of_interest")
 
@@ -230,10 +229,7 @@ def certificate_of_interest(
     ):
         return None
 
-    if (bank_name := _bank_name_from_boxes(document)) is None:
-        return None
-
-    logger.debug(f"Possible {bank_name} certificate of interest.")
+    logger.debug("Possible %s certificate of interest.", bank_name)
 
     # The account holder(s) as well as the account type follow the IBAN, in its own box.
     iban_box_index = first_page.find_index_starting_with("IBAN: ")
@@ -254,7 +250,7 @@ def certificate_of_interest(
     )
     assert date_match
 
-    document_date = dateparser.parse(date_match.group(1), languages=["en"])
+    document_date = parse_date(date_match.group(1), languages=["en"])
     assert document_date is not None
 
     return NameComponents(
@@ -274,7 +270,7 @@ def certificate_of_interest_2023(
     if document.subject != b"Certificate of Interest":
         return None
 
-    logger.debug(f"Possible {bank_name} certificate of interest.")
+    logger.debug("Possible %s certificate of interest.", bank_name)
 
     first_page = document[1]
 
@@ -285,7 +281,7 @@ def certificate_of_interest_2023(
         re.compile("^Tax year ending ([0-9]{1,2}[a-z]{2} [A-Z][a-z]+ [0-9]{4})\n$")
     )
 
-    document_date = dateparser.parse(date_match.group(1), languages=["en"])
+    document_date = parse_date(date_match.group(1), languages=["en"])
     assert document_date is not None
 
     (account_name,) = first_page.find_all_matching_regex(
@@ -6,19 +6,18 @@
 
 import logging
 
-import dateparser
 from more_itertools import first
 
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import drop_honorific, extract_account_holder_from_address
+from ..lib.utils import drop_honorific, extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 _KNOWN_COUNCILS = {"London Borough of Hounslow", "Milton Keynes City Council"}
 
 
-@pdfrenamer
+@pdfrenamer(markers=_KNOWN_COUNCILS)
 def tax_bill(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("tax_bill")
 
@@ -37,7 +36,7 @@ def tax_bill(document: pdf_document.Document) -> NameComponents | None:
         logger.debug("Not a council tax bill, unknown format.")
         return None
 
-    bill_date = dateparser.parse(first_page[0], languages=["en"])
+    bill_date = parse_date(first_page[0], languages=["en"])
     assert bill_date
 
     # In older bills, the subject box includes the address.
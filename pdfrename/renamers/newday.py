@@ -5,11 +5,9 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +21,7 @@ _URLS_TO_ISSUERS = (
 _NEWDAY_BIN_PATTERN = re.compile(r"^736501\d{10}\n$")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("736501", "newday.co.uk/"))
 def newday_credit_card_statement(
     document: pdf_document.Document,
 ) -> NameComponents | None:
@@ -73,9 +71,7 @@ def newday_credit_card_statement(
     date_box = text_boxes.find_box_starting_with("Statement date: ")
     assert date_box
 
-    statement_date = dateparser.parse(
-        date_box[len("Statement date: ") :], languages=["en"]
-    )
+    statement_date = parse_date(date_box[len("Statement date: ") :], languages=["en"])
     assert statement_date is not None
 
     date_idx = text_boxes.index(date_box)
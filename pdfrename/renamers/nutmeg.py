@@ -4,16 +4,14 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table
+from ..lib.utils import build_dict_from_fake_table, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(min_pages=2, markers=("Suitability Report",))
 def suitability_report(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("suitability_report_2021")
     first_page = document[1]
@@ -30,7 +28,7 @@ def suitability_report(document: pdf_document.Document) -> NameComponents | None
     document_type_index = first_page.find_index_starting_with("Suitability Report\n")
     assert document_type_index is not None
     logger.debug(
-        f"Nutmeg Suitability Report document type at index {document_type_index}"
+        "Nutmeg Suitability Report document type at index %s", document_type_index
     )
     if "\nNutmeg account number" not in first_page[document_type_index + 1]:
         logger.warning("Nutmeg Suitability Report without account number.")
@@ -41,8 +39,8 @@ def suitability_report(document: pdf_document.Document) -> NameComponents | None
     )
 
     report_date_str = params_table["Generated on:"]
-    logger.debug(f"Nutmeg Suitability Report date: {report_date_str}")
-    report_date = dateparser.parse(report_date_str, languages=["en"])
+    logger.debug("Nutmeg Suitability Report date: %s", report_date_str)
+    report_date = parse_date(report_date_str, languages=["en"])
     assert report_date is not None
 
     account_holder_name = params_table["Produced for:"]
@@ -50,7 +48,7 @@ def suitability_report(document: pdf_document.Document) -> NameComponents | None
     second_page = document[2]
     if second_page and second_page[0] == "About your new pot\n":
         pot_name = second_page[1].strip()
-        logger.debug(f"Suitability Report for a new pot: {pot_name}")
+        logger.debug("Suitability Report for a new pot: %s", pot_name)
         account_number = pot_name
     else:
         account_number = None
@@ -64,7 +62,7 @@ def suitability_report(document: pdf_document.Document) -> NameComponents | None
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Produced by Nutmeg Saving and Investment Limited",))
 def valuation_report(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("valuation_report")
     first_page = document[1]
@@ -83,15 +81,15 @@ def valuation_report(document: pdf_document.Document) -> NameComponents | None:
         date_str = first_page[1]
         account_holder = first_page[3]
     else:
-        logger.debug(f"Unrecognized document starting with {first_page[0]}")
+        logger.debug("Unrecognized document starting with %s", first_page[0])
         return None
 
     logger.debug("Possible Nutmeg Valuation Report found.")
 
     if not date_str.startswith("As of ") and not date_str.startswith("As at "):
-        logger.warning(f"Nutmeg Valuation Report with invalid date: {date_str}")
+        logger.warning("Nutmeg Valuation Report with invalid date: %s", date_str)
 
-    date = dateparser.parse(date_str[6:], languages=["en"])
+    date = parse_date(date_str[6:], languages=["en"])
     assert date is not None
 
     return NameComponents(
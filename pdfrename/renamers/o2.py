@@ -4,16 +4,18 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table, extract_account_holder_from_address
+from ..lib.utils import (
+    build_dict_from_fake_table,
+    extract_account_holder_from_address,
+    parse_date,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Telefónica UK Limited",))
 def uk_copy_bill(document: pdf_document.Document) -> NameComponents | None:
     """Parse and rename copy bills from My O2 (UK) service.
 
@@ -35,7 +37,7 @@ def uk_copy_bill(document: pdf_document.Document) -> NameComponents | None:
     bill_info = build_dict_from_fake_table(
         text_boxes[fields_box_index], text_boxes[fields_box_index + 1]
     )
-    bill_date = dateparser.parse(bill_info["Bill date"], languages=["en"])
+    bill_date = parse_date(bill_info["Bill date"], languages=["en"])
     assert bill_date is not None
 
     # Older bills have the fake table first, followed the address; newer bills use
@@ -55,7 +57,7 @@ def uk_copy_bill(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("O2.co.uk/help",))
 def uk_original_bill(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("uk_original_bill")
 
@@ -98,7 +100,7 @@ def uk_original_bill(document: pdf_document.Document) -> NameComponents | None:
         logging.warning("Unable to find bill date.")
         return None
 
-    bill_date = dateparser.parse(bill_date_str, languages=["en"])
+    bill_date = parse_date(bill_date_str, languages=["en"])
     assert bill_date is not None
 
     # We assume by default that the document is a Bill, but O2 issues almost
@@ -5,11 +5,9 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +32,7 @@ _BILL_DETAILS_REGEXES = (
 )
 
 
-@pdfrenamer
+@pdfrenamer(cost=RenamerCost.METADATA)
 def statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("statement")
 
@@ -67,14 +65,14 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
         )
         return None
 
-    logger.debug(f"Found likely {correspondent_name} statement.")
+    logger.debug("Found likely %s statement.", correspondent_name)
 
     bill_details_index = first_page.find_index_starting_with(
         "Your Account Number: "
     ) or first_page.find_index_starting_with("Your account number: ")
     assert bill_details_index is not None
     bill_details = first_page[bill_details_index]
-    logger.debug(f"Found bill details: {bill_details!r}")
+    logger.debug("Found bill details: %r", bill_details)
 
     # It looks like 2025 has seen multiple statement templates, but for all of them,
     # the bill details are right after the account holder address.
@@ -96,9 +94,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
         logger.warning("Failed to match bill details.")
         return None
 
-    statement_date = dateparser.parse(
-        bill_details_match.group("bill_date"), languages=["en"]
-    )
+    statement_date = parse_date(bill_details_match.group("bill_date"), languages=["en"])
     assert statement_date is not None
 
     return NameComponents(
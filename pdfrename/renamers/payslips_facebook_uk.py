@@ -5,18 +5,16 @@
 import datetime
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 _SERVICE = "Facebook UK Limited"
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Facebook UK Ltd",))
 def pre_adp_payslip(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("facebook.pre_adp_payslip")
 
@@ -35,13 +33,13 @@ def pre_adp_payslip(document: pdf_document.Document) -> NameComponents | None:
     date_box = text_boxes.find_box_starting_with("Date : ")
     assert date_box is not None
 
-    payslip_date = dateparser.parse(date_box[7:], languages=["en"])
+    payslip_date = parse_date(date_box[7:], languages=["en"])
     assert payslip_date is not None
 
     return NameComponents(payslip_date, _SERVICE, account_holder_name, "Payslip")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Facebook UK Ltd",))
 def pre_adp_p60(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if len(first_page) < 4:
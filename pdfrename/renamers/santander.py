@@ -7,15 +7,15 @@ import logging
 import re
 from collections.abc import Sequence
 
-import dateparser
 from more_itertools import one
 
 from ..doctypes.en import CREDIT_CARD_STATEMENT, STATEMENT, STATEMENT_OF_FEES
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.renamer import NameComponents, VendorGroup, pdfrenamer
 from ..lib.utils import (
     extract_account_holder_from_address,
     normalize_account_holder_name,
+    parse_date,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +37,9 @@ def _extract_account_holders(address_box: str) -> Sequence[str]:
         return (extracted_name,)
 
 
-@pdfrenamer
+@pdfrenamer(
+    min_pages=2, markers=("Select Current Account", "1l2l3 Current Account earnings")
+)
 def current_account_statement(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("santander.current_account_statement")
     text_boxes = document[1]
@@ -71,14 +73,14 @@ def current_account_statement(document: pdf_document.Document) -> NameComponents
     period_line = text_boxes.find_box_starting_with("Your account summary for  \n")
     assert period_line is not None
 
-    logger.debug(f"found period specification: {period_line!r}")
+    logger.debug("found period specification: %r", period_line)
 
     period_match = re.match(
         rf"^Your account summary for  \n{_DATE_REGEX_COMPONENT} to ({_DATE_REGEX_COMPONENT})\n$",
         period_line,
     )
     assert period_match
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
     assert statement_date is not None
 
     return NameComponents(
@@ -91,12 +93,35 @@ def current_account_statement(document: pdf_document.Document) -> NameComponents
     )
 
 
-@pdfrenamer
-def credit_card_statement(document: pdf_document.Document) -> NameComponents | None:
+# Older statements have a trailing space in the title, 2023 ones don't.
+_CREDIT_CARD_TITLE = "Santander Credit Card \n"
+_CREDIT_CARD_TITLE_2023 = "Santander Credit Card\n"
+
+
+def _find_credit_card_titles(
+    document: pdf_document.Document,
+) -> frozenset[str] | None:
+    titles = frozenset(
+        box
+        for box in document[1]
+        if box in (_CREDIT_CARD_TITLE, _CREDIT_CARD_TITLE_2023)
+    )
+    return titles or None
+
+
+_CREDIT_CARD: VendorGroup[frozenset[str]] = VendorGroup(
+    _find_credit_card_titles, markers=(_CREDIT_CARD_TITLE, _CREDIT_CARD_TITLE_2023)
+)
+
+
+@_CREDIT_CARD.pdfrenamer
+def credit_card_statement(
+    document: pdf_document.Document, titles: frozenset[str]
+) -> NameComponents | None:
     logger = _LOGGER.getChild("santander.credit_card_statement")
     text_boxes = document[1]
 
-    if "Santander Credit Card \n" not in text_boxes:
+    if _CREDIT_CARD_TITLE not in titles:
         return None
 
     # Could be an annual statement, look for it.
@@ -112,14 +137,14 @@ def credit_card_statement(document: pdf_document.Document) -> NameComponents | N
     statement_period_line = text_boxes.find_box_starting_with("Account summary as at:")
     assert statement_period_line is not None
 
-    logger.debug(f"found period specification: {statement_period_line!r}")
+    logger.debug("found period specification: %r", statement_period_line)
 
     period_match = re.match(
         rf"^Account summary as at: ({_DATE_REGEX_COMPONENT}) for card number ending ([0-9]{{4}})\n$",
         statement_period_line,
     )
     assert period_match
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
 
     assert statement_date is not None
 
@@ -132,19 +157,14 @@ def credit_card_statement(document: pdf_document.Document) -> NameComponents | N
     )
 
 
-@pdfrenamer
+@_CREDIT_CARD.pdfrenamer
 def credit_card_annual_statement(
-    document: pdf_document.Document,
+    document: pdf_document.Document, titles: frozenset[str]
 ) -> NameComponents | None:
     logger = _LOGGER.getChild("credit_card_annual_statement")
 
     first_page = document[1]
 
-    if not any(
-        first_page.find_all_matching_regex(re.compile("^Santander Credit Card ?\n$"))
-    ):
-        return None
-
     try:
         annual_statement_match = one(
             first_page.find_all_matching_regex(
@@ -170,7 +190,7 @@ def credit_card_annual_statement(
         # Always include the account holder name, which is found in the second text box.
         account_holder_name = extract_account_holder_from_address(first_page[1])
 
-    statement_date = dateparser.parse(
+    statement_date = parse_date(
         annual_statement_match.group("statement_end_date"), languages=["en"]
     )
     assert statement_date is not None
@@ -186,14 +206,14 @@ def credit_card_annual_statement(
     )
 
 
-@pdfrenamer
+@_CREDIT_CARD.pdfrenamer
 def credit_card_statement_2023(
-    document: pdf_document.Document,
+    document: pdf_document.Document, titles: frozenset[str]
 ) -> NameComponents | None:
     logger = _LOGGER.getChild("santander.credit_card")
     text_boxes = document[1]
 
-    if "Santander Credit Card\n" not in text_boxes:
+    if _CREDIT_CARD_TITLE_2023 not in titles:
         return None
 
     if (
@@ -207,14 +227,14 @@ def credit_card_statement_2023(
     # Always include the account holder name, which is found in the first text box.
     account_holder_name = extract_account_holder_from_address(text_boxes[0])
 
-    logger.debug(f"found period specification: {statement_period_line!r}")
+    logger.debug("found period specification: %r", statement_period_line)
 
     period_match = re.match(
         rf"^Account summary as at: ({_DATE_REGEX_COMPONENT}) for card number ending ([0-9]{{4}})\n$",
         statement_period_line,
     )
     assert period_match
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
 
     assert statement_date is not None
 
@@ -227,7 +247,7 @@ def credit_card_statement_2023(
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Santander UK plc",))
 def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("santander.statement_of_fees")
     text_boxes = document[1]
@@ -240,7 +260,7 @@ def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
 
     # Always include the account holder name, which is found in the fourth text box.
     address_box = text_boxes[3]
-    logger.debug(f"Found address: {address_box!r}")
+    logger.debug("Found address: %r", address_box)
     account_holders = _extract_account_holders(address_box)
 
     # Find the account this refers to. It's the text box after the title column.
@@ -263,7 +283,7 @@ def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Your Account Summary for",))
 def annual_account_summary(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("santander.annual_account_summary")
     text_boxes = document[1]
@@ -286,8 +306,8 @@ def annual_account_summary(document: pdf_document.Document) -> NameComponents |
 
     # account_type = text_boxes[30].split(":", 1)[0].strip().title()
 
-    logger.debug(f"found period specification: {annual_account_summary_period_line!r}")
-    logger.debug(f"possible account: {text_boxes[30]}")
+    logger.debug("found period specification: %r", annual_account_summary_period_line)
+    logger.debug("possible account: %s", text_boxes[30])
 
     period_match = re.match(
         rf"^Your Account Summary for {_DATE_REGEX_COMPONENT} to ({_DATE_REGEX_COMPONENT})\n$",
@@ -296,7 +316,7 @@ def annual_account_summary(document: pdf_document.Document) -> NameComponents |
     if not period_match:
         return None
 
-    statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+    statement_date = parse_date(period_match.group(1), languages=["en"])
     assert statement_date is not None
 
     return NameComponents(
@@ -307,7 +327,7 @@ def annual_account_summary(document: pdf_document.Document) -> NameComponents |
     )
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Call us on: 0330 9 123 123",))
 def notice_of_electronic_funds_transfer(
     document: pdf_document.Document,
 ) -> NameComponents | None:
@@ -327,7 +347,7 @@ def notice_of_electronic_funds_transfer(
     account_number_index = first_page.index(account_number_box.group(0))
     account_number = account_number_box.group(1)
 
-    date = dateparser.parse(first_page[account_number_index + 1], languages=["en"])
+    date = parse_date(first_page[account_number_index + 1], languages=["en"])
     assert date is not None
 
     account_holder_re = re.compile(r"^Dear (.*)\n$")
@@ -5,11 +5,10 @@
 import logging
 import re
 
-import dateparser
-
 from ..doctypes.en import INVOICE
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.utils import parse_date
 
 _LOGGER = logging.getLogger("scaleway")
 
@@ -71,7 +70,7 @@ def invoice(document: pdf_document.Document) -> NameComponents | None:
         assert date_match
         date_str = date_match.group(1)
 
-    bill_date = dateparser.parse(date_str)
+    bill_date = parse_date(date_str)
     assert bill_date is not None
 
     return NameComponents(
@@ -6,11 +6,9 @@ import datetime
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,12 +41,12 @@ def _find_statement_date(
         assert period_match
         period_end_str = period_match.group(1)
 
-    date = dateparser.parse(period_end_str, languages=["en"])
+    date = parse_date(period_end_str, languages=["en"])
     assert date is not None
     return date
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Schwab One", "Charles Schwab & Co., Inc. All rights reserved."))
 def letter(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if not first_page:
@@ -96,7 +94,7 @@ def letter(document: pdf_document.Document) -> NameComponents | None:
                 year_end_gain_losses[0],
             )
             assert date_match  # Else we don't have the right document.
-            document_date = dateparser.parse(date_match.group(1), languages=["en"])
+            document_date = parse_date(date_match.group(1), languages=["en"])
             document_type = "Year End Gain-Losses Report"
         elif year_end_summary:
             logger.debug("Year End Summary")
@@ -108,7 +106,7 @@ def letter(document: pdf_document.Document) -> NameComponents | None:
             )
             assert date_match
 
-            document_date = dateparser.parse(date_match.group(1), languages=["en"])
+            document_date = parse_date(date_match.group(1), languages=["en"])
             document_type = "Year End Summary"
         else:
             logger.debug("Schwab One brokerage account statement.")
@@ -131,7 +129,7 @@ def letter(document: pdf_document.Document) -> NameComponents | None:
             date_str = first_page[0].split("\n")[0]
             logger.debug("Found date: %r", date_str)
 
-            letter_date = dateparser.parse(date_str, languages=["en"])
+            letter_date = parse_date(date_str, languages=["en"])
 
             # The address is two boxes before the "Dear Client,".
             address_index = first_page.index("Dear Client,\n") - 3
@@ -141,7 +139,7 @@ def letter(document: pdf_document.Document) -> NameComponents | None:
             )
         else:
             account_holder = extract_account_holder_from_address(first_page[0])
-            letter_date = dateparser.parse(first_page[1], languages=["en"])
+            letter_date = parse_date(first_page[1], languages=["en"])
 
         assert account_holder
         assert letter_date is not None
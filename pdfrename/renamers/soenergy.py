@@ -6,11 +6,9 @@
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 _DOCUMENT_TYPES = {
@@ -19,7 +17,7 @@ _DOCUMENT_TYPES = {
 }
 
 
-@pdfrenamer
+@pdfrenamer(markers=("www.so.energy",))
 def bills_2019(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("soenergy.bills_2019")
     text_boxes = document[1]
@@ -29,7 +27,7 @@ def bills_2019(document: pdf_document.Document) -> NameComponents | None:
             if subject in text_boxes:
                 break
         else:
-            logger.debug(f"Unknown document type. Subject: {text_boxes!r}")
+            logger.debug("Unknown document type. Subject: %r", text_boxes)
             return None
 
         subject_index = text_boxes.index(subject)
@@ -39,13 +37,13 @@ def bills_2019(document: pdf_document.Document) -> NameComponents | None:
         account_holder_name = extract_account_holder_from_address(address_box)
 
         period_line = text_boxes[subject_index + 1]
-        logger.debug(f"found period specification: {period_line!r}")
+        logger.debug("found period specification: %r", period_line)
         period_match = re.match(
             r"^For the period of [0-9]{1,2} [A-Z][a-z]{2} [0-9]{4} - ([0-9]{1,2} [A-Z][a-z]{2} [0-9]{4})\\n$",
             period_line,
         )
         assert period_match
-        statement_date = dateparser.parse(period_match.group(1), languages=["en"])
+        statement_date = parse_date(period_match.group(1), languages=["en"])
         assert statement_date is not None
 
         return NameComponents(
@@ -61,7 +59,8 @@ def bills_2019(document: pdf_document.Document) -> NameComponents | None:
 
     if annual_electricity_summary_period_line:
         logger.debug(
-            f"Found annual electricity summary period line {annual_electricity_summary_period_line!r}"
+            "Found annual electricity summary period line %r",
+            annual_electricity_summary_period_line,
         )
 
         account_holder_name = extract_account_holder_from_address(text_boxes[0])
@@ -72,7 +71,7 @@ def bills_2019(document: pdf_document.Document) -> NameComponents | None:
         )
         assert date_match
 
-        statement_date = dateparser.parse(date_match.group(1), languages=["en"])
+        statement_date = parse_date(date_match.group(1), languages=["en"])
         assert statement_date is not None
 
         return NameComponents(
@@ -88,7 +87,12 @@ _DOCUMENT_TYPES_2021 = {
 }
 
 
-@pdfrenamer
+@pdfrenamer(
+    cost=RenamerCost.LATER_PAGES,
+    min_pages=3,
+    markers=("SoEnergyUK",),
+    marker_pages=(3,),
+)
 def bills_2021(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bills_2021")
 
@@ -104,7 +108,7 @@ def bills_2021(document: pdf_document.Document) -> NameComponents | None:
     document_type_box = first_page.find_box_starting_with("HELLO ")
     assert document_type_box is not None
 
-    logger.debug(f"Found likely SoEnergy Document ({document_type_box!r})")
+    logger.debug("Found likely SoEnergy Document (%r)", document_type_box)
 
     for document_type, expression in _DOCUMENT_TYPES_2021.items():
         if expression.search(document_type_box):
@@ -112,17 +116,17 @@ def bills_2021(document: pdf_document.Document) -> NameComponents | None:
     else:
         return None
 
-    logger.debug(f"Found a SoEnergy {document_type}")
+    logger.debug("Found a SoEnergy %s", document_type)
 
     date_box = first_page.find_box_starting_with("Created On\n")
     assert date_box is not None
-    logger.debug(f"Statement date box: {date_box!r}")
+    logger.debug("Statement date box: %r", date_box)
     date_idx = first_page.index(date_box)
-    statement_date = dateparser.parse(date_box.split("\n")[1], languages=["en"])
+    statement_date = parse_date(date_box.split("\n")[1], languages=["en"])
     assert statement_date is not None
 
     address_box = first_page[date_idx - 1]
-    logger.debug(f"Address box: {address_box!r}")
+    logger.debug("Address box: %r", address_box)
     account_holder_name = extract_account_holder_from_address(address_box)
 
     return NameComponents(
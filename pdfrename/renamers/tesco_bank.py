@@ -4,14 +4,16 @@
 
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table, extract_account_holder_from_address
+from ..lib.utils import (
+    build_dict_from_fake_table,
+    extract_account_holder_from_address,
+    parse_date,
+)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Tesco Bank", "tescobank.com/mmc"))
 def tesco_bank(document: pdf_document.Document) -> NameComponents | None:
     text_boxes = document[1]
     if not text_boxes:
@@ -35,7 +37,7 @@ def tesco_bank(document: pdf_document.Document) -> NameComponents | None:
         )
         assert tax_year_match
 
-        document_date = dateparser.parse(tax_year_match.group(1))
+        document_date = parse_date(tax_year_match.group(1))
         assert document_date is not None
 
         return NameComponents(
@@ -62,9 +64,7 @@ def tesco_bank(document: pdf_document.Document) -> NameComponents | None:
 
     statement_info = build_dict_from_fake_table(fields_box, values_box)
 
-    statement_date = dateparser.parse(
-        statement_info["Statement date:"], languages=["en"]
-    )
+    statement_date = parse_date(statement_info["Statement date:"], languages=["en"])
     assert statement_date is not None
 
     return NameComponents(
@@ -2,15 +2,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import dataclasses
 import datetime
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.renamer import NameComponents, VendorGroup
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,30 +28,57 @@ def _extract_date(date_box: str) -> datetime.datetime:
     date_match = re.search("\n([0-9]{1,2} [A-Z][a-z]+ [0-9]{4})\n", date_box)
     assert date_match
 
-    document_date = dateparser.parse(date_match.group(1), languages=["en"])
+    document_date = parse_date(date_match.group(1), languages=["en"])
     assert document_date is not None
 
     return document_date
 
 
-@pdfrenamer
-def bill(
-    document: pdf_document.Document,
-) -> NameComponents | None:
-    logger = _LOGGER.getChild("bill")
+@dataclasses.dataclass(frozen=True)
+class _Markers:
+    # The bottom box of the first page links to TW's website.
+    website_in_last_box: bool
+    # A box is exactly the link to the online account.
+    myaccount_box: bool
+    # A box includes the link to the online account.
+    myaccount_link: bool
+    # The bottom box of the first page includes the company name, as letters do.
+    company_in_last_box: bool
+
 
+def _find_markers(document: pdf_document.Document) -> _Markers | None:
     text_boxes = document[1]
     if not text_boxes:
         return None
 
-    # There are at least two different possible boxes as the bottom of page 1 since 2017,
-    # but they all include a link to TW's website.
-    is_thameswater = (
-        "thameswater.co.uk/" in text_boxes[-1]
-        or "thameswater.co.uk/myaccount\n" in text_boxes
+    markers = _Markers(
+        website_in_last_box="thameswater.co.uk/" in text_boxes[-1],
+        myaccount_box="thameswater.co.uk/myaccount\n" in text_boxes,
+        myaccount_link=any(
+            "thameswater.co.uk/myaccount\n" in box for box in text_boxes
+        ),
+        company_in_last_box="Thames Water Utilities Limited," in text_boxes[-1],
     )
+    if not any(dataclasses.astuple(markers)):
+        return None
+
+    return markers
+
+
+_THAMES_WATER: VendorGroup[_Markers] = VendorGroup(
+    _find_markers, markers=("thameswater.co.uk/", "Thames Water Utilities Limited,")
+)
+
+
+@_THAMES_WATER.pdfrenamer
+def bill(document: pdf_document.Document, markers: _Markers) -> NameComponents | None:
+    logger = _LOGGER.getChild("bill")
+
+    text_boxes = document[1]
 
-    if not is_thameswater:
+    # There are at least two different possible boxes as the bottom of page 1 since 2017,
+    # but they all include a link to TW's website.
+    if not markers.website_in_last_box and not markers.myaccount_box:
         return None
 
     # This is a marker that the bill is from the new (2021) system that is different from
@@ -83,7 +109,7 @@ def bill(
         document_subject_index = 7
 
     document_subject = text_boxes[document_subject_index]
-    logger.debug(f"document subject: {document_subject!r}")
+    logger.debug("document subject: %r", document_subject)
 
     document_type = _DOCUMENT_TYPES.get(document_subject, "Other")
 
@@ -103,14 +129,14 @@ def bill(
     )
 
 
-@pdfrenamer
-def bill_2022(document: pdf_document.Document) -> NameComponents | None:
-    text_boxes = document[1]
-    if not text_boxes:
+@_THAMES_WATER.pdfrenamer
+def bill_2022(
+    document: pdf_document.Document, markers: _Markers
+) -> NameComponents | None:
+    if not markers.myaccount_link:
         return None
 
-    if not any("thameswater.co.uk/myaccount\n" in box for box in text_boxes):
-        return None
+    text_boxes = document[1]
 
     # Old bill (2021 and earlier), or newer bills (2023). Ignore it.
     if text_boxes[0].startswith("Page 1 of "):
@@ -131,14 +157,14 @@ def bill_2022(document: pdf_document.Document) -> NameComponents | None:
     return NameComponents(document_date, "Thames Water", account_holder_name, "Bill")
 
 
-@pdfrenamer
-def bill_2023(document: pdf_document.Document) -> NameComponents | None:
-    text_boxes = document[1]
-    if not text_boxes:
+@_THAMES_WATER.pdfrenamer
+def bill_2023(
+    document: pdf_document.Document, markers: _Markers
+) -> NameComponents | None:
+    if not markers.myaccount_link:
         return None
 
-    if not any("thameswater.co.uk/myaccount\n" in box for box in text_boxes):
-        return None
+    text_boxes = document[1]
 
     # 2022 bills have the address as first box.
     if not text_boxes[0].startswith("Page 1 of "):
@@ -160,19 +186,20 @@ def bill_2023(document: pdf_document.Document) -> NameComponents | None:
     return NameComponents(document_date, "Thames Water", account_holder_name, "Bill")
 
 
-@pdfrenamer
-def letter(document: pdf_document.Document) -> NameComponents | None:
+@_THAMES_WATER.pdfrenamer
+def letter(document: pdf_document.Document, markers: _Markers) -> NameComponents | None:
     logger = _LOGGER.getChild("thameswater.letter")
-    text_boxes = document[1]
 
-    if not text_boxes or "Thames Water Utilities Limited," not in text_boxes[-1]:
+    if not markers.company_in_last_box:
         return None
 
+    text_boxes = document[1]
+
     date_line = text_boxes.find_box_starting_with("Date\n")
     if not date_line:
         return None
 
-    logger.debug(f"found date line: {date_line!r}")
+    logger.debug("found date line: %r", date_line)
     document_date = _extract_date(date_line)
 
     account_holder_name = extract_account_holder_from_address(text_boxes[0])
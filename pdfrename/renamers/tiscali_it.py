@@ -8,7 +8,7 @@ from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Tiscali Italia S.p.A.",))
 def fattura_aziendale_2010(document: pdf_document.Document) -> NameComponents | None:
 
     if not (first_page := document[1]):
@@ -5,17 +5,15 @@
 import datetime
 from typing import Final
 
-import dateparser
-
 from ..doctypes.en import STATEMENT, STATEMENT_OF_FEES
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _TSB_SERVICE: Final[str] = "TSB Bank"
 
 
-@pdfrenamer
+@pdfrenamer(markers=("www.tsb.co.uk",))
 def statement(document: pdf_document.Document) -> NameComponents | None:
     text_boxes = document[1]
     if not text_boxes or "www.tsb.co.uk\n" not in text_boxes:
@@ -34,7 +32,7 @@ def statement(document: pdf_document.Document) -> NameComponents | None:
     return NameComponents(date, _TSB_SERVICE, name, STATEMENT)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("TSB Bank plc Registered Office:",))
 def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
     if not first_page:
@@ -53,7 +51,7 @@ def statement_of_fees(document: pdf_document.Document) -> NameComponents | None:
     assert period_line_idx is not None
     date_string = first_page[period_line_idx + 1]
 
-    date = dateparser.parse(date_string, languages=["en"])
+    date = parse_date(date_string, languages=["en"])
     assert date is not None
 
     account_label_index = first_page.index("Account\n")
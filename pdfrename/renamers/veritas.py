@@ -9,13 +9,13 @@ import re
 from more_itertools import one
 
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
 from ..lib.utils import build_dict_from_fake_table
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Veritas spa",))
 def bolletta_2022(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bolletta_2022")
 
@@ -31,7 +31,7 @@ def bolletta_2022(document: pdf_document.Document) -> NameComponents | None:
 
     account_holder_box = first_page.find_box_starting_with("Intestatario contratto \n")
     assert account_holder_box
-    logger.debug(f"Veritas account holder box: {account_holder_box!r}")
+    logger.debug("Veritas account holder box: %r", account_holder_box)
     account_holder = account_holder_box.split("\n")[1]
 
     try:
@@ -48,7 +48,7 @@ def bolletta_2022(document: pdf_document.Document) -> NameComponents | None:
 
     bill_type = details_match.group("bill_type").strip().title()
     date_str = details_match.group("date")
-    logger.debug(f"Veritas date string: {date_str}")
+    logger.debug("Veritas date string: %s", date_str)
     date = datetime.datetime.strptime(date_str, "%d.%m.%Y")
 
     account_id_box = first_page.find_box_starting_with("codice utente ")
@@ -64,7 +64,12 @@ def bolletta_2022(document: pdf_document.Document) -> NameComponents | None:
     )
 
 
-@pdfrenamer
+@pdfrenamer(
+    cost=RenamerCost.LATER_PAGES,
+    min_pages=4,
+    markers=("Veritas", "gruppoveritas"),
+    marker_pages=(3, 4),
+)
 def bolletta_idrico_2019(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bolletta_idrico_2019")
 
@@ -94,14 +99,14 @@ def bolletta_idrico_2019(document: pdf_document.Document) -> NameComponents | No
         return None
 
     account_holder_box = second_page.find_box_starting_with("Fattura Intestata a:\n")
-    logger.debug(f"Found account holder box: {account_holder_box!r}")
+    logger.debug("Found account holder box: %r", account_holder_box)
     if not account_holder_box:
         return None
     account_holder = account_holder_box.split("\n")[1]
 
     bill_type_box = first_page.find_box_starting_with("Fattura per la fornitura del")
     assert bill_type_box
-    logger.debug(f"Found bill type box: {bill_type_box!r}")
+    logger.debug("Found bill type box: %r", bill_type_box)
     bill_type_match = re.match(
         "^Fattura per la fornitura del (.+) erogato in", bill_type_box
     )
@@ -120,7 +125,12 @@ def bolletta_idrico_2019(document: pdf_document.Document) -> NameComponents | No
     return NameComponents(date, f"Veritas ({bill_type})", account_holder, "Bolletta")
 
 
-@pdfrenamer
+@pdfrenamer(
+    cost=RenamerCost.LATER_PAGES,
+    min_pages=4,
+    markers=("Veritas", "gruppoveritas"),
+    marker_pages=(3, 4),
+)
 def avviso_pagamento_rifiuti_2019(
     document: pdf_document.Document,
 ) -> NameComponents | None:
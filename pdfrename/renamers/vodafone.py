@@ -7,16 +7,18 @@ import datetime
 import logging
 import re
 
-import dateparser
-
 from ..lib import pdf_document
 from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import build_dict_from_fake_table, extract_account_holder_from_address
+from ..lib.utils import (
+    build_dict_from_fake_table,
+    extract_account_holder_from_address,
+    parse_date,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Registered address: Vodafone Limited,",))
 def bill(document: pdf_document.Document) -> NameComponents | None:
     text_boxes = document[1]
 
@@ -32,7 +34,7 @@ def bill(document: pdf_document.Document) -> NameComponents | None:
     date_match = re.match(r"^([0-9]{1,2} [A-Z][a-z]+ [0-9]{4})", text_boxes[0])
     assert date_match
 
-    bill_date = dateparser.parse(date_match.group(1), languages=["en"])
+    bill_date = parse_date(date_match.group(1), languages=["en"])
     assert bill_date is not None
 
     return NameComponents(bill_date, "Vodafone", account_holder_name, "Bill")
@@ -40,13 +42,13 @@ def bill(document: pdf_document.Document) -> NameComponents | None:
 
 def _extract_italian_date(invoice_box: str) -> datetime.datetime:
     _, date_str = invoice_box.split(" del ")
-    date = dateparser.parse(date_str, languages=["it"])
+    date = parse_date(date_str, languages=["it"])
     assert date
 
     return date
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Vodafone per te",))
 def bill_italy(document: pdf_document.Document) -> NameComponents | None:
     logger = _LOGGER.getChild("bill_italy")
 
@@ -70,13 +72,13 @@ def bill_italy(document: pdf_document.Document) -> NameComponents | None:
     )
 
     date_box = details["Fattura non fiscale"]
-    logger.debug(f"Vodafone Italy date box: {date_box!r}")
+    logger.debug("Vodafone Italy date box: %r", date_box)
     date = _extract_italian_date(date_box)
 
     return NameComponents(date, "Vodafone", account_holder, "Fattura")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("voda.it/guidafattura",))
 def bill_italy_2022(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -14,7 +14,7 @@ def _wind_or_windtre(box: str) -> bool:
     return box.startswith("Wind Telecomunicazioni S.p.A. - ")
 
 
-@pdfrenamer
+@pdfrenamer(markers=("Wind Telecomunicazioni S.p.A. -",))
 def bolletta_2006(document: pdf_document.Document) -> NameComponents | None:
     first_page = document[1]
 
@@ -4,33 +4,38 @@
 
 import logging
 
-import dateparser
-
 from ..lib import pdf_document
-from ..lib.renamer import NameComponents, pdfrenamer
-from ..lib.utils import extract_account_holder_from_address
+from ..lib.renamer import NameComponents, RenamerCost, pdfrenamer
+from ..lib.utils import extract_account_holder_from_address, parse_date
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@pdfrenamer
-def invoice(document: pdf_document.Document) -> NameComponents | None:
-    logger = _LOGGER.getChild("xero.invoice")
-
+def _is_invoice(document: pdf_document.Document) -> bool:
     if document.producer != b"Aspose.Pdf for .NET 6.6":
-        return None
+        return False
 
-    logger.debug("Found a document generated by Aspose.Pdf, could be a Xero invoice.")
+    _LOGGER.debug("Found a document generated by Aspose.Pdf, could be a Xero invoice.")
+
+    text_boxes = document[1]
+    return (
+        text_boxes[0] == "TAX INVOICE\n"
+        and text_boxes.find_box_starting_with("Invoice Date\n") is not None
+        and text_boxes.find_box_starting_with("Invoice Number\n") is not None
+    )
+
+
+@pdfrenamer(detect=_is_invoice, cost=RenamerCost.FIRST_PAGE)
+def invoice(document: pdf_document.Document) -> NameComponents | None:
+    logger = _LOGGER.getChild("xero.invoice")
 
     text_boxes = document[1]
-    if text_boxes[0] != "TAX INVOICE\n":
-        return None
 
     invoice_date_box = text_boxes.find_box_starting_with("Invoice Date\n")
     if invoice_date_box is None:
         return None
 
-    invoice_date = dateparser.parse(invoice_date_box.split("\n")[1], languages=["en"])
+    invoice_date = parse_date(invoice_date_box.split("\n")[1], languages=["en"])
     if invoice_date is None:
         return None
 
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import pathlib
+import tarfile
+import zipfile
+from typing import Literal
+
+import pytest
+
+from pdfrename.lib import archives
+
+_MEMBERS = {
+    "bills/first.pdf": b"%PDF-first",
+    "bills/SECOND.PDF": b"%PDF-second",
+    "bills/renamed.pdf": b"%PDF-existing",
+    "notes.txt": b"not a PDF",
+}
+
+
+def _write_zip(path: pathlib.Path) -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.mkdir("bills")
+        for name, data in _MEMBERS.items():
+            archive.writestr(name, data)
+
+
+def _write_tar(path: pathlib.Path, mode: Literal["w", "w:gz"]) -> None:
+    with tarfile.open(path, mode) as archive:
+        directory = tarfile.TarInfo("bills")
+        directory.type = tarfile.DIRTYPE
+        archive.addfile(directory)
+        for name, data in _MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+def _write_archive(path: pathlib.Path) -> None:
+    if path.suffix == ".zip":
+        _write_zip(path)
+    elif path.suffix == ".tar":
+        _write_tar(path, "w")
+    else:
+        _write_tar(path, "w:gz")
+
+
+def _read_archive(path: pathlib.Path) -> dict[str, bytes]:
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            return {
+                info.filename: archive.read(info)
+                for info in archive.infolist()
+                if not info.is_dir()
+            }
+
+    with tarfile.open(path) as tar_archive:
+        members = {}
+        for member in tar_archive:
+            if (member_file := tar_archive.extractfile(member)) is not None:
+                members[member.name] = member_file.read()
+        return members
+
+
+@pytest.mark.parametrize(
+    "name, is_archive",
+    [
+        ("bills.zip", True),
+        ("bills.ZIP", True),
+        ("bills.tar.gz", True),
+        ("bills.tgz", True),
+        ("bills.tar.xz", True),
+        ("bills.pdf", False),
+        ("bills.gz", False),
+    ],
+)
+def test_is_archive(name: str, is_archive: bool) -> None:
+    assert archives.is_archive(pathlib.Path(name)) == is_archive
+
+
+@pytest.mark.parametrize(
+    "name, renamed",
+    [
+        ("bills.zip", "bills.renamed.zip"),
+        ("bills.TAR.GZ", "bills.renamed.TAR.GZ"),
+        ("bills.tar", "bills.renamed.tar"),
+    ],
+)
+def test_renamed_archive_path(name: str, renamed: str) -> None:
+    path = pathlib.Path("archives", name)
+    assert archives.renamed_archive_path(path) == pathlib.Path("archives", renamed)
+
+
+@pytest.mark.parametrize("name", ["bills.zip", "bills.tar", "bills.tar.gz"])
+def test_iter_pdf_members(tmp_path: pathlib.Path, name: str) -> None:
+    path = tmp_path / name
+    _write_archive(path)
+
+    assert dict(archives.iter_pdf_members(path)) == {
+        name: data for name, data in _MEMBERS.items() if name != "notes.txt"
+    }
+
+
+@pytest.mark.parametrize("name", ["bills.zip", "bills.tar", "bills.tar.gz"])
+def test_write_renamed_archive(tmp_path: pathlib.Path, name: str) -> None:
+    source = tmp_path / name
+    _write_archive(source)
+    destination = archives.renamed_archive_path(source)
+
+    archives.write_renamed_archive(
+        source,
+        destination,
+        {
+            "bills/first.pdf": "2024-01-01 - First.pdf",
+            # Already in use, so not renamed.
+            "bills/SECOND.PDF": "renamed.pdf",
+        },
+    )
+
+    assert _read_archive(destination) == {
+        "bills/2024-01-01 - First.pdf": b"%PDF-first",
+        "bills/SECOND.PDF": b"%PDF-second",
+        "bills/renamed.pdf": b"%PDF-existing",
+        "notes.txt": b"not a PDF",
+    }
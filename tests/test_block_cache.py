@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import io
+
+from pdfrename.lib import block_cache
+
+_BLOCK_SIZE = 16
+_DATA = bytes(range(256)) * 2
+
+
+def _open(**kwargs: int) -> block_cache.BlockCachedReader:
+    kwargs.setdefault("block_size", _BLOCK_SIZE)
+    return block_cache.BlockCachedReader(io.BytesIO(_DATA), **kwargs)
+
+
+def test_reads_across_block_boundaries() -> None:
+    reader = _open(tail_blocks=1, readahead_blocks=0)
+
+    reader.seek(_BLOCK_SIZE - 3)
+    assert reader.read(6) == _DATA[_BLOCK_SIZE - 3 : _BLOCK_SIZE + 3]
+
+    reader.seek(2 * _BLOCK_SIZE)
+    assert reader.read(_BLOCK_SIZE) == _DATA[2 * _BLOCK_SIZE : 3 * _BLOCK_SIZE]
+
+    reader.seek(0)
+    assert reader.read() == _DATA
+
+
+def test_reads_past_end() -> None:
+    reader = _open()
+
+    reader.seek(len(_DATA) - 4)
+    assert reader.read(10) == _DATA[-4:]
+    assert reader.read(10) == b""
+
+    reader.seek(len(_DATA) + 10)
+    assert reader.read() == b""
+
+
+def test_tail_is_read_at_once() -> None:
+    reader = _open(tail_blocks=3)
+
+    reader.seek(-1, io.SEEK_END)
+    assert reader.read(1) == _DATA[-1:]
+    assert reader.stats.raw_reads == 1
+    assert reader.stats.raw_bytes == 3 * _BLOCK_SIZE
+
+    reader.seek(-3 * _BLOCK_SIZE, io.SEEK_END)
+    assert reader.read() == _DATA[-3 * _BLOCK_SIZE :]
+    assert reader.stats.raw_reads == 1
+
+
+def test_sequential_reads_read_ahead() -> None:
+    reader = _open(tail_blocks=1, readahead_blocks=2)
+
+    assert reader.read(_BLOCK_SIZE) == _DATA[:_BLOCK_SIZE]
+    assert reader.stats.raw_reads == 1
+
+    # The second block is sequential, so it's read with the two following ones.
+    assert reader.read(3 * _BLOCK_SIZE) == _DATA[_BLOCK_SIZE : 4 * _BLOCK_SIZE]
+    assert reader.stats.raw_reads == 2
+    assert reader.stats.raw_bytes == 4 * _BLOCK_SIZE
+
+
+def test_evicts_least_recently_used() -> None:
+    reader = _open(max_blocks=2, tail_blocks=1, readahead_blocks=0)
+
+    for block in (0, 5, 0, 10):
+        reader.seek(block * _BLOCK_SIZE)
+        reader.read(1)
+
+    # Block 5 was the least recently used, so it's read again.
+    assert reader.stats.misses == 3
+    reader.seek(0)
+    reader.read(1)
+    assert reader.stats.misses == 3
+    reader.seek(5 * _BLOCK_SIZE)
+    reader.read(1)
+    assert reader.stats.misses == 4
+
+
+def test_readahead_larger_than_cache() -> None:
+    reader = _open(max_blocks=1, tail_blocks=1, readahead_blocks=4)
+
+    reader.read(1)
+    # A sequential read fetches more blocks than the cache was asked to hold, and
+    # the requested block must not be evicted by its own readahead.
+    reader.seek(_BLOCK_SIZE)
+    assert reader.read(_BLOCK_SIZE) == _DATA[_BLOCK_SIZE : 2 * _BLOCK_SIZE]
+
+
+def test_tail_larger_than_cache() -> None:
+    reader = _open(max_blocks=1, tail_blocks=4, readahead_blocks=0)
+
+    reader.seek(-4 * _BLOCK_SIZE, io.SEEK_END)
+    assert reader.read() == _DATA[-4 * _BLOCK_SIZE :]
+    assert reader.stats.raw_reads == 1
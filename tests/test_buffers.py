@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import mmap
+import pathlib
+
+import pytest
+
+from pdfrename.lib import buffers
+
+
+def test_read_and_seek() -> None:
+    reader = buffers.open_buffer(b"0123456789")
+
+    assert reader.read(3) == b"012"
+    assert reader.tell() == 3
+    assert reader.seek(-2, io.SEEK_END) == 8
+    assert reader.read() == b"89"
+    assert reader.read(1) == b""
+
+    reader.seek(20)
+    assert reader.read(1) == b""
+
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+
+def test_read_after_close() -> None:
+    reader = buffers.open_buffer(bytearray(b"data"))
+    reader.close()
+
+    with pytest.raises(ValueError):
+        reader.read()
+
+
+def test_close_leaves_caller_mapping_open(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"mapped data")
+
+    with path.open("rb") as source:
+        mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        reader = buffers.open_buffer(mapping)
+        assert reader.read(6) == b"mapped"
+        reader.close()
+
+        assert not mapping.closed
+        assert mapping[:6] == b"mapped"
+    finally:
+        mapping.close()
+
+
+def test_map_file_releases_mapping(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"mapped data")
+
+    reader = buffers.map_file(path)
+    assert isinstance(reader, buffers.BufferReader)
+    mapping = reader._buffer
+    assert reader.read() == b"mapped data"
+    reader.close()
+
+    assert isinstance(mapping, mmap.mmap)
+    assert mapping.closed
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import http.server
+import io
+import pathlib
+import re
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from pdfrename import api
+from pdfrename.bench import pdfwriter
+from pdfrename.lib import http_range, pdf_document
+
+_CONTENT = pdfwriter.write_pdf(
+    [pdfwriter.stacked_boxes(["Remote document", "Served in ranges"])],
+    info={"Title": "Remote"},
+)
+_RANGE = re.compile(r"bytes=(\d+)-(\d+)")
+_REDIRECTS = {"/redirect.pdf": "/presigned.pdf", "/loop.pdf": "/loop.pdf"}
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _send_content(self, *, head: bool) -> None:
+        match = _RANGE.fullmatch(self.headers.get("Range", ""))
+        if match is None or self.path == "/no-ranges.pdf":
+            body = _CONTENT
+            self.send_response(200)
+        else:
+            first, last = int(match.group(1)), int(match.group(2))
+            body = _CONTENT[first : last + 1]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {first}-{first + len(body) - 1}/{len(_CONTENT)}",
+            )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _redirect(self) -> bool:
+        if (location := _REDIRECTS.get(self.path)) is None:
+            return False
+
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def do_HEAD(self) -> None:
+        self.server.requests.append(self.path)  # type: ignore[attr-defined]
+        if self._redirect():
+            return
+
+        if self.path == "/presigned.pdf":
+            self.send_response(403)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send_content(head=True)
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)  # type: ignore[attr-defined]
+        if self._redirect():
+            return
+
+        if self.path == "/unavailable.pdf":
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/truncated.pdf":
+            self.send_response(206)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(_CONTENT[:10])
+            self.close_connection = True
+        elif self.path == "/garbled.pdf":
+            self.wfile.write(b"garbled\r\n\r\n")
+            self.close_connection = True
+        else:
+            self._send_content(head=False)
+
+
+@pytest.fixture
+def server() -> Iterator[http.server.ThreadingHTTPServer]:
+    with http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler) as server:
+        server.requests = []  # type: ignore[attr-defined]
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def _url(server: http.server.ThreadingHTTPServer, path: str) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host!s}:{port}{path}"
+
+
+def test_reads_ranges(server: http.server.ThreadingHTTPServer) -> None:
+    remote = http_range.HTTPRangeFile(_url(server, "/file.pdf"))
+
+    assert remote.size == len(_CONTENT)
+    remote.seek(-10, io.SEEK_END)
+    assert remote.read(10) == _CONTENT[-10:]
+    remote.seek(5)
+    assert remote.read(5) == _CONTENT[5:10]
+
+
+def test_size_from_content_range(server: http.server.ThreadingHTTPServer) -> None:
+    remote = http_range.HTTPRangeFile(_url(server, "/presigned.pdf"))
+
+    assert remote.size == len(_CONTENT)
+    assert remote.read(8) == _CONTENT[:8]
+
+
+def test_follows_redirects(server: http.server.ThreadingHTTPServer) -> None:
+    remote = http_range.HTTPRangeFile(_url(server, "/redirect.pdf"))
+
+    assert remote.size == len(_CONTENT)
+    assert remote.read(8) == _CONTENT[:8]
+    # Only the first request is redirected.
+    assert server.requests.count("/redirect.pdf") == 1  # type: ignore[attr-defined]
+
+
+def test_redirect_loop(server: http.server.ThreadingHTTPServer) -> None:
+    with pytest.raises(http_range.HTTPRangeError):
+        http_range.HTTPRangeFile(_url(server, "/loop.pdf"))
+
+
+def test_without_range_support(server: http.server.ThreadingHTTPServer) -> None:
+    remote = http_range.HTTPRangeFile(_url(server, "/no-ranges.pdf"))
+
+    assert remote.size == len(_CONTENT)
+    remote.seek(10)
+    assert remote.read(5) == _CONTENT[10:15]
+    assert remote.read(5) == _CONTENT[15:20]
+
+
+def test_document_from_url(server: http.server.ThreadingHTTPServer) -> None:
+    url = _url(server, "/presigned.pdf")
+    with pdf_document.Document(
+        pathlib.Path(url), pdf_file=http_range.open_url(url), close_file=True
+    ) as document:
+        assert document.title == b"Remote"
+        assert document[1][0] == "Remote document\n"
+
+
+def test_analyze_unavailable_url(server: http.server.ThreadingHTTPServer) -> None:
+    url = _url(server, "/unavailable.pdf")
+    result = api.analyze(url)
+
+    assert result.error == f"Unable to read {url}: HTTP error 503 Service Unavailable"
+    assert not result.matches
+
+
+@pytest.mark.parametrize("path", ["/truncated.pdf", "/garbled.pdf"])
+def test_invalid_response(server: http.server.ThreadingHTTPServer, path: str) -> None:
+    # The size is provided in response to HEAD, and only the ranges are broken.
+    remote = http_range.HTTPRangeFile(_url(server, path))
+    assert remote.size == len(_CONTENT)
+
+    with pytest.raises(http_range.HTTPRangeError, match="invalid HTTP response"):
+        remote.read(8)
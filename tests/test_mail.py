@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import email.message
+import mailbox
+import pathlib
+
+from pdfrename.lib import mail
+
+
+def _message(*attachments: tuple[str | None, bytes]) -> email.message.EmailMessage:
+    message = email.message.EmailMessage()
+    message["From"] = "billing@example.com"
+    message["Subject"] = "Your bill"
+    message.set_content("Please find your bill attached.")
+    for filename, data in attachments:
+        message.add_attachment(
+            data, maintype="application", subtype="pdf", filename=filename
+        )
+    message.add_attachment(b"not a PDF", maintype="image", subtype="png")
+    return message
+
+
+def _messages() -> list[email.message.EmailMessage]:
+    return [
+        _message(("bill.pdf", b"%PDF-bill"), (None, b"%PDF-unnamed")),
+        _message(),
+        _message(("statement.pdf", b"%PDF-statement")),
+    ]
+
+
+def _attachment_names(names: list[str]) -> list[str]:
+    return [name.split("/", 1)[1] for name in names]
+
+
+def test_maildir(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "Bills"
+    box = mailbox.Maildir(path)
+    keys = [box.add(message) for message in _messages()]
+    box.close()
+
+    assert mail.is_maildir(path)
+    assert mail.is_mailbox(path)
+    assert not mail.is_mbox(path)
+
+    attachments = dict(mail.iter_pdf_attachments(path))
+    assert attachments == {
+        f"{keys[0]}/bill.pdf": b"%PDF-bill",
+        f"{keys[0]}/attachment-1.pdf": b"%PDF-unnamed",
+        f"{keys[2]}/statement.pdf": b"%PDF-statement",
+    }
+
+
+def test_mbox(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "Bills"
+    box = mailbox.mbox(path)
+    for message in _messages():
+        box.add(message)
+    box.close()
+
+    assert mail.is_mbox(path)
+    assert not mail.is_maildir(path)
+
+    attachments = list(mail.iter_pdf_attachments(path))
+    assert _attachment_names([name for name, _ in attachments]) == [
+        "bill.pdf",
+        "attachment-1.pdf",
+        "statement.pdf",
+    ]
+    assert [data for _, data in attachments] == [
+        b"%PDF-bill",
+        b"%PDF-unnamed",
+        b"%PDF-statement",
+    ]
+
+
+def test_is_mbox(tmp_path: pathlib.Path) -> None:
+    pdf_path = tmp_path / "From bill.pdf"
+    pdf_path.write_bytes(b"From the PDF's point of view, this is not a mailbox.")
+    assert not mail.is_mbox(pdf_path)
+
+    empty_mbox_path = tmp_path / "empty.mbox"
+    empty_mbox_path.write_bytes(b"")
+    assert mail.is_mbox(empty_mbox_path)
+
+    assert not mail.is_mailbox(tmp_path)
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+from collections.abc import Sequence
+
+from pdfrename.lib import memo
+
+_calls: list[tuple[str, tuple[str, ...]]] = []
+
+
+@memo.document_memoized
+def _describe(value: str, languages: Sequence[str] = ()) -> str:
+    _calls.append((value, tuple(languages)))
+    return f"{value} in {', '.join(languages)}"
+
+
+def test_without_store() -> None:
+    _calls.clear()
+
+    assert _describe("date", ["en"]) == "date in en"
+    assert _describe("date", ["en"]) == "date in en"
+    assert len(_calls) == 2
+
+
+def test_memoized_within_store() -> None:
+    _calls.clear()
+    store = memo.MemoStore()
+
+    with memo.using(store):
+        assert _describe("date", ["en"]) == "date in en"
+        # Lists are compared by value.
+        assert _describe("date", ["en"]) == "date in en"
+        # Keyword arguments are keyed separately from positional ones.
+        assert _describe("date", languages=["en"]) == "date in en"
+        assert _describe("date", ["it"]) == "date in it"
+
+    assert _calls == [("date", ("en",)), ("date", ("en",)), ("date", ("it",))]
+    assert store.hits == 1
+    assert store.misses == 3
+
+    # Each document has its own store.
+    with memo.using(memo.MemoStore()):
+        _describe("date", ["en"])
+    assert len(_calls) == 4
+
+
+def test_unhashable_arguments() -> None:
+    calls = []
+
+    @memo.document_memoized
+    def count_fields(fields: dict[str, str]) -> int:
+        calls.append(fields)
+        return len(fields)
+
+    with memo.using(memo.MemoStore()) as store:
+        assert count_fields({"Date": "today"}) == 1
+        assert count_fields({"Date": "today"}) == 1
+
+    assert len(calls) == 2
+    assert len(store) == 0
+
+
+def test_least_recently_used_dropped() -> None:
+    store = memo.MemoStore(max_entries=2)
+
+    assert store.get_or_compute("first", lambda: 1) == 1
+    assert store.get_or_compute("second", lambda: 2) == 2
+    assert store.get_or_compute("first", lambda: -1) == 1
+    assert store.get_or_compute("third", lambda: 3) == 3
+
+    assert len(store) == 2
+    assert store.get_or_compute("first", lambda: -1) == 1
+    assert store.get_or_compute("second", lambda: -2) == -2
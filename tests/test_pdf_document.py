@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import concurrent.futures
+import re
+import traceback
+from pathlib import Path
+from typing import Any, NoReturn
+
+import pytest
+
+from pdfrename.bench import pdfwriter
+from pdfrename.lib import buffers, pdf_document, workers
+
+_PAGES = [pdfwriter.stacked_boxes(["First page"])]
+_INFO = {"Title": "Original", "Producer": "Writer"}
+
+
+def _trailer_reference(data: bytes, key: bytes) -> int:
+    matches = re.findall(rb"/%s (\d+) 0 R" % key, data)
+    return int(matches[-1])
+
+
+def _append_update(data: bytes, info: dict[str, bytes]) -> bytes:
+    """Append an incremental update, replacing the Info dictionary."""
+    info_id = _trailer_reference(data, b"Info")
+    root_id = _trailer_reference(data, b"Root")
+    size = int(re.findall(rb"/Size (\d+)", data)[-1])
+    previous_xref = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+
+    output = bytearray(data)
+    info_offset = len(output)
+    output += b"%d 0 obj\n<< " % info_id
+    output += b" ".join(
+        b"/%s %s" % (key.encode(), value) for key, value in info.items()
+    )
+    output += b" >>\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n%d 1\n%010d 00000 n \n" % (info_id, info_offset)
+    output += b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R /Prev %d >>\n" % (
+        size,
+        root_id,
+        info_id,
+        previous_xref,
+    )
+    output += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(output)
+
+
+def _xref_stream_pdf(info: bytes) -> bytes:
+    """Write a document with a cross-reference stream, and Info in an object stream."""
+    output = bytearray(b"%PDF-1.5\n")
+    offsets = {}
+    for object_id, content in (
+        (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>"),
+        (3, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>"),
+    ):
+        offsets[object_id] = len(output)
+        output += b"%d 0 obj\n%s\nendobj\n" % (object_id, content)
+
+    # Object 5 is an object stream holding the Info dictionary, object 4.
+    header = b"4 0 "
+    offsets[5] = len(output)
+    output += b"5 0 obj\n<< /Type /ObjStm /N 1 /First %d /Length %d >>\nstream\n" % (
+        len(header),
+        len(header) + len(info),
+    )
+    output += header + info + b"\nendstream\nendobj\n"
+
+    entries = [b"\x00" + (0).to_bytes(4, "big") + b"\xff\xff"]
+    for object_id in range(1, 7):
+        if object_id == 4:
+            entries.append(b"\x02" + (5).to_bytes(4, "big") + (0).to_bytes(2, "big"))
+        else:
+            offset = offsets.get(object_id, len(output))
+            entries.append(b"\x01" + offset.to_bytes(4, "big") + b"\x00\x00")
+    xref_data = b"".join(entries)
+
+    xref_offset = len(output)
+    output += (
+        b"6 0 obj\n<< /Type /XRef /Size 7 /W [1 4 2] /Root 1 0 R /Info 4 0 R"
+        b" /Length %d >>\nstream\n" % len(xref_data)
+    )
+    output += xref_data + b"\nendstream\nendobj\n"
+    output += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(output)
+
+
+def test_metadata() -> None:
+    data = pdfwriter.write_pdf(_PAGES, info=_INFO)
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert document.title == b"Original"
+        assert document.producer == b"Writer"
+        assert document.author is None
+        assert document[1][0] == "First page\n"
+
+
+def test_metadata_after_incremental_update() -> None:
+    data = _append_update(
+        pdfwriter.write_pdf(_PAGES, info=_INFO),
+        {"Title": b"(Updated)", "Producer": b"<577269746572>"},
+    )
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert document.title == b"Updated"
+        assert document.producer == b"Writer"
+
+
+def test_metadata_from_xref_stream() -> None:
+    data = _xref_stream_pdf(b"<< /Title (Streamed) /Creator <4372656174> >>")
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert document.title == b"Streamed"
+        assert document.creator == b"Creat"
+        assert document.page_count == 1
+
+
+def test_metadata_with_broken_xref() -> None:
+    data = pdfwriter.write_pdf(_PAGES, info=_INFO, compress=False)
+    # Point startxref past the end of the file, so pdfminer has to scan for objects.
+    broken = re.sub(rb"startxref\n\d+", b"startxref\n%d" % (len(data) * 2), data)
+
+    with pdf_document.Document.from_bytes(broken) as document:
+        assert document.title == b"Original"
+        assert document[1][0] == "First page\n"
+
+
+def test_metadata_with_missing_info() -> None:
+    data = pdfwriter.write_pdf(_PAGES)
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert document.title is None
+        assert document.creation_date is None
+
+
+def test_invalid_document() -> None:
+    with pytest.raises(ValueError, match="Invalid PDF file"):
+        pdf_document.Document.from_bytes(b"This is not a PDF file at all.")
+
+
+def test_failed_page_not_extracted_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = pdfwriter.write_pdf(_PAGES)
+    calls = []
+
+    def fail(page: int) -> None:
+        calls.append(page)
+        raise RuntimeError("broken page")
+
+    with pdf_document.Document.from_bytes(data) as document:
+        monkeypatch.setattr(document, "_extract_page", fail)
+
+        with pytest.raises(RuntimeError) as first_failure:
+            document.get_textboxes(1)
+        traceback_length = len(traceback.extract_tb(first_failure.value.__traceback__))
+
+        for _ in range(3):
+            with pytest.raises(pdf_document.PageExtractionError) as failure:
+                document.get_textboxes(1)
+            assert failure.value.__cause__ is first_failure.value
+
+        assert calls == [1]
+        assert (
+            len(traceback.extract_tb(first_failure.value.__traceback__))
+            == traceback_length
+        )
+
+
+def test_missing_page() -> None:
+    data = pdfwriter.write_pdf(_PAGES)
+
+    with pdf_document.Document.from_bytes(data) as document:
+        with pytest.raises(IndexError) as first_failure:
+            document.get_textboxes(2)
+        with pytest.raises(IndexError) as failure:
+            document.get_textboxes(2)
+        assert failure.value.__cause__ is first_failure.value
+
+
+class _UnavailableExecutor(concurrent.futures.Executor):
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> NoReturn:
+        raise concurrent.futures.BrokenExecutor("no workers")
+
+
+def test_pages_in_parallel() -> None:
+    data = pdfwriter.write_pdf(
+        [pdfwriter.stacked_boxes([f"Page {page}"]) for page in range(1, 4)]
+    )
+
+    with workers.ProcessPool() as pool:
+        document = pdf_document.Document(
+            Path("<bytes>"),
+            pdf_file=buffers.open_buffer(data),
+            close_file=True,
+            page_executor=pool,
+        )
+        with document:
+            pages = document.get_pages((1, 3, 4))
+
+    assert {page: list(boxes) for page, boxes in pages.items()} == {
+        1: ["Page 1\n"],
+        3: ["Page 3\n"],
+    }
+
+
+def test_pages_in_process_without_workers() -> None:
+    data = pdfwriter.write_pdf(
+        [pdfwriter.stacked_boxes([f"Page {page}"]) for page in range(1, 3)]
+    )
+
+    document = pdf_document.Document(
+        Path("<bytes>"),
+        pdf_file=buffers.open_buffer(data),
+        close_file=True,
+        page_executor=_UnavailableExecutor(),
+    )
+    with document:
+        pages = document.get_pages((1, 2))
+
+    assert {page: list(boxes) for page, boxes in pages.items()} == {
+        1: ["Page 1\n"],
+        2: ["Page 2\n"],
+    }
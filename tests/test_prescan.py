@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from pdfrename.bench import pdfwriter
+from pdfrename.lib import pdf_document, prescan
+
+
+def _scanned_pdf() -> bytes:
+    """Write a single page document, without any font resource."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842]"
+        b" /Resources << >> /Contents 4 0 R >>",
+        b"<< /Length 17 >>\nstream\n0 0 595 842 re f\nendstream",
+    ]
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, content in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (object_id, content)
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    output += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(output)
+
+
+def test_normalize() -> None:
+    assert prescan.normalize(" Tax  Invoice\n\tNumber ") == "TaxInvoiceNumber"
+
+
+def test_page_text() -> None:
+    data = pdfwriter.write_pdf(
+        [
+            pdfwriter.stacked_boxes(["TAX INVOICE", "Invoice Date\n1 Jan 2024"]),
+            pdfwriter.stacked_boxes(["Second page"]),
+        ]
+    )
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert prescan.has_fonts(document.doc, 1)
+        assert prescan.page_text(document.doc, 1) == "TAXINVOICEInvoiceDate1Jan2024"
+        assert prescan.page_text(document.doc, 2) == "Secondpage"
+
+        with pytest.raises(IndexError):
+            prescan.page_text(document.doc, 3)
+        with pytest.raises(IndexError):
+            prescan.has_fonts(document.doc, 3)
+
+        # The prescanned text contains the text of each line of the laid out boxes.
+        for box in document[1]:
+            for line in box.splitlines():
+                assert prescan.normalize(line) in prescan.page_text(document.doc, 1)
+
+
+def test_without_fonts() -> None:
+    with pdf_document.Document.from_bytes(_scanned_pdf()) as document:
+        assert not prescan.has_fonts(document.doc, 1)
+        assert prescan.page_text(document.doc, 1) == ""
+        assert not document.page_has_text(1)
+
+
+def test_has_any_marker() -> None:
+    data = pdfwriter.write_pdf(
+        [
+            pdfwriter.stacked_boxes(["Welcome"]),
+            pdfwriter.stacked_boxes(["Your Bill"]),
+        ]
+    )
+
+    with pdf_document.Document.from_bytes(data) as document:
+        assert document.has_any_marker(["YourBill"], (1, 2))
+        assert not document.has_any_marker(["YourBill"], (1,))
+        # Pages the document does not have are ignored.
+        assert not document.has_any_marker(["YourBill"], (1, 3))
+        # Nothing was laid out.
+        assert not document.extracted_pages
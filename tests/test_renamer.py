@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import datetime
+
+import pytest
+from more_itertools import only
+
+from pdfrename.bench import pdfwriter
+from pdfrename.lib import pdf_document, renamer
+
+# A page with no text, but still declaring its font resources, as scans often do.
+_BLANK_PAGE: pdfwriter.Page = []
+
+
+@pytest.fixture(autouse=True)
+def renamers(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the registered renamers, recording the names of those called."""
+    monkeypatch.setattr(renamer, "_ALL_RENAMERS", [])
+    called: list[str] = []
+
+    @renamer.pdfrenamer
+    def first_page(document: pdf_document.Document) -> renamer.NameComponents | None:
+        called.append("first_page")
+        return None
+
+    @renamer.pdfrenamer(min_pages=2)
+    def second_page(document: pdf_document.Document) -> renamer.NameComponents | None:
+        called.append("second_page")
+        if not document[2].find_box_starting_with("Statement"):
+            return None
+        return renamer.NameComponents(
+            datetime.datetime(2024, 1, 1), "Bank", "Holder", "Statement"
+        )
+
+    return called
+
+
+def _document(*pages: pdfwriter.Page) -> pdf_document.Document:
+    return pdf_document.Document.from_bytes(pdfwriter.write_pdf(pages))
+
+
+def test_text_on_first_page(renamers: list[str]) -> None:
+    with _document(pdfwriter.stacked_boxes(["Welcome"])) as document:
+        assert renamer.has_text_layer(document)
+        assert not list(renamer.match_all_renamers(document))
+
+    assert renamers == ["first_page"]
+
+
+def test_scanned_cover(renamers: list[str]) -> None:
+    with _document(_BLANK_PAGE, pdfwriter.stacked_boxes(["Statement"])) as document:
+        assert renamer.has_text_layer(document)
+        matches = list(renamer.match_all_renamers(document))
+
+    # Only the renamer looking at the second page is called.
+    assert renamers == ["second_page"]
+    assert [match.renamer for match in matches] == [
+        "test_renamer.renamers.<locals>.second_page"
+    ]
+
+
+def test_no_text_layer(renamers: list[str]) -> None:
+    with _document(
+        _BLANK_PAGE, _BLANK_PAGE, pdfwriter.stacked_boxes(["Page three"])
+    ) as document:
+        # No renamer looks at the third page.
+        assert not renamer.has_text_layer(document)
+        assert not list(renamer.match_all_renamers(document))
+
+    assert renamers == []
+
+
+def _statement_renamer(service_name: str) -> None:
+    def detect(document: pdf_document.Document) -> bool:
+        return bool(document[1].find_box_starting_with("Statement"))
+
+    @renamer.pdfrenamer(detect=detect)
+    def extract(document: pdf_document.Document) -> renamer.NameComponents | None:
+        return renamer.NameComponents(
+            datetime.datetime(2024, 1, 1), service_name, "Holder", "Statement"
+        )
+
+
+def test_try_all_renamers_detected() -> None:
+    _statement_renamer("Bank")
+
+    with _document(pdfwriter.stacked_boxes(["Statement"])) as document:
+        name = only(renamer.try_all_renamers(document))
+
+    assert name is not None
+    assert name.service_name == "Bank"
+
+
+def test_try_all_renamers_ambiguous() -> None:
+    _statement_renamer("Bank")
+    _statement_renamer("Other Bank")
+
+    with _document(pdfwriter.stacked_boxes(["Statement"])) as document:
+        names = list(renamer.try_all_renamers(document))
+        # The detected renamers are reported without a name.
+        assert [match.name for match in renamer.match_all_renamers(document)] == [
+            None,
+            None,
+        ]
+
+    assert [name.service_name for name in names] == ["Bank", "Other Bank"]
+    with pytest.raises(ValueError):
+        only(names)
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import concurrent.futures
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from pdfrename.lib import workers
+
+
+def _exit() -> None:
+    os._exit(1)
+
+
+@pytest.fixture
+def pool() -> Iterator[workers.ProcessPool]:
+    pool = workers.ProcessPool()
+    yield pool
+    pool.shutdown()
+
+
+def test_submit(pool: workers.ProcessPool) -> None:
+    assert pool.submit(pow, 2, 3).result() == 8
+    assert list(pool.map(abs, [-1, -2])) == [1, 2]
+
+
+def test_replaced_once_broken(pool: workers.ProcessPool) -> None:
+    with pytest.raises(concurrent.futures.BrokenExecutor):
+        pool.submit(_exit).result()
+
+    # The pool that broke is replaced by a new one, rather than failing every task.
+    assert pool.submit(pow, 2, 3).result() == 8
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Diego Elio Pettenò
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import pathlib
+import sys
+
+import pytest
+
+from pdfrename.lib import xattrs
+
+_STAMP = xattrs.Stamp(
+    fingerprint="fingerprint",
+    renamer="xero",
+    components={"date": "2024-01-01", "vendor": "Pettenò"},
+)
+
+
+@pytest.fixture
+def stamped_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    if sys.platform != "linux":
+        pytest.skip("Extended attributes are only supported on Linux.")
+
+    path = tmp_path / "bill.pdf"
+    path.write_bytes(b"%PDF-bill")
+    try:
+        os.setxattr(path, "user.pdfrename.test", b"")
+    except OSError:
+        pytest.skip("Extended attributes are not supported by the filesystem.")
+    return path
+
+
+def test_round_trip(stamped_path: pathlib.Path) -> None:
+    assert xattrs.read_stamp(stamped_path) is None
+
+    xattrs.write_stamp(stamped_path, _STAMP)
+    assert xattrs.read_stamp(stamped_path) == _STAMP
+
+    no_match = xattrs.Stamp(fingerprint="other", renamer=None, components=None)
+    xattrs.write_stamp(stamped_path, no_match)
+    assert xattrs.read_stamp(stamped_path) == no_match
+
+
+def test_stamp_follows_rename(stamped_path: pathlib.Path) -> None:
+    xattrs.write_stamp(stamped_path, _STAMP)
+
+    renamed_path = stamped_path.rename(stamped_path.with_name("renamed.pdf"))
+    assert xattrs.read_stamp(renamed_path) == _STAMP
+
+
+def test_content_change_invalidates(stamped_path: pathlib.Path) -> None:
+    xattrs.write_stamp(stamped_path, _STAMP)
+
+    stamped_path.write_bytes(b"%PDF-another-bill")
+    assert xattrs.read_stamp(stamped_path) is None